@@ -1,5 +1,21 @@
 from django.contrib import admin
 
-from vng_api_common.authorizations.models import AuthorizationsConfig
+from vng_api_common.authorizations.admin import ApplicatieAdmin as _ApplicatieAdmin
+from vng_api_common.authorizations.models import Applicatie, AuthorizationsConfig
+
+from .models import CatalogusAutorisatie
 
 admin.site.unregister(AuthorizationsConfig)
+
+
+class CatalogusAutorisatieInline(admin.TabularInline):
+    model = CatalogusAutorisatie
+    extra = 0
+
+
+admin.site.unregister(Applicatie)
+
+
+@admin.register(Applicatie)
+class ApplicatieAdmin(_ApplicatieAdmin):
+    inlines = _ApplicatieAdmin.inlines + (CatalogusAutorisatieInline,)
@@ -4,11 +4,11 @@ from drf_yasg.utils import swagger_auto_schema
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.generics import get_object_or_404
-from rest_framework.pagination import PageNumberPagination
 from vng_api_common.authorizations.models import Applicatie
 from vng_api_common.authorizations.serializers import ApplicatieSerializer
 from vng_api_common.notifications.viewsets import NotificationViewSetMixin
 
+from openzaak.utils.pagination import OptionalCursorPagination
 from openzaak.utils.permissions import AuthRequired
 
 from ._schema_overrides import ApplicatieConsumerAutoSchema
@@ -94,7 +94,7 @@ class ApplicatieViewSet(NotificationViewSetMixin, viewsets.ModelViewSet):
     queryset = Applicatie.objects.prefetch_related("autorisaties").order_by("-pk")
     serializer_class = ApplicatieSerializer
     _filterset_class = ApplicatieFilter
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
     lookup_field = "uuid"
     permission_classes = (AuthRequired,)
     required_scopes = {
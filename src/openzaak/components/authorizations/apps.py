@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AuthConfig(AppConfig):
     name = "openzaak.components.authorizations"
     label = "openzaak_authorizations"
+
+    def ready(self):
+        # load the signal receivers
+        from . import signals  # noqa
@@ -0,0 +1,277 @@
+"""
+Cache the authorizations of clients across requests and workers.
+
+Looking up the authorizations of a ``client_id`` goes through three tiers:
+
+1. a short-lived in-process LRU, so the hot path needs no network round-trip
+2. the shared ``default`` cache (Redis), holding the serialized authorizations
+3. the database
+
+Along with the authorizations, an :class:`AuthorizationIndex` for object-level
+permission checks is cached, so that it is built only once per client.
+
+Entries are invalidated whenever an ``Applicatie``, ``Autorisatie`` or
+``CatalogusAutorisatie`` changes,
+see :mod:`openzaak.components.authorizations.signals`. The other workers drop
+their in-process copy when they receive the invalidation through
+:mod:`openzaak.utils.invalidation`, and otherwise when it expires, which is
+bounded by ``settings.AUTHORIZATIONS_LOCAL_CACHE_TIMEOUT``.
+
+Additionally, verified JWT payloads are cached in-process, keyed on the digest
+of the token, so that tokens re-used for many calls are only decoded and
+verified against their secret once.
+"""
+import hashlib
+import logging
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+
+from openzaak.utils import invalidation
+from openzaak.utils.cache import LRUCache
+
+from .api.kanalen import KANAAL_AUTORISATIES
+from .index import AuthorizationIndex
+from .models import CatalogusAutorisatie
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "authorizations:client"
+STATS_KEY_PREFIX = "authorizations:stats"
+STATS = ("local_hits", "shared_hits", "misses")
+
+APPLICATIE_FIELDS = ("id", "uuid", "client_ids", "label", "heeft_alle_autorisaties")
+AUTORISATIE_FIELDS = (
+    "id",
+    "applicatie_id",
+    "component",
+    "scopes",
+    "zaaktype",
+    "informatieobjecttype",
+    "besluittype",
+    "max_vertrouwelijkheidaanduiding",
+)
+CATALOGUS_AUTORISATIE_FIELDS = (
+    "id",
+    "applicatie_id",
+    "component",
+    "catalogus_id",
+    "scopes",
+    "max_vertrouwelijkheidaanduiding",
+)
+
+JWT_SECRETS_TOPIC = "jwt-secrets"
+
+local_cache = invalidation.track(
+    LRUCache(
+        maxsize=settings.AUTHORIZATIONS_LOCAL_CACHE_SIZE,
+        timeout=settings.AUTHORIZATIONS_LOCAL_CACHE_TIMEOUT,
+    )
+)
+
+token_cache = invalidation.track(
+    LRUCache(maxsize=settings.JWT_CACHE_SIZE, timeout=settings.JWT_CACHE_TIMEOUT)
+)
+
+# counters not yet flushed to the shared cache
+_pending_stats = Counter()
+
+
+class ClientAuthorizations(NamedTuple):
+    applicaties: List[Applicatie]
+    autorisaties: List[Autorisatie]
+    catalogus_autorisaties: List[CatalogusAutorisatie]
+    index: AuthorizationIndex
+
+    @property
+    def heeft_alle_autorisaties(self) -> bool:
+        return any(app.heeft_alle_autorisaties for app in self.applicaties)
+
+
+def get_cache_key(client_id: str) -> str:
+    return f"{CACHE_KEY_PREFIX}:{client_id}"
+
+
+def _load(client_id: str) -> dict:
+    applicaties = list(
+        Applicatie.objects.filter(client_ids__contains=[client_id]).values(
+            *APPLICATIE_FIELDS
+        )
+    )
+
+    # no need to look at the details if everything is allowed anyway
+    app_ids = [app["id"] for app in applicaties]
+    if not app_ids or any(app["heeft_alle_autorisaties"] for app in applicaties):
+        autorisaties, catalogus_autorisaties = [], []
+    else:
+        autorisaties = list(
+            Autorisatie.objects.filter(applicatie_id__in=app_ids).values(
+                *AUTORISATIE_FIELDS
+            )
+        )
+        catalogus_autorisaties = list(
+            CatalogusAutorisatie.objects.filter(applicatie_id__in=app_ids).values(
+                *CATALOGUS_AUTORISATIE_FIELDS
+            )
+        )
+
+    index = AuthorizationIndex.build(
+        [Autorisatie(**fields) for fields in autorisaties],
+        [CatalogusAutorisatie(**fields) for fields in catalogus_autorisaties],
+    )
+
+    return {
+        "applicaties": applicaties,
+        "autorisaties": autorisaties,
+        "catalogus_autorisaties": catalogus_autorisaties,
+        "index": index.to_data(),
+    }
+
+
+def _deserialize(data: dict) -> ClientAuthorizations:
+    autorisaties = [Autorisatie(**fields) for fields in data["autorisaties"]]
+    # entries cached before catalogus authorizations existed don't have them
+    catalogus_autorisaties = [
+        CatalogusAutorisatie(**fields)
+        for fields in data.get("catalogus_autorisaties", [])
+    ]
+
+    if "index" in data:
+        index = AuthorizationIndex.from_data(data["index"])
+    else:
+        index = AuthorizationIndex.build(autorisaties, catalogus_autorisaties)
+
+    return ClientAuthorizations(
+        applicaties=[Applicatie(**fields) for fields in data["applicaties"]],
+        autorisaties=autorisaties,
+        catalogus_autorisaties=catalogus_autorisaties,
+        index=index,
+    )
+
+
+def _flush_stats(cache) -> None:
+    for name in STATS:
+        count = _pending_stats.pop(name, 0)
+        if not count:
+            continue
+
+        key = f"{STATS_KEY_PREFIX}:{name}"
+        try:
+            cache.incr(key, count)
+        except ValueError:
+            cache.set(key, count, timeout=None)
+
+
+def get_authorizations(client_id: str) -> ClientAuthorizations:
+    """
+    Retrieve the applicaties and autorisaties configured for ``client_id``.
+    """
+    key = get_cache_key(client_id)
+
+    authorizations = local_cache.get(key)
+    if authorizations is not None:
+        _pending_stats["local_hits"] += 1
+        return authorizations
+
+    cache = caches["default"]
+    data = cache.get(key)
+    if data is None:
+        _pending_stats["misses"] += 1
+        data = _load(client_id)
+        cache.set(key, data, timeout=settings.AUTHORIZATIONS_CACHE_TIMEOUT)
+    else:
+        _pending_stats["shared_hits"] += 1
+
+    # we're talking to the shared cache anyway, piggy-back the statistics
+    _flush_stats(cache)
+
+    authorizations = _deserialize(data)
+    local_cache.set(key, authorizations)
+    return authorizations
+
+
+@invalidation.register(KANAAL_AUTORISATIES.label)
+def _forget(client_ids: List[str]) -> None:
+    for client_id in client_ids:
+        local_cache.delete(get_cache_key(client_id))
+
+
+def invalidate(client_ids: Iterable[str]) -> None:
+    client_ids = sorted(set(client_ids))
+    if not client_ids:
+        return
+
+    logger.debug("Invalidating cached authorizations for %r", client_ids)
+
+    def _delete():
+        caches["default"].delete_many(
+            [get_cache_key(client_id) for client_id in client_ids]
+        )
+        _forget(client_ids)
+
+    _delete()
+    # concurrent requests may have cached the old state again before the
+    # changes were committed - clear it once more after the commit
+    transaction.on_commit(_delete)
+    invalidation.publish(KANAAL_AUTORISATIES.label, client_ids)
+
+
+def get_stats() -> Dict[str, int]:
+    """
+    Report the hit/miss counters, aggregated over all workers.
+    """
+    cache = caches["default"]
+    _flush_stats(cache)
+    return {name: cache.get(f"{STATS_KEY_PREFIX}:{name}", 0) for name in STATS}
+
+
+def reset_stats() -> None:
+    _pending_stats.clear()
+    caches["default"].delete_many([f"{STATS_KEY_PREFIX}:{name}" for name in STATS])
+
+
+def get_token_digest(encoded: str) -> str:
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def get_cached_payload(encoded: str) -> Optional[dict]:
+    return token_cache.get(get_token_digest(encoded))
+
+
+def cache_payload(encoded: str, payload: dict) -> None:
+    """
+    Remember a verified payload, at most until the token expires.
+    """
+    now = time.time()
+    timeout = settings.JWT_CACHE_TIMEOUT
+
+    # tokens that are not valid yet must be verified again later
+    for claim in ("iat", "nbf"):
+        if claim in payload and int(payload[claim]) > now:
+            return
+
+    if "exp" in payload:
+        timeout = min(timeout, int(payload["exp"]) - now)
+
+    token_cache.set(get_token_digest(encoded), payload, timeout=timeout)
+
+
+@invalidation.register(JWT_SECRETS_TOPIC)
+def _forget_tokens(client_ids: List[str]) -> None:
+    token_cache.delete_where(lambda payload: payload["client_id"] in client_ids)
+
+
+def invalidate_tokens(client_ids: Iterable[str]) -> None:
+    client_ids = sorted(set(client_ids))
+    if not client_ids:
+        return
+
+    logger.debug("Invalidating cached JWT payloads for %r", client_ids)
+    _forget_tokens(client_ids)
+    invalidation.publish(JWT_SECRETS_TOPIC, client_ids)
@@ -0,0 +1,221 @@
+"""
+Precomputed index of the authorizations of a client, for object-level checks.
+
+Checking the permissions on a single object only needs to know which scopes
+are granted for a given (component, type) at a given vertrouwelijkheidaanduiding.
+The index maps every (component, type) to the granted scopes, represented as a
+bitmask, per maximum vertrouwelijkheidaanduiding order. A check is then a
+dictionary lookup followed by bitwise operations.
+
+The index is built once per client and kept in the shared cache together with
+the authorizations themselves, see :mod:`openzaak.components.authorizations.cache`.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.scopes import OPERATOR_AND, OPERATOR_OR, Scope
+
+from .matrix import TYPE_FIELDS, get_va_order
+from .models import CatalogusAutorisatie
+
+VA_FIELD = "vertrouwelijkheidaanduiding"
+
+
+class Entry(NamedTuple):
+    # scopes granted regardless of the vertrouwelijkheidaanduiding
+    mask: int
+    # (max VA order, scopes granted up to and including that order), ordered
+    # from the highest to the lowest order
+    levels: Tuple[Tuple[int, int], ...]
+
+    @classmethod
+    def build(cls, grants: Iterable[Tuple[int, Optional[int]]]) -> "Entry":
+        mask = 0
+        by_order = defaultdict(int)
+        for scopes, max_va_order in grants:
+            mask |= scopes
+            if max_va_order is not None:
+                by_order[max_va_order] |= scopes
+
+        # a grant up to a certain order also covers all lower orders
+        levels, cumulative = [], 0
+        for order in sorted(by_order, reverse=True):
+            cumulative |= by_order[order]
+            levels.append((order, cumulative))
+        return cls(mask=mask, levels=tuple(levels))
+
+    def get_mask(self, va_order: Optional[int]) -> int:
+        if va_order is None:
+            return self.mask
+
+        mask = 0
+        for max_order, scopes in self.levels:
+            if max_order < va_order:
+                break
+            mask = scopes
+        return mask
+
+
+class AuthorizationIndex:
+    """
+    Map (component, type) and (component, catalogus) to the granted scopes.
+    """
+
+    def __init__(
+        self,
+        scopes: Tuple[str, ...],
+        types: Dict[Tuple[str, str, str], Entry],
+        catalogi: Dict[Tuple[str, int], Entry],
+        components: Dict[str, Entry],
+    ):
+        self.scopes = scopes
+        self.bits = {label: 1 << position for position, label in enumerate(scopes)}
+        self.types = types
+        self.catalogi = catalogi
+        self.components = components
+        self._compiled: Dict[Scope, List[int]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        autorisaties: Iterable[Autorisatie],
+        catalogus_autorisaties: Iterable[CatalogusAutorisatie] = (),
+    ) -> "AuthorizationIndex":
+        autorisaties = list(autorisaties)
+        catalogus_autorisaties = list(catalogus_autorisaties)
+
+        labels = sorted(
+            {
+                scope
+                for autorisatie in autorisaties + catalogus_autorisaties
+                for scope in autorisatie.scopes
+            }
+        )
+        bits = {label: 1 << position for position, label in enumerate(labels)}
+
+        def get_grant(autorisatie: Union[Autorisatie, CatalogusAutorisatie]):
+            mask = 0
+            for scope in autorisatie.scopes:
+                mask |= bits[scope]
+            return mask, get_va_order(autorisatie.max_vertrouwelijkheidaanduiding)
+
+        types, catalogi, components = (defaultdict(list) for _ in range(3))
+        for autorisatie in autorisaties:
+            grant = get_grant(autorisatie)
+            components[autorisatie.component].append(grant)
+            for field in TYPE_FIELDS:
+                value = getattr(autorisatie, field)
+                if value:
+                    types[(autorisatie.component, field, value)].append(grant)
+
+        for autorisatie in catalogus_autorisaties:
+            grant = get_grant(autorisatie)
+            components[autorisatie.component].append(grant)
+            catalogi[(autorisatie.component, autorisatie.catalogus_id)].append(grant)
+
+        return cls(
+            scopes=tuple(labels),
+            types={key: Entry.build(grants) for key, grants in types.items()},
+            catalogi={key: Entry.build(grants) for key, grants in catalogi.items()},
+            components={key: Entry.build(grants) for key, grants in components.items()},
+        )
+
+    def to_data(self) -> dict:
+        """
+        Serialize the index to plain data, suitable for the shared cache.
+        """
+        return {
+            "scopes": list(self.scopes),
+            "types": [(*key, *entry) for key, entry in self.types.items()],
+            "catalogi": [(*key, *entry) for key, entry in self.catalogi.items()],
+            "components": [(key, *entry) for key, entry in self.components.items()],
+        }
+
+    @classmethod
+    def from_data(cls, data: dict) -> "AuthorizationIndex":
+        def get_entry(mask, levels) -> Entry:
+            return Entry(mask=mask, levels=tuple(tuple(level) for level in levels))
+
+        return cls(
+            scopes=tuple(data["scopes"]),
+            types={
+                (component, field, value): get_entry(mask, levels)
+                for component, field, value, mask, levels in data["types"]
+            },
+            catalogi={
+                (component, catalogus): get_entry(mask, levels)
+                for component, catalogus, mask, levels in data["catalogi"]
+            },
+            components={
+                component: get_entry(mask, levels)
+                for component, mask, levels in data["components"]
+            },
+        )
+
+    def has_catalogus_autorisaties(self, component: str) -> bool:
+        return any(key[0] == component for key in self.catalogi)
+
+    def get_mask(
+        self, component: str, catalogus: int = None, **fields
+    ) -> Optional[int]:
+        """
+        Determine the scopes granted on an object with the given ``fields``.
+
+        Returns ``None`` if the fields cannot be answered from the index, in
+        which case the caller should fall back to the
+        :class:`openzaak.components.authorizations.matrix.AuthorizationMatrix`.
+        """
+        fields = {name: value for name, value in fields.items() if value is not None}
+        va = fields.pop(VA_FIELD, None)
+        if len(fields) > 1 or not set(fields).issubset(TYPE_FIELDS):
+            return None
+
+        va_order = None
+        if va is not None:
+            va_order = get_va_order(va)
+            # an unknown vertrouwelijkheidaanduiding is never allowed
+            if va_order is None:
+                return 0
+
+        if fields:
+            ((field, value),) = fields.items()
+            entries = [
+                self.types.get((component, field, value)),
+                self.catalogi.get((component, catalogus)),
+            ]
+        else:
+            entries = [self.components.get(component)]
+
+        mask = 0
+        for entry in entries:
+            if entry is not None:
+                mask |= entry.get_mask(va_order)
+        return mask
+
+    def _compile(self, scope: Scope) -> List[int]:
+        """
+        Express ``scope`` as alternative bitmasks, any of which must be covered.
+        """
+        if not scope.children:
+            bit = self.bits.get(scope.label)
+            # never granted to this client
+            return [bit] if bit is not None else []
+
+        children = [self._compile(child) for child in scope.children]
+        if scope.operator == OPERATOR_OR:
+            return [mask for alternatives in children for mask in alternatives]
+        elif scope.operator == OPERATOR_AND:
+            combined = [0]
+            for alternatives in children:
+                combined = [mask | other for mask in combined for other in alternatives]
+            return combined
+        raise ValueError(f"Unknown operator '{scope.operator}'")
+
+    def is_contained_in(self, scope: Scope, mask: int) -> bool:
+        """
+        Test if the scopes in ``mask`` encapsulate ``scope``.
+        """
+        if scope not in self._compiled:
+            self._compiled[scope] = self._compile(scope)
+        return any(required & mask == required for required in self._compiled[scope])
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from ...cache import get_stats, reset_stats
+
+
+class Command(BaseCommand):
+    help = "Report the hit/miss counters of the authorizations cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the counters after reporting them",
+        )
+
+    def handle(self, **options):
+        stats = get_stats()
+        total = sum(stats.values())
+
+        for name, count in stats.items():
+            self.stdout.write(f"{name}: {count}")
+
+        if total:
+            hits = stats["local_hits"] + stats["shared_hits"]
+            self.stdout.write(f"hit ratio: {hits / total:.1%}")
+
+        if options["reset"]:
+            reset_stats()
+            self.stdout.write("Counters have been reset")
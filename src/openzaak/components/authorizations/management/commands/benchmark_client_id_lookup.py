@@ -0,0 +1,93 @@
+import re
+import uuid
+from statistics import median
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from vng_api_common.authorizations.models import Applicatie
+
+from ...api.filters import ApplicatieRetrieveFilter
+
+EXECUTION_TIME = re.compile(r"execution time: ([\d.]+) ms", re.IGNORECASE)
+
+SEQUENTIAL_SCAN = (
+    "SET LOCAL enable_indexscan = off",
+    "SET LOCAL enable_bitmapscan = off",
+)
+INDEX_SCAN = ("RESET enable_indexscan", "RESET enable_bitmapscan")
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare looking up an applicatie by client ID with a sequential scan "
+        "and through the GIN index on the client IDs. The applicaties are "
+        "created in a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count", type=int, default=50000, help="Number of applicaties to create"
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of lookups per measurement, the median is reported",
+        )
+
+    def measure(self, queryset, repeat: int) -> float:
+        execution = []
+        for _ in range(repeat):
+            plan = queryset.explain(analyze=True)
+            execution.append(float(EXECUTION_TIME.search(plan).group(1)))
+        return median(execution)
+
+    def get_querysets(self, client_id: str) -> dict:
+        return {
+            # see openzaak.components.authorizations.cache
+            "middleware": Applicatie.objects.filter(client_ids__contains=[client_id]),
+            "consumer": ApplicatieRetrieveFilter(
+                {"client_id": client_id}, queryset=Applicatie.objects.all()
+            ).qs,
+        }
+
+    def handle(self, **options):
+        count = options["count"]
+
+        with transaction.atomic():
+            Applicatie.objects.bulk_create(
+                (
+                    Applicatie(
+                        uuid=uuid.uuid4(),
+                        client_ids=[f"benchmark-{i}", f"benchmark-{i}-alt"],
+                        label=f"Benchmark {i}",
+                    )
+                    for i in range(count)
+                ),
+                batch_size=5000,
+            )
+
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE authorizations_applicatie")
+
+            self.stdout.write(
+                f"{'lookup':<12}{'applicaties':>12}  {'strategy':<16}"
+                f"{'execution (ms)':>16}"
+            )
+            querysets = self.get_querysets(f"benchmark-{count // 2}-alt")
+            for lookup, queryset in querysets.items():
+                for strategy, statements in (
+                    ("sequential scan", SEQUENTIAL_SCAN),
+                    ("gin index", INDEX_SCAN),
+                ):
+                    with connection.cursor() as cursor:
+                        for statement in statements:
+                            cursor.execute(statement)
+
+                    execution = self.measure(queryset, options["repeat"])
+                    self.stdout.write(
+                        f"{lookup:<12}{count:>12}  {strategy:<16}{execution:>16.2f}"
+                    )
+
+            transaction.set_rollback(True)
@@ -0,0 +1,155 @@
+"""
+In-memory representation of the authorizations of a client.
+
+The authorizations are loaded once per request and compiled into a lookup
+structure, so that the (repeated) permission checks during a single request
+do not have to go to the database again.
+"""
+from collections import defaultdict
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from .models import CatalogusAutorisatie
+
+# fields of Autorisatie referring to the type the authorization applies to
+TYPE_FIELDS = ("zaaktype", "informatieobjecttype", "besluittype")
+
+
+def get_va_order(value: str) -> Optional[int]:
+    """
+    Map a vertrouwelijkheidaanduiding to its logical order.
+
+    Empty or unknown values have no order, consistent with the ``Case``
+    expression used in the database filters.
+    """
+    if value not in VertrouwelijkheidsAanduiding.values:
+        return None
+    return VertrouwelijkheidsAanduiding.get_choice(value).order
+
+
+class Grant(NamedTuple):
+    autorisatie: Union[Autorisatie, CatalogusAutorisatie]
+    scopes: FrozenSet[str]
+    max_va_order: Optional[int]
+
+    def matches(self, fields: dict) -> bool:
+        for name, value in fields.items():
+            if value is None:
+                continue
+
+            if name == "vertrouwelijkheidaanduiding":
+                order = get_va_order(value)
+                if order is None or self.max_va_order is None:
+                    return False
+                if self.max_va_order < order:
+                    return False
+
+            elif getattr(self.autorisatie, name) != value:
+                return False
+
+        return True
+
+
+class AuthorizationMatrix:
+    """
+    Map (component, type) to the scopes and maximum vertrouwelijkheidaanduiding
+    granted to the client.
+
+    Authorizations for an entire catalogus are indexed by (component,
+    catalogus) instead, and apply to any type within that catalogus.
+    """
+
+    def __init__(
+        self,
+        heeft_alle_autorisaties: bool,
+        autorisaties: Iterable[Autorisatie],
+        catalogus_autorisaties: Iterable[CatalogusAutorisatie] = (),
+    ):
+        self.heeft_alle_autorisaties = heeft_alle_autorisaties
+
+        self._by_component: Dict[str, List[Grant]] = defaultdict(list)
+        self._by_type: Dict[Tuple[str, str, str], List[Grant]] = defaultdict(list)
+        self._catalogus_by_component: Dict[str, List[Grant]] = defaultdict(list)
+        self._by_catalogus: Dict[Tuple[str, int], List[Grant]] = defaultdict(list)
+
+        for autorisatie in autorisaties:
+            grant = self._get_grant(autorisatie)
+            self._by_component[autorisatie.component].append(grant)
+
+            for field in TYPE_FIELDS:
+                value = getattr(autorisatie, field)
+                if value:
+                    self._by_type[(autorisatie.component, field, value)].append(grant)
+
+        for autorisatie in catalogus_autorisaties:
+            grant = self._get_grant(autorisatie)
+            self._catalogus_by_component[autorisatie.component].append(grant)
+            self._by_catalogus[
+                (autorisatie.component, autorisatie.catalogus_id)
+            ].append(grant)
+
+    @staticmethod
+    def _get_grant(autorisatie: Union[Autorisatie, CatalogusAutorisatie]) -> Grant:
+        return Grant(
+            autorisatie=autorisatie,
+            scopes=frozenset(autorisatie.scopes),
+            max_va_order=get_va_order(autorisatie.max_vertrouwelijkheidaanduiding),
+        )
+
+    def get_autorisaties(self, component: str) -> List[Autorisatie]:
+        return [grant.autorisatie for grant in self._by_component.get(component, [])]
+
+    def get_catalogus_autorisaties(self, component: str) -> List[CatalogusAutorisatie]:
+        return [
+            grant.autorisatie
+            for grant in self._catalogus_by_component.get(component, [])
+        ]
+
+    def has_catalogus_autorisaties(self, component: str) -> bool:
+        return bool(self._catalogus_by_component.get(component))
+
+    def get_grants(
+        self, component: str, catalogus: int = None, **fields
+    ) -> List[Grant]:
+        """
+        Collect the grants applying to an object with the given ``fields``.
+
+        :param catalogus: primary key of the catalogus of the type in
+          ``fields``, required for authorizations on catalogus level to apply
+        """
+        grants = self._by_component.get(component, [])
+        catalogus_grants = self._catalogus_by_component.get(component, [])
+
+        # narrow down the candidates through the type index, if possible
+        for field in TYPE_FIELDS:
+            if fields.get(field) is not None:
+                grants = self._by_type.get((component, field, fields[field]), [])
+                catalogus_grants = self._by_catalogus.get((component, catalogus), [])
+                break
+
+        # the catalogus grants cover the type, only the other fields remain
+        remaining = {
+            name: value for name, value in fields.items() if name not in TYPE_FIELDS
+        }
+
+        return [grant for grant in grants if grant.matches(fields)] + [
+            grant for grant in catalogus_grants if grant.matches(remaining)
+        ]
+
+    def get_scopes(self, component: str, catalogus: int = None, **fields) -> Set[str]:
+        scopes = set()
+        for grant in self.get_grants(component, catalogus=catalogus, **fields):
+            scopes.update(grant.scopes)
+        return scopes
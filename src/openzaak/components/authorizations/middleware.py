@@ -1,15 +1,23 @@
-from typing import List
+from typing import List, Optional
 
-from django.db import models
-from django.db.models import Subquery
-
-from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
 from vng_api_common.constants import ComponentTypes
 from vng_api_common.middleware import (
     AuthMiddleware as _AuthMiddleware,
     JWTAuth as _JWTAuth,
 )
 
+from openzaak.utils.resources import get_resource_values
+
+from .cache import (
+    ClientAuthorizations,
+    cache_payload,
+    get_authorizations,
+    get_cached_payload,
+)
+from .matrix import TYPE_FIELDS, AuthorizationMatrix
+from .models import CatalogusAutorisatie
+
 COMPONENT_MAPPING = {
     "authorizations": ComponentTypes.ac,
     "zaken": ComponentTypes.zrc,
@@ -25,18 +33,83 @@ class JWTAuth(_JWTAuth):
     def _request_auth(self) -> list:
         return []
 
-    def get_autorisaties(self, init_component: str) -> models.QuerySet:
+    @property
+    def payload(self):
+        if self.encoded is None:
+            return None
+
+        # skip decoding and verifying tokens that were seen before
+        if not hasattr(self, "_payload"):
+            payload = get_cached_payload(self.encoded)
+            if payload is None:
+                payload = super().payload
+                cache_payload(self.encoded, payload)
+            self._payload = payload
+
+        return self._payload
+
+    @property
+    def client_authorizations(self) -> ClientAuthorizations:
+        if not hasattr(self, "_client_authorizations"):
+            self._client_authorizations = get_authorizations(self.client_id)
+        return self._client_authorizations
+
+    def _get_auth(self) -> List[Applicatie]:
+        return self.client_authorizations.applicaties
+
+    @property
+    def applicaties(self) -> List[Applicatie]:
+        if not hasattr(self, "_applicaties"):
+            self._applicaties = list(super().applicaties)
+        return self._applicaties
+
+    @property
+    def matrix(self) -> AuthorizationMatrix:
+        """
+        Load the authorizations of the client once for the entire request.
+        """
+        if not hasattr(self, "_matrix"):
+            if self.client_id is None:
+                self._matrix = AuthorizationMatrix(False, [])
+            else:
+                authorizations = self.client_authorizations
+                self._matrix = AuthorizationMatrix(
+                    authorizations.heeft_alle_autorisaties,
+                    authorizations.autorisaties,
+                    authorizations.catalogus_autorisaties,
+                )
+        return self._matrix
+
+    def get_autorisaties(self, init_component: str) -> List[Autorisatie]:
         """
         Retrieve all authorizations relevant to this component.
         """
-        if not self.applicaties:
-            return Autorisatie.objects.none()
+        component = COMPONENT_MAPPING.get(init_component, init_component)
+        return self.matrix.get_autorisaties(component)
 
+    def get_catalogus_autorisaties(
+        self, init_component: str
+    ) -> List[CatalogusAutorisatie]:
+        """
+        Retrieve all authorizations on catalogus level relevant to this component.
+        """
         component = COMPONENT_MAPPING.get(init_component, init_component)
-        app_ids = self.applicaties.values("id")
-        return Autorisatie.objects.filter(
-            applicatie_id__in=Subquery(app_ids), component=component
-        )
+        return self.matrix.get_catalogus_autorisaties(component)
+
+    def get_catalogus(self, component: str, fields: dict) -> Optional[int]:
+        """
+        Look up the catalogus of the type in ``fields``, if it can matter.
+        """
+        index = self.client_authorizations.index
+        if not index.has_catalogus_autorisaties(component):
+            return None
+
+        for field in TYPE_FIELDS:
+            url = fields.get(field)
+            if url:
+                return get_resource_values([url], "catalogus_id").get(url)
+
+        return None
 
     def has_auth(self, scopes: List[str], init_component: str = None, **fields) -> bool:
         if scopes is None:
@@ -46,29 +119,23 @@ class JWTAuth(_JWTAuth):
             return False
 
         # allow everything
-        if self.applicaties.filter(heeft_alle_autorisaties=True).exists():
+        if self.client_authorizations.heeft_alle_autorisaties:
             return True
 
         if not init_component:
             return False
 
-        autorisaties = self.get_autorisaties(init_component)
-        scopes_provided = set()
-
-        # filter on all additional components
-        for field_name, field_value in fields.items():
-            if hasattr(self, f"filter_{field_name}"):
-                autorisaties = getattr(self, f"filter_{field_name}")(
-                    autorisaties, field_value
-                )
-            else:
-                autorisaties = self.filter_default(
-                    autorisaties, field_name, field_value
-                )
+        component = COMPONENT_MAPPING.get(init_component, init_component)
+        catalogus = self.get_catalogus(component, fields)
 
-        for autorisatie in autorisaties:
-            scopes_provided.update(autorisatie.scopes)
+        index = self.client_authorizations.index
+        mask = index.get_mask(component, catalogus=catalogus, **fields)
+        if mask is not None:
+            return index.is_contained_in(scopes, mask)
 
+        scopes_provided = self.matrix.get_scopes(
+            component, catalogus=catalogus, **fields
+        )
         return scopes.is_contained_in(list(scopes_provided))
 
 
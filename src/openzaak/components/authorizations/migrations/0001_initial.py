@@ -0,0 +1,99 @@
+# Generated by Django 2.2.4 on 2026-10-18 21:03
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+import vng_api_common.fields
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("catalogi", "0002_auto_20190911_1520"),
+        ("authorizations", "0010_auto_20190712_1643"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CatalogusAutorisatie",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "component",
+                    models.CharField(
+                        choices=[
+                            ("ac", "Autorisatiecomponent"),
+                            ("nrc", "Notificatierouteringcomponent"),
+                            ("zrc", "Zaakregistratiecomponent"),
+                            ("ztc", "Zaaktypecatalogus"),
+                            ("drc", "Documentregistratiecomponent"),
+                            ("brc", "Besluitregistratiecomponent"),
+                        ],
+                        help_text="Component waarop autorisatie van toepassing is.",
+                        max_length=50,
+                        verbose_name="component",
+                    ),
+                ),
+                (
+                    "scopes",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=100),
+                        help_text="Komma-gescheiden lijst van scope labels.",
+                        size=None,
+                        verbose_name="scopes",
+                    ),
+                ),
+                (
+                    "max_vertrouwelijkheidaanduiding",
+                    vng_api_common.fields.VertrouwelijkheidsAanduidingField(
+                        blank=True,
+                        choices=[
+                            ("openbaar", "Openbaar"),
+                            ("beperkt_openbaar", "Beperkt openbaar"),
+                            ("intern", "Intern"),
+                            ("zaakvertrouwelijk", "Zaakvertrouwelijk"),
+                            ("vertrouwelijk", "Vertrouwelijk"),
+                            ("confidentieel", "Confidentieel"),
+                            ("geheim", "Geheim"),
+                            ("zeer_geheim", "Zeer geheim"),
+                        ],
+                        help_text="Maximaal toegelaten vertrouwelijkheidaanduiding (inclusief).",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "applicatie",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="catalogus_autorisaties",
+                        to="authorizations.Applicatie",
+                        verbose_name="applicatie",
+                    ),
+                ),
+                (
+                    "catalogus",
+                    models.ForeignKey(
+                        help_text="De CATALOGUS met de typen waarop de autorisatie van toepassing is.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="catalogi.Catalogus",
+                        verbose_name="catalogus",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "catalogusautorisatie",
+                "verbose_name_plural": "catalogusautorisaties",
+                "unique_together": {("applicatie", "component", "catalogus")},
+            },
+        )
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Index the client IDs of the applicaties, which are looked up on every API
+    call through an array containment (``@>``) query.
+    """
+
+    dependencies = [
+        ("openzaak_authorizations", "0001_initial"),
+        ("authorizations", "0010_auto_20190712_1643"),
+    ]
+
+    operations = [
+        # the applicaties rarely change - skip the pending list, which has to be
+        # scanned on every lookup until it is merged by (auto)vacuum
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS authorizations_applicatie_client_ids_gin "
+                "ON authorizations_applicatie USING gin (client_ids) "
+                "WITH (fastupdate = off);"
+            ),
+            reverse_sql=(
+                "DROP INDEX IF EXISTS authorizations_applicatie_client_ids_gin;"
+            ),
+        )
+    ]
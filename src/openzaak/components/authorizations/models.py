@@ -0,0 +1,56 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+from vng_api_common.constants import ComponentTypes
+from vng_api_common.fields import VertrouwelijkheidsAanduidingField
+
+__all__ = ["CatalogusAutorisatie"]
+
+
+class CatalogusAutorisatie(models.Model):
+    """
+    Authorization for all types within a catalogus.
+
+    Equivalent to an ``Autorisatie`` for every zaaktype, informatieobjecttype
+    or besluittype of the catalogus, including the types that are added to it
+    later on.
+    """
+
+    applicatie = models.ForeignKey(
+        "authorizations.Applicatie",
+        on_delete=models.CASCADE,
+        related_name="catalogus_autorisaties",
+        verbose_name=_("applicatie"),
+    )
+    component = models.CharField(
+        _("component"),
+        max_length=50,
+        choices=ComponentTypes.choices,
+        help_text=_("Component waarop autorisatie van toepassing is."),
+    )
+    catalogus = models.ForeignKey(
+        "catalogi.Catalogus",
+        on_delete=models.CASCADE,
+        verbose_name=_("catalogus"),
+        help_text=_(
+            "De CATALOGUS met de typen waarop de autorisatie van toepassing is."
+        ),
+    )
+    scopes = ArrayField(
+        models.CharField(max_length=100),
+        verbose_name=_("scopes"),
+        help_text=_("Komma-gescheiden lijst van scope labels."),
+    )
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduidingField(
+        help_text=_("Maximaal toegelaten vertrouwelijkheidaanduiding (inclusief)."),
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name = _("catalogusautorisatie")
+        verbose_name_plural = _("catalogusautorisaties")
+        unique_together = ("applicatie", "component", "catalogus")
+
+    def __str__(self):
+        return f"{self.applicatie} - {self.component} - {self.catalogus}"
@@ -0,0 +1,82 @@
+import logging
+
+from django.db.models.base import ModelBase
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.models import JWTSecret
+
+from .cache import invalidate, invalidate_tokens
+from .models import CatalogusAutorisatie
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(pre_save, sender=Applicatie, dispatch_uid="authorizations.track_client_ids")
+def track_client_ids(sender: ModelBase, instance: Applicatie, **kwargs) -> None:
+    """
+    Remember the client IDs before the update, they may be changed.
+    """
+    if not instance.pk or kwargs["raw"]:
+        return
+
+    instance._old_client_ids = (
+        Applicatie.objects.filter(pk=instance.pk)
+        .values_list("client_ids", flat=True)
+        .first()
+    )
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Applicatie,
+    dispatch_uid="authorizations.invalidate_applicatie",
+)
+def invalidate_applicatie(sender: ModelBase, instance: Applicatie, **kwargs) -> None:
+    client_ids = set(instance.client_ids or [])
+    client_ids.update(getattr(instance, "_old_client_ids", None) or [])
+    invalidate(client_ids)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Autorisatie,
+    dispatch_uid="authorizations.invalidate_autorisatie",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=CatalogusAutorisatie,
+    dispatch_uid="authorizations.invalidate_catalogus_autorisatie",
+)
+def invalidate_autorisatie(sender: ModelBase, instance: Autorisatie, **kwargs) -> None:
+    # the applicatie may already be gone in case of cascading deletes, which is
+    # dealt with by invalidate_applicatie
+    client_ids = (
+        Applicatie.objects.filter(pk=instance.applicatie_id)
+        .values_list("client_ids", flat=True)
+        .first()
+    )
+    invalidate(client_ids or [])
+
+
+@receiver(pre_save, sender=JWTSecret, dispatch_uid="authorizations.track_identifier")
+def track_identifier(sender: ModelBase, instance: JWTSecret, **kwargs) -> None:
+    if not instance.pk or kwargs["raw"]:
+        return
+
+    instance._old_identifier = (
+        JWTSecret.objects.filter(pk=instance.pk)
+        .values_list("identifier", flat=True)
+        .first()
+    )
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=JWTSecret,
+    dispatch_uid="authorizations.invalidate_jwt_secret",
+)
+def invalidate_jwt_secret(sender: ModelBase, instance: JWTSecret, **kwargs) -> None:
+    identifiers = {instance.identifier, getattr(instance, "_old_identifier", None)}
+    invalidate_tokens(identifier for identifier in identifiers if identifier)
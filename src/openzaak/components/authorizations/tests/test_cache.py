@@ -0,0 +1,121 @@
+from django.test import TestCase
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes
+
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_AUTORISATIES_BIJWERKEN, SCOPE_AUTORISATIES_LEZEN
+from ..cache import get_authorizations, get_stats, invalidate, reset_stats
+from .factories import ApplicatieFactory, AutorisatieFactory
+from .utils import get_operation_url
+
+
+class AuthorizationsCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        invalidate(["client-1", "client-2"])
+        reset_stats()
+
+    def test_cached_lookup(self):
+        applicatie = ApplicatieFactory.create(client_ids=["client-1"])
+        AutorisatieFactory.create(applicatie=applicatie, scopes=["zaken.lezen"])
+
+        authorizations = get_authorizations("client-1")
+
+        with self.assertNumQueries(0):
+            cached = get_authorizations("client-1")
+
+        self.assertEqual([app.pk for app in cached.applicaties], [applicatie.pk])
+        self.assertEqual(cached.autorisaties[0].scopes, ["zaken.lezen"])
+        self.assertIs(cached, authorizations)
+
+    def test_unknown_client_id(self):
+        authorizations = get_authorizations("client-1")
+
+        self.assertEqual(authorizations.applicaties, [])
+        self.assertEqual(authorizations.autorisaties, [])
+        self.assertFalse(authorizations.heeft_alle_autorisaties)
+
+    def test_invalidated_on_applicatie_changes(self):
+        get_authorizations("client-1")
+
+        applicatie = ApplicatieFactory.create(client_ids=["client-1"])
+        self.assertEqual(len(get_authorizations("client-1").applicaties), 1)
+
+        applicatie.client_ids = ["client-2"]
+        applicatie.save()
+        self.assertEqual(get_authorizations("client-1").applicaties, [])
+        self.assertEqual(len(get_authorizations("client-2").applicaties), 1)
+
+        applicatie.delete()
+        self.assertEqual(get_authorizations("client-2").applicaties, [])
+
+    def test_invalidated_on_autorisatie_changes(self):
+        applicatie = ApplicatieFactory.create(client_ids=["client-1"])
+        autorisatie = AutorisatieFactory.create(
+            applicatie=applicatie, scopes=["zaken.lezen"]
+        )
+        get_authorizations("client-1")
+
+        autorisatie.scopes = ["zaken.bijwerken"]
+        autorisatie.save()
+        self.assertEqual(
+            get_authorizations("client-1").autorisaties[0].scopes, ["zaken.bijwerken"]
+        )
+
+        autorisatie.delete()
+        self.assertEqual(get_authorizations("client-1").autorisaties, [])
+
+    def test_stats(self):
+        get_authorizations("client-1")
+        get_authorizations("client-1")
+        invalidate(["client-1"])
+        get_authorizations("client-1")
+
+        self.assertEqual(get_stats(), {"local_hits": 1, "shared_hits": 0, "misses": 2})
+
+
+class ApplicatieCacheInvalidationTests(JWTAuthMixin, APITestCase):
+    scopes = [str(SCOPE_AUTORISATIES_BIJWERKEN), str(SCOPE_AUTORISATIES_LEZEN)]
+    component = ComponentTypes.ac
+
+    def test_create_application(self):
+        get_authorizations("id1")
+
+        response = self.client.post(
+            get_operation_url("applicatie_create"),
+            {
+                "client_ids": ["id1"],
+                "label": "Melding Openbare Ruimte consumer",
+                "heeftAlleAutorisaties": True,
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(get_authorizations("id1").heeft_alle_autorisaties)
+
+    def test_update_application(self):
+        applicatie = ApplicatieFactory.create(
+            client_ids=["id1"], heeft_alle_autorisaties=False
+        )
+        get_authorizations("id1")
+        url = get_operation_url("applicatie_partial_update", uuid=applicatie.uuid)
+
+        response = self.client.patch(url, {"heeftAlleAutorisaties": True})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertTrue(get_authorizations("id1").heeft_alle_autorisaties)
+
+    def test_delete_application(self):
+        applicatie = ApplicatieFactory.create(client_ids=["id1"])
+        get_authorizations("id1")
+
+        url = get_operation_url("applicatie_delete", uuid=applicatie.uuid)
+
+        response = self.client.delete(url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(get_authorizations("id1").applicaties, [])
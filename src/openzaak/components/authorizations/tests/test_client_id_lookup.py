@@ -0,0 +1,46 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from vng_api_common.authorizations.models import Applicatie
+
+from ..api.filters import ApplicatieRetrieveFilter
+from ..cache import _load
+from .factories import ApplicatieFactory
+
+INDEX = "authorizations_applicatie_client_ids_gin"
+
+
+class ClientIdLookupTests(TestCase):
+    """
+    Assert that the lookups by client ID can use the GIN index.
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        ApplicatieFactory.create_batch(10)
+        ApplicatieFactory.create(client_ids=["client-1", "client-2"])
+
+        # the tables are too small for the index to be the cheapest option
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def test_middleware(self):
+        with CaptureQueriesContext(connection) as context:
+            _load("client-2")
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN {context.captured_queries[0]['sql']}")
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+
+        self.assertIn("authorizations_applicatie", context.captured_queries[0]["sql"])
+        self.assertIn(INDEX, plan)
+
+    def test_consumer(self):
+        queryset = ApplicatieRetrieveFilter(
+            {"client_id": "client-2"}, queryset=Applicatie.objects.all()
+        ).qs
+
+        self.assertIn(INDEX, queryset.explain())
+        self.assertEqual(queryset.get().client_ids, ["client-1", "client-2"])
@@ -0,0 +1,134 @@
+from itertools import product
+
+from django.test import SimpleTestCase
+
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.scopes import Scope
+
+from ..index import AuthorizationIndex
+from ..matrix import AuthorizationMatrix
+from ..models import CatalogusAutorisatie
+
+ZAAKTYPE = "http://testserver/catalogi/api/v1/zaaktypen/1"
+OTHER_ZAAKTYPE = "http://testserver/catalogi/api/v1/zaaktypen/2"
+
+LEZEN = Scope("test.lezen")
+BIJWERKEN = Scope("test.bijwerken")
+AANMAKEN = Scope("test.aanmaken")
+
+
+class AuthorizationIndexTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.autorisaties = [
+            Autorisatie(
+                component=ComponentTypes.zrc,
+                zaaktype=ZAAKTYPE,
+                scopes=[LEZEN.label],
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+            ),
+            Autorisatie(
+                component=ComponentTypes.zrc,
+                zaaktype=ZAAKTYPE,
+                scopes=[BIJWERKEN.label],
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+            ),
+        ]
+        self.catalogus_autorisaties = [
+            CatalogusAutorisatie(
+                component=ComponentTypes.zrc,
+                catalogus_id=1,
+                scopes=[AANMAKEN.label],
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern,
+            )
+        ]
+        self.index = AuthorizationIndex.build(
+            self.autorisaties, self.catalogus_autorisaties
+        )
+
+    def has_auth(self, scope, **fields) -> bool:
+        mask = self.index.get_mask(ComponentTypes.zrc, **fields)
+        return self.index.is_contained_in(scope, mask)
+
+    def test_scopes_per_vertrouwelijkheidaanduiding(self):
+        openbaar = VertrouwelijkheidsAanduiding.openbaar
+        geheim = VertrouwelijkheidsAanduiding.geheim
+
+        self.assertTrue(
+            self.has_auth(
+                BIJWERKEN, zaaktype=ZAAKTYPE, vertrouwelijkheidaanduiding=openbaar
+            )
+        )
+        self.assertTrue(
+            self.has_auth(LEZEN, zaaktype=ZAAKTYPE, vertrouwelijkheidaanduiding=geheim)
+        )
+        self.assertFalse(
+            self.has_auth(
+                BIJWERKEN, zaaktype=ZAAKTYPE, vertrouwelijkheidaanduiding=geheim
+            )
+        )
+        self.assertFalse(
+            self.has_auth(
+                LEZEN, zaaktype=ZAAKTYPE, vertrouwelijkheidaanduiding="onbekend"
+            )
+        )
+        self.assertFalse(self.has_auth(LEZEN, zaaktype=OTHER_ZAAKTYPE))
+
+    def test_combined_scopes(self):
+        self.assertTrue(self.has_auth(LEZEN | AANMAKEN, zaaktype=ZAAKTYPE))
+        self.assertFalse(
+            self.has_auth(AANMAKEN | Scope("test.other"), zaaktype=ZAAKTYPE)
+        )
+
+    def test_catalogus(self):
+        self.assertTrue(
+            self.has_auth(
+                AANMAKEN,
+                zaaktype=OTHER_ZAAKTYPE,
+                catalogus=1,
+                vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern,
+            )
+        )
+        self.assertFalse(self.has_auth(AANMAKEN, zaaktype=OTHER_ZAAKTYPE, catalogus=2))
+        self.assertTrue(self.index.has_catalogus_autorisaties(ComponentTypes.zrc))
+        self.assertFalse(self.index.has_catalogus_autorisaties(ComponentTypes.drc))
+
+    def test_unsupported_fields(self):
+        self.assertIsNone(
+            self.index.get_mask(
+                ComponentTypes.zrc, zaaktype=ZAAKTYPE, besluittype=OTHER_ZAAKTYPE
+            )
+        )
+
+    def test_serialization(self):
+        index = AuthorizationIndex.from_data(self.index.to_data())
+
+        self.assertEqual(index.scopes, self.index.scopes)
+        self.assertEqual(index.types, self.index.types)
+        self.assertEqual(index.catalogi, self.index.catalogi)
+        self.assertEqual(index.components, self.index.components)
+
+    def test_consistent_with_matrix(self):
+        matrix = AuthorizationMatrix(
+            False, self.autorisaties, self.catalogus_autorisaties
+        )
+        combinations = product(
+            [LEZEN, BIJWERKEN, AANMAKEN, LEZEN | BIJWERKEN],
+            [ComponentTypes.zrc, ComponentTypes.drc],
+            [None, ZAAKTYPE, OTHER_ZAAKTYPE],
+            [None, 1],
+            [None, ""] + list(VertrouwelijkheidsAanduiding.values),
+        )
+
+        for scope, component, zaaktype, catalogus, va in combinations:
+            fields = {"zaaktype": zaaktype, "vertrouwelijkheidaanduiding": va}
+            with self.subTest(scope=scope, component=component, **fields):
+                mask = self.index.get_mask(component, catalogus=catalogus, **fields)
+                scopes = matrix.get_scopes(component, catalogus=catalogus, **fields)
+
+                self.assertEqual(
+                    self.index.is_contained_in(scope, mask),
+                    scope.is_contained_in(list(scopes)),
+                )
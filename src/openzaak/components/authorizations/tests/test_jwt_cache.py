@@ -0,0 +1,76 @@
+import time
+
+from django.test import TestCase
+
+import jwt
+from rest_framework.exceptions import PermissionDenied
+from vng_api_common.models import JWTSecret
+
+from ..cache import cache_payload, get_cached_payload, invalidate_tokens
+from ..middleware import JWTAuth
+
+
+def encode(payload: dict, secret: str) -> str:
+    return jwt.encode(payload, secret, algorithm="HS256").decode("ascii")
+
+
+class JWTCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        invalidate_tokens(["client-1"])
+        self.secret = JWTSecret.objects.create(identifier="client-1", secret="oops")
+        self.payload = {"iat": int(time.time()), "client_id": "client-1"}
+
+    def test_verified_once(self):
+        token = encode(self.payload, "oops")
+
+        self.assertEqual(JWTAuth(token).payload["client_id"], "client-1")
+
+        with self.assertNumQueries(0):
+            payload = JWTAuth(token).payload
+
+        self.assertEqual(payload["client_id"], "client-1")
+
+    def test_invalid_signature_not_cached(self):
+        token = encode(self.payload, "wrong")
+
+        with self.assertRaises(PermissionDenied):
+            JWTAuth(token).payload
+
+        self.assertIsNone(get_cached_payload(token))
+
+    def test_secret_changed(self):
+        token = encode(self.payload, "oops")
+        JWTAuth(token).payload
+
+        self.secret.secret = "rotated"
+        self.secret.save()
+
+        with self.assertRaises(PermissionDenied):
+            JWTAuth(token).payload
+
+    def test_secret_deleted(self):
+        token = encode(self.payload, "oops")
+        JWTAuth(token).payload
+
+        self.secret.delete()
+
+        with self.assertRaises(PermissionDenied):
+            JWTAuth(token).payload
+
+    def test_expired_token_not_cached(self):
+        payload = {**self.payload, "exp": int(time.time()) - 1}
+        token = encode(payload, "oops")
+
+        cache_payload(token, payload)
+
+        self.assertIsNone(get_cached_payload(token))
+
+    def test_token_not_yet_valid_not_cached(self):
+        payload = {**self.payload, "iat": int(time.time()) + 60}
+        token = encode(payload, "oops")
+
+        cache_payload(token, payload)
+
+        self.assertIsNone(get_cached_payload(token))
@@ -7,13 +7,16 @@ from vng_api_common.serializers import add_choice_values_help_text
 from vng_api_common.utils import get_help_text
 from vng_api_common.validators import IsImmutableValidator, validate_rsin
 
+from openzaak.components.catalogi.api.scopes import SCOPE_ZAAKTYPES_READ
 from openzaak.components.catalogi.models import BesluitType
 from openzaak.components.documenten.api.serializers import (
     EnkelvoudigInformatieObjectHyperlinkedRelatedField,
 )
 from openzaak.components.documenten.models import EnkelvoudigInformatieObject
+from openzaak.components.zaken.api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
 from openzaak.components.zaken.models import Zaak
 from openzaak.utils.serializer_fields import LengthHyperlinkedRelatedField
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
 
 from ..constants import VervalRedenen
 from ..models import Besluit, BesluitInformatieObject
@@ -24,7 +27,9 @@ from .validators import (
 )
 
 
-class BesluitSerializer(serializers.HyperlinkedModelSerializer):
+class BesluitSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     besluittype = LengthHyperlinkedRelatedField(
         view_name="besluittype-detail",
         lookup_field="uuid",
@@ -36,7 +41,8 @@ class BesluitSerializer(serializers.HyperlinkedModelSerializer):
     zaak = LengthHyperlinkedRelatedField(
         view_name="zaak-detail",
         lookup_field="uuid",
-        queryset=Zaak.objects,
+        # the zaaktype is validated against, see BesluittypeZaaktypeValidator
+        queryset=Zaak.objects.select_related("zaaktype"),
         required=False,
         allow_null=True,
         max_length=200,
@@ -46,6 +52,21 @@ class BesluitSerializer(serializers.HyperlinkedModelSerializer):
         source="get_vervalreden_display", read_only=True
     )
 
+    expandable_fields = {
+        "besluittype": (
+            "openzaak.components.catalogi.api.serializers.BesluitTypeSerializer",
+            {"scope": SCOPE_ZAAKTYPES_READ},
+        ),
+        "zaak": (
+            "openzaak.components.zaken.api.serializers.ZaakSerializer",
+            {"scope": SCOPE_ZAKEN_ALLES_LEZEN},
+        ),
+        "besluitinformatieobjecten": (
+            "openzaak.components.besluiten.api.serializers.BesluitInformatieObjectSerializer",
+            {"source": "besluitinformatieobject_set", "many": True},
+        ),
+    }
+
     class Meta:
         model = Besluit
         fields = (
@@ -81,7 +102,9 @@ class BesluitSerializer(serializers.HyperlinkedModelSerializer):
         self.fields["vervalreden"].help_text += f"\n\n{value_display_mapping}"
 
 
-class BesluitInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class BesluitInformatieObjectSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     informatieobject = EnkelvoudigInformatieObjectHyperlinkedRelatedField(
         view_name="enkelvoudiginformatieobject-detail",
         lookup_field="uuid",
@@ -5,6 +5,8 @@ from vng_api_common.validators import (
     UniekeIdentificatieValidator as _UniekeIdentificatieValidator,
 )
 
+from openzaak.components.catalogi.graph import get_graph
+
 
 class UniekeIdentificatieValidator(_UniekeIdentificatieValidator):
     """
@@ -29,9 +31,8 @@ class BesluittypeZaaktypeValidator:
         if not zaak:
             return
 
-        if not besluittype.zaaktypes.filter(
-            id=zaak.zaaktype_id, concept=False
-        ).exists():
+        zaaktype = get_graph(zaak.zaaktype)
+        if zaaktype.concept or besluittype.pk not in zaaktype.besluittypen:
             raise serializers.ValidationError(self.message, code=self.code)
 
 
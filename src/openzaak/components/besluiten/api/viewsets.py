@@ -1,13 +1,13 @@
 from rest_framework import viewsets
-from rest_framework.pagination import PageNumberPagination
 from vng_api_common.audittrails.viewsets import (
     AuditTrailViewSet,
     AuditTrailViewsetMixin,
 )
 from vng_api_common.notifications.viewsets import NotificationViewSetMixin
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.pagination import CachedCount, OptionalCursorPagination
+from openzaak.utils.viewsets import CheckQueryParamsMixin, MultiGetMixin, QueryPlanMixin
 
 from ..models import Besluit, BesluitInformatieObject
 from .audits import AUDIT_BRC
@@ -26,7 +26,9 @@ from .serializers import BesluitInformatieObjectSerializer, BesluitSerializer
 class BesluitViewSet(
     NotificationViewSetMixin,
     AuditTrailViewsetMixin,
+    MultiGetMixin,
     ListFilterByAuthorizationsMixin,
+    QueryPlanMixin,
     viewsets.ModelViewSet,
 ):
     """
@@ -89,11 +91,13 @@ class BesluitViewSet(
     serializer_class = BesluitSerializer
     filter_class = BesluitFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
+    count_strategy = CachedCount()
     permission_classes = (BesluitAuthRequired,)
     required_scopes = {
         "list": SCOPE_BESLUITEN_ALLES_LEZEN,
         "retrieve": SCOPE_BESLUITEN_ALLES_LEZEN,
+        "_multiget": SCOPE_BESLUITEN_ALLES_LEZEN,
         "create": SCOPE_BESLUITEN_AANMAKEN,
         "destroy": SCOPE_BESLUITEN_ALLES_VERWIJDEREN,
         "update": SCOPE_BESLUITEN_BIJWERKEN,
@@ -1,18 +1,23 @@
-from urllib.parse import urlparse
+from typing import Iterable
 
 from django.db import models
+from django.db.models import Q
 
 from vng_api_common.scopes import Scope
-from vng_api_common.utils import get_resource_for_path
 
+from openzaak.components.authorizations.models import CatalogusAutorisatie
 from openzaak.utils.query import BlockChangeMixin
+from openzaak.utils.resources import get_resource_pks
 
 
 class AuthorizationsFilterMixin:
     authorizations_lookup = None
 
     def filter_for_authorizations(
-        self, scope: Scope, authorizations: models.QuerySet
+        self,
+        scope: Scope,
+        authorizations: models.QuerySet,
+        catalogus_authorizations: Iterable[CatalogusAutorisatie] = (),
     ) -> models.QuerySet:
         """
         Filter objects whitelisted by the authorizations.
@@ -22,7 +27,8 @@ class AuthorizationsFilterMixin:
 
         This means that ``besluiten`` are included if, and only if:
 
-        * the ``besluittype`` is provided in ``authorizations``
+        * the ``besluittype`` (or its ``catalogus``) is provided in
+          ``authorizations``
         * the scopes for the ``besluittype`` in each ``authorization`` contain the
           required``scope``
 
@@ -30,6 +36,8 @@ class AuthorizationsFilterMixin:
           authorizations
         :param authorizations: queryset of
           :class:`vng_api_common.authorizations.Autorisatie` objects
+        :param catalogus_authorizations: authorizations for all the
+          ``besluittypen`` of a ``catalogus``
 
         :return: a queryset of filtered results according to the
           authorizations provided
@@ -38,17 +46,27 @@ class AuthorizationsFilterMixin:
             "" if not self.authorizations_lookup else f"{self.authorizations_lookup}__"
         )
 
-        # keep a list of allowed besluittypen
-        besluittypen = []
-        for authorization in authorizations:
-            if scope.is_contained_in(authorization.scopes):
-                besluittype_path = urlparse(authorization.besluittype).path
-                besluittype = get_resource_for_path(besluittype_path)
-                besluittypen.append(besluittype)
+        # keep a list of allowed besluittypen, resolved all at once
+        besluittype_pks = get_resource_pks(
+            authorization.besluittype
+            for authorization in authorizations
+            if scope.is_contained_in(authorization.scopes)
+        )
+        besluittypen = list(besluittype_pks.values())
+
+        catalogi = [
+            authorization.catalogus_id
+            for authorization in catalogus_authorizations
+            if scope.is_contained_in(authorization.scopes)
+        ]
 
         # filtering:
         # * only allow the white-listed besluittypen, explicitly
-        queryset = self.filter(**{f"{prefix}besluittype__in": besluittypen})
+        # * or the besluittypen of the white-listed catalogi
+        queryset = self.filter(
+            Q(**{f"{prefix}besluittype__in": besluittypen})
+            | Q(**{f"{prefix}besluittype__catalogus__in": catalogi})
+        )
         return queryset
 
 
@@ -0,0 +1,56 @@
+"""
+Guarantee that authorizations for an entire catalogus are applied.
+"""
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes
+from vng_api_common.tests import reverse
+
+from openzaak.components.authorizations.models import CatalogusAutorisatie
+from openzaak.components.catalogi.tests.factories import (
+    BesluitTypeFactory,
+    CatalogusFactory,
+)
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_BESLUITEN_ALLES_LEZEN
+from .factories import BesluitFactory
+
+
+class CatalogusAutorisatieTests(JWTAuthMixin, APITestCase):
+    # the regular autorisatie grants nothing
+    scopes = []
+    component = ComponentTypes.brc
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.catalogus = CatalogusFactory.create()
+        cls.besluittype = BesluitTypeFactory.create(catalogus=cls.catalogus)
+        CatalogusAutorisatie.objects.create(
+            applicatie=cls.applicatie,
+            component=ComponentTypes.brc,
+            catalogus=cls.catalogus,
+            scopes=[SCOPE_BESLUITEN_ALLES_LEZEN],
+        )
+
+    def test_besluit_list(self):
+        besluit1 = BesluitFactory.create(besluittype=self.besluittype)
+        # types added to the catalogus later on are covered as well
+        besluit2 = BesluitFactory.create(
+            besluittype=BesluitTypeFactory.create(catalogus=self.catalogus)
+        )
+        BesluitFactory.create()
+
+        response = self.client.get(reverse("besluit-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        urls = {besluit["url"] for besluit in response.data["results"]}
+        self.assertEqual(
+            urls,
+            {
+                f"http://testserver{reverse(besluit)}"
+                for besluit in (besluit1, besluit2)
+            },
+        )
@@ -0,0 +1,37 @@
+"""
+Guarantee that the authorizations are loaded only once per request.
+"""
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import BesluitTypeFactory
+from openzaak.utils.tests import AuthorizationQueriesMixin, JWTAuthMixin
+
+from ..api.scopes import SCOPE_BESLUITEN_AANMAKEN
+
+
+class AuthorizationQueriesTests(AuthorizationQueriesMixin, JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_BESLUITEN_AANMAKEN]
+    component = ComponentTypes.brc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.besluittype = BesluitTypeFactory.create(concept=False)
+        super().setUpTestData()
+
+    def test_create_besluit(self):
+        data = {
+            "verantwoordelijkeOrganisatie": "517439943",
+            "identificatie": "123123",
+            "besluittype": f"http://testserver{reverse(self.besluittype)}",
+            "datum": "2018-09-06",
+            "toelichting": "Vergunning verleend.",
+            "ingangsdatum": "2018-10-01",
+        }
+
+        with self.assertMaxAuthorizationQueries(1):
+            response = self.client.post(reverse("besluit-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
@@ -0,0 +1,43 @@
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.utils.tests import JWTAuthMixin
+
+from .factories import BesluitFactory
+from .utils import get_operation_url
+
+
+class BesluitExpandTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def test_expand(self):
+        besluit = BesluitFactory.create(for_zaak=True)
+
+        response = self.client.get(
+            get_operation_url("besluit_read", uuid=besluit.uuid),
+            {"expand": "besluittype,zaak"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            data["besluittype"]["url"],
+            f"http://testserver{reverse(besluit.besluittype)}",
+        )
+        self.assertEqual(
+            data["zaak"]["url"], f"http://testserver{reverse(besluit.zaak)}"
+        )
+
+    def test_expand_list(self):
+        BesluitFactory.create_batch(2, for_zaak=True)
+
+        response = self.client.get(
+            get_operation_url("besluit_list"), {"expand": "zaak", "fields": "zaak"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for item in response.json()["results"]:
+            self.assertEqual(list(item), ["zaak"])
+            self.assertIn("zaaktype", item["zaak"])
@@ -1,8 +1,14 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from openzaak.utils.pagination import CachedCount
 from openzaak.utils.tests import JWTAuthMixin
 
+from ..api.viewsets import BesluitViewSet
 from .factories import BesluitFactory
 from .utils import get_operation_url
 
@@ -39,3 +45,18 @@ class BesluitPaginationTestCase(JWTAuthMixin, APITestCase):
         self.assertEqual(response_data["count"], 2)
         self.assertIsNone(response_data["previous"])
         self.assertIsNone(response_data["next"])
+
+    @patch.object(BesluitViewSet, "count_strategy", CachedCount(threshold=1))
+    def test_pagination_cached_count(self):
+        caches["default"].clear()
+        BesluitFactory.create_batch(2)
+        besluit_list_url = get_operation_url("besluit_list")
+
+        self.client.get(besluit_list_url)
+        BesluitFactory.create()
+        response = self.client.get(besluit_list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-Count-Approximate"], "true")
+        self.assertEqual(response.json()["count"], 2)
+        self.assertEqual(len(response.json()["results"]), 3)
@@ -0,0 +1 @@
+default_app_config = "openzaak.components.catalogi.apps.CatalogiConfig"
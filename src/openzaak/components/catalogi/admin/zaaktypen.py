@@ -1,4 +1,5 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
 from django.utils.translation import ugettext_lazy as _
 
 from openzaak.utils.admin import (
@@ -16,6 +17,7 @@ from ..models import (
     ZaakType,
     ZaakTypenRelatie,
 )
+from ..versioning import create_new_version
 from .eigenschap import EigenschapAdmin
 from .forms import ZaakTypeForm
 from .mixins import ConceptAdminMixin, GeldigheidAdminMixin
@@ -153,6 +155,7 @@ class ZaakTypeAdmin(
         EigenschapInline,
         ResultaatTypeInline,
     )
+    actions = ["new_version"]
 
     def get_object_actions(self, obj):
         return (
@@ -181,3 +184,24 @@ class ZaakTypeAdmin(
                 ),
             ),
         )
+
+    def new_version(self, request, queryset):
+        for zaaktype in queryset:
+            try:
+                create_new_version(zaaktype)
+            except ValidationError as exc:
+                self.message_user(
+                    request,
+                    f"{zaaktype}: {' '.join(exc.messages)}",
+                    level=messages.ERROR,
+                )
+            else:
+                self.message_user(
+                    request,
+                    _("Nieuwe versie van {zaaktype} aangemaakt.").format(
+                        zaaktype=zaaktype
+                    ),
+                    level=messages.SUCCESS,
+                )
+
+    new_version.short_description = _("Nieuwe versie aanmaken")
@@ -0,0 +1,76 @@
+"""
+Materialized representations of published zaaktypen.
+
+Rendering a zaaktype takes a URL per related object, and a zaaktype can have
+hundreds of them. Published zaaktypen rarely change, so their rendered JSON is
+stored on the zaaktype when it's published, and regenerated whenever the
+zaaktype or one of its related objects changes, e.g. when edited in the admin,
+see :mod:`openzaak.components.catalogi.signals`.
+
+The URLs depend on the host of the request, so the representation is rendered
+for a placeholder host, which is replaced with the actual one when it's output.
+"""
+import json
+from typing import Dict, Iterable
+
+from django.http import HttpRequest
+
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+
+from ..models import ZaakType
+
+MATERIALIZED_HOST = "materialized.openzaak.invalid"
+MATERIALIZED_PREFIX = f"http://{MATERIALIZED_HOST}"
+
+
+class MaterializeRequest(HttpRequest):
+    """
+    Request for the placeholder host, without checking the allowed hosts.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.method = "GET"
+
+    def _get_scheme(self) -> str:
+        return "http"
+
+    def get_host(self) -> str:
+        return MATERIALIZED_HOST
+
+
+def render(zaaktype: ZaakType) -> str:
+    from .serializers import ZaakTypeSerializer
+
+    serializer = ZaakTypeSerializer(
+        zaaktype,
+        context={"request": Request(MaterializeRequest()), "use_materialized": False},
+    )
+    return json.dumps(serializer.data, cls=JSONEncoder)
+
+
+def materialize(zaaktype_ids: Iterable[int]) -> Dict[int, str]:
+    """
+    Store the representation of the published zaaktypen among ``zaaktype_ids``.
+    """
+    from .serializers import ZaakTypeSerializer
+
+    zaaktypen = (
+        ZaakType.objects.filter(pk__in=list(zaaktype_ids), concept=False)
+        .select_related(*ZaakTypeSerializer.Meta.select_related)
+        .prefetch_related(*ZaakTypeSerializer.Meta.prefetch_related)
+    )
+
+    materialized = {}
+    for zaaktype in zaaktypen:
+        materialized[zaaktype.pk] = render(zaaktype)
+        ZaakType.objects.filter(pk=zaaktype.pk).update(
+            materialized=materialized[zaaktype.pk]
+        )
+    return materialized
+
+
+def get_representation(zaaktype: ZaakType, request) -> dict:
+    base = f"{request.scheme}://{request.get_host()}"
+    return json.loads(zaaktype.materialized.replace(MATERIALIZED_PREFIX, base))
@@ -2,11 +2,15 @@ from rest_framework import serializers
 from rest_framework.validators import UniqueTogetherValidator
 from vng_api_common.utils import get_help_text
 
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
+
 from ...models import BesluitType, InformatieObjectType, ZaakType
 from ..validators import RelationCatalogValidator
 
 
-class BesluitTypeSerializer(serializers.HyperlinkedModelSerializer):
+class BesluitTypeSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     informatieobjecttypes = serializers.HyperlinkedRelatedField(
         view_name="informatieobjecttype-detail",
         many=True,
@@ -49,6 +53,8 @@ class BesluitTypeSerializer(serializers.HyperlinkedModelSerializer):
             "einde_geldigheid",
             "concept",
         )
+        select_related = ("catalogus",)
+        prefetch_related = ("zaaktypes", "informatieobjecttypes")
         validators = [
             UniqueTogetherValidator(
                 queryset=BesluitType.objects.all(), fields=["catalogus", "omschrijving"]
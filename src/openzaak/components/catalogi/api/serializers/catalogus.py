@@ -2,10 +2,14 @@ from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import serializers
 
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
+
 from ...models import Catalogus
 
 
-class CatalogusSerializer(serializers.HyperlinkedModelSerializer):
+class CatalogusSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     zaaktypen = serializers.HyperlinkedRelatedField(
         many=True,
         read_only=True,
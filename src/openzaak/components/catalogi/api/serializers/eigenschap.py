@@ -1,6 +1,8 @@
 from rest_framework import serializers
 from vng_api_common.serializers import add_choice_values_help_text
 
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
+
 from ...constants import FormaatChoices
 from ...models import Eigenschap, EigenschapSpecificatie
 
@@ -17,7 +19,9 @@ class EigenschapSpecificatieSerializer(serializers.ModelSerializer):
         self.fields["formaat"].help_text += f"\n\n{value_display_mapping}"
 
 
-class EigenschapSerializer(serializers.HyperlinkedModelSerializer):
+class EigenschapSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     specificatie = EigenschapSpecificatieSerializer(
         read_only=True, source="specificatie_van_eigenschap"
     )
@@ -25,6 +29,7 @@ class EigenschapSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
         model = Eigenschap
         fields = ("url", "naam", "definitie", "specificatie", "toelichting", "zaaktype")
+        select_related = ("zaaktype",)
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "naam": {"source": "eigenschapnaam"},
@@ -2,10 +2,14 @@ from rest_framework import serializers
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.serializers import add_choice_values_help_text
 
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
+
 from ...models import InformatieObjectType
 
 
-class InformatieObjectTypeSerializer(serializers.HyperlinkedModelSerializer):
+class InformatieObjectTypeSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     class Meta:
         model = InformatieObjectType
         extra_kwargs = {
@@ -24,6 +28,7 @@ class InformatieObjectTypeSerializer(serializers.HyperlinkedModelSerializer):
             "einde_geldigheid",
             "concept",
         )
+        select_related = ("catalogus",)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
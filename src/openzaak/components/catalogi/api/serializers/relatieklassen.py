@@ -1,11 +1,15 @@
 from rest_framework import serializers
 from vng_api_common.serializers import add_choice_values_help_text
 
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
+
 from ...constants import RichtingChoices
 from ...models import ZaakInformatieobjectType
 
 
-class ZaakTypeInformatieObjectTypeSerializer(serializers.HyperlinkedModelSerializer):
+class ZaakTypeInformatieObjectTypeSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     """
     Represent a ZaakTypeInformatieObjectType.
 
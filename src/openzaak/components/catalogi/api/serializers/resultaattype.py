@@ -15,6 +15,8 @@ from vng_api_common.serializers import (
 )
 from vng_api_common.validators import ResourceValidator
 
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
+
 from ...models import ResultaatType
 from ..validators import ProcestermijnAfleidingswijzeValidator, ProcesTypeValidator
 
@@ -37,7 +39,9 @@ class BrondatumArchiefprocedureSerializer(GegevensGroepSerializer):
 
 
 class ResultaatTypeSerializer(
-    NestedGegevensGroepMixin, serializers.HyperlinkedModelSerializer
+    FlexFieldsSerializerMixin,
+    NestedGegevensGroepMixin,
+    serializers.HyperlinkedModelSerializer,
 ):
 
     brondatum_archiefprocedure = BrondatumArchiefprocedureSerializer(
@@ -63,6 +67,7 @@ class ResultaatTypeSerializer(
             "archiefactietermijn",
             "brondatum_archiefprocedure",
         )
+        select_related = ("zaaktype",)
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "resultaattypeomschrijving": {
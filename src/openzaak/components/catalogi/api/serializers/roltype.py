@@ -3,13 +3,18 @@ from rest_framework import serializers
 from vng_api_common.constants import RolOmschrijving
 from vng_api_common.serializers import add_choice_values_help_text
 
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
+
 from ...models import RolType
 
 
-class RolTypeSerializer(NestedCreateMixin, serializers.HyperlinkedModelSerializer):
+class RolTypeSerializer(
+    FlexFieldsSerializerMixin, NestedCreateMixin, serializers.HyperlinkedModelSerializer
+):
     class Meta:
         model = RolType
         fields = ("url", "zaaktype", "omschrijving", "omschrijving_generiek")
+        select_related = ("zaaktype",)
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "zaaktype": {"lookup_field": "uuid"},
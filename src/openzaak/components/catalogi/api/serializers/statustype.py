@@ -2,10 +2,14 @@ from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import serializers
 
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
+
 from ...models import StatusType
 
 
-class StatusTypeSerializer(serializers.HyperlinkedModelSerializer):
+class StatusTypeSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     is_eindstatus = serializers.BooleanField(
         read_only=True,
         help_text=_(
@@ -27,6 +31,7 @@ class StatusTypeSerializer(serializers.HyperlinkedModelSerializer):
             "is_eindstatus",
             "informeren",
         )
+        select_related = ("zaaktype",)
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "omschrijving": {"source": "statustype_omschrijving"},
@@ -1,11 +1,15 @@
+from collections import OrderedDict
+
 from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
 
 from drf_writable_nested import NestedCreateMixin
 from rest_framework.serializers import (
+    DateField,
     HyperlinkedModelSerializer,
     HyperlinkedRelatedField,
     ModelSerializer,
+    Serializer,
 )
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.serializers import (
@@ -15,8 +19,11 @@ from vng_api_common.serializers import (
 )
 from vng_api_common.validators import ResourceValidator
 
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
+
 from ...constants import AardRelatieChoices, RichtingChoices
 from ...models import BesluitType, ZaakType, ZaakTypenRelatie
+from ..materialized import get_representation
 from ..validators import RelationCatalogValidator, ZaaktypeGeldigheidValidator
 
 
@@ -40,7 +47,10 @@ class ZaakTypenRelatieSerializer(ModelSerializer):
 
 
 class ZaakTypeSerializer(
-    NestedGegevensGroepMixin, NestedCreateMixin, HyperlinkedModelSerializer
+    FlexFieldsSerializerMixin,
+    NestedGegevensGroepMixin,
+    NestedCreateMixin,
+    HyperlinkedModelSerializer,
 ):
     referentieproces = ReferentieProcesSerializer(
         required=True,
@@ -158,6 +168,16 @@ class ZaakTypeSerializer(
             "versiedatum",
             "concept",
         )
+        select_related = ("catalogus",)
+        prefetch_related = (
+            "zaaktypenrelaties",
+            "heeft_relevant_informatieobjecttype",
+            "statustypen",
+            "resultaattypen",
+            "eigenschap_set",
+            "roltype_set",
+            "besluittype_set",
+        )
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "identificatie": {"source": "zaaktype_identificatie"},
@@ -195,3 +215,37 @@ class ZaakTypeSerializer(
         self.fields[
             "indicatie_intern_of_extern"
         ].help_text += f"\n\n{value_display_mapping}"
+
+    def uses_materialized(self) -> bool:
+        """
+        Whether published zaaktypen are output from their stored representation.
+
+        Only the top-level fields can be selected from it.
+        """
+        omit_fields, sparse_fields, next_level_omits = self._field_selection
+        return (
+            self.context.get("use_materialized", True)
+            and self.context.get("request") is not None
+            and not next_level_omits
+        )
+
+    def to_representation(self, instance):
+        if not (instance.materialized and self.uses_materialized()):
+            return super().to_representation(instance)
+
+        representation = get_representation(instance, self.context["request"])
+        return OrderedDict(
+            (name, value)
+            for name, value in representation.items()
+            if self.is_output(name)
+        )
+
+
+class ZaakTypeNewVersionSerializer(Serializer):
+    begin_geldigheid = DateField(
+        required=False,
+        help_text=_(
+            "De datum waarop de nieuwe versie van het ZAAKTYPE geldig wordt. "
+            "Standaard is dat vandaag. Het ZAAKTYPE is geldig tot de dag ervoor."
+        ),
+    )
@@ -2,15 +2,18 @@ from rest_framework import mixins, viewsets
 from rest_framework.pagination import PageNumberPagination
 
 from openzaak.utils.permissions import AuthRequired
+from openzaak.utils.viewsets import MultiGetMixin
 
 from ...models import BesluitType
 from ..filters import BesluitTypeFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import BesluitTypeSerializer
-from .mixins import ConceptMixin, M2MConceptCreateMixin
+from .mixins import ConceptMixin, M2MConceptCreateMixin, ResponseCacheMixin
 
 
 class BesluitTypeViewSet(
+    MultiGetMixin,
+    ResponseCacheMixin,
     ConceptMixin,
     M2MConceptCreateMixin,
     mixins.CreateModelMixin,
@@ -65,6 +68,7 @@ class BesluitTypeViewSet(
     required_scopes = {
         "list": SCOPE_ZAAKTYPES_READ,
         "retrieve": SCOPE_ZAAKTYPES_READ,
+        "_multiget": SCOPE_ZAAKTYPES_READ,
         "create": SCOPE_ZAAKTYPES_WRITE,
         "destroy": SCOPE_ZAAKTYPES_WRITE,
         "publish": SCOPE_ZAAKTYPES_WRITE,
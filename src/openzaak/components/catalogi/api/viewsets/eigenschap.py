@@ -7,10 +7,11 @@ from openzaak.utils.permissions import AuthRequired
 from ..filters import EigenschapFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import EigenschapSerializer
-from .mixins import ZaakTypeConceptMixin
+from .mixins import ResponseCacheMixin, ZaakTypeConceptMixin
 
 
 class EigenschapViewSet(
+    ResponseCacheMixin,
     ZaakTypeConceptMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
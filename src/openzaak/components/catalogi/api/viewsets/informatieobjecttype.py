@@ -2,15 +2,18 @@ from rest_framework import mixins, viewsets
 from rest_framework.pagination import PageNumberPagination
 
 from openzaak.utils.permissions import AuthRequired
+from openzaak.utils.viewsets import MultiGetMixin
 
 from ...models import InformatieObjectType
 from ..filters import InformatieObjectTypeFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import InformatieObjectTypeSerializer
-from .mixins import ConceptMixin
+from .mixins import ConceptMixin, ResponseCacheMixin
 
 
 class InformatieObjectTypeViewSet(
+    MultiGetMixin,
+    ResponseCacheMixin,
     ConceptMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
@@ -66,6 +69,7 @@ class InformatieObjectTypeViewSet(
     required_scopes = {
         "list": SCOPE_ZAAKTYPES_READ,
         "retrieve": SCOPE_ZAAKTYPES_READ,
+        "_multiget": SCOPE_ZAAKTYPES_READ,
         "create": SCOPE_ZAAKTYPES_WRITE,
         "destroy": SCOPE_ZAAKTYPES_WRITE,
         "publish": SCOPE_ZAAKTYPES_WRITE,
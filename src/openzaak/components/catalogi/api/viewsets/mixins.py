@@ -1,10 +1,19 @@
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
 from django.utils.translation import ugettext_lazy as _
 
 from drf_yasg.utils import no_body, swagger_auto_schema
+from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 
+from ... import cache
+
 
 class ConceptPublishMixin:
     @swagger_auto_schema(request_body=no_body)
@@ -101,3 +110,103 @@ class M2MConceptCreateMixin:
                     raise PermissionDenied(detail=msg)
 
         super().perform_create(serializer)
+
+
+class ResponseCacheMixin:
+    """
+    Cache the rendered responses of published objects.
+
+    Detail responses are cached if the object is not a concept, list responses
+    if concepts are filtered out. The entries are shared between the workers
+    and dropped on any change in the catalogi, see
+    :mod:`openzaak.components.catalogi.cache`. Clients are allowed to cache
+    these responses for ``settings.CATALOGI_RESPONSE_MAX_AGE`` seconds, and
+    told to revalidate the others.
+    """
+
+    response_cacheable = False
+
+    def get_authorization_class(self) -> str:
+        # the types are authorized for the whole component, so either the
+        # client may see all of them or it didn't get past the permission check
+        jwt_auth = getattr(self.request, "jwt_auth", None)
+        if jwt_auth is not None and jwt_auth.matrix.heeft_alle_autorisaties:
+            return "alle"
+        return "component"
+
+    def get_response_cache_key(self) -> str:
+        request = self.request
+        return cache.get_cache_key(
+            settings.API_VERSION,
+            request.build_absolute_uri(request.path),
+            request.accepted_media_type or "",
+            urlencode(sorted(request.query_params.lists()), doseq=True),
+            self.get_authorization_class(),
+        )
+
+    def get_object(self):
+        instance = super().get_object()
+        self.response_cacheable = not self.get_concept(instance)
+        return instance
+
+    def patch_cache_control(self, response: HttpResponse, cacheable: bool) -> None:
+        if cacheable:
+            patch_cache_control(
+                response, private=True, max_age=settings.CATALOGI_RESPONSE_MAX_AGE
+            )
+        else:
+            patch_cache_control(response, no_cache=True)
+
+    def get_cached_response(self, get_response) -> HttpResponse:
+        key = self.get_response_cache_key()
+
+        cached = cache.get_cached(key)
+        if cached is not None:
+            header = self.request.META.get("HTTP_IF_NONE_MATCH")
+            if cached.etag and header and cached.etag in parse_etags(header):
+                response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+            else:
+                response = HttpResponse(
+                    cached.content, content_type=cached.content_type
+                )
+            if cached.etag:
+                response["ETag"] = cached.etag
+            self.patch_cache_control(response, True)
+            return response
+
+        # read before rendering, so that changes made in the meantime start
+        # a newer generation than the one the response is cached with
+        generation = cache.get_generation()
+        response = get_response()
+        if response.status_code != status.HTTP_200_OK:
+            return response
+
+        self.patch_cache_control(response, self.response_cacheable)
+        if self.response_cacheable:
+            response.add_post_render_callback(
+                lambda rendered: cache.store(
+                    key,
+                    cache.CachedResponse(
+                        generation,
+                        rendered.content,
+                        rendered["Content-Type"],
+                        rendered.get("ETag"),
+                    ),
+                )
+            )
+        return response
+
+    def list(self, request, *args, **kwargs):
+        self.response_cacheable = request.query_params.get("status") in (
+            None,
+            "definitief",
+        )
+        return self.get_cached_response(
+            lambda: super(ResponseCacheMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        def get_response():
+            return super(ResponseCacheMixin, self).retrieve(request, *args, **kwargs)
+
+        return self.get_cached_response(get_response)
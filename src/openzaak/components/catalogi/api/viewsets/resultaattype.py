@@ -7,10 +7,11 @@ from ...models import ResultaatType
 from ..filters import ResultaatTypeFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import ResultaatTypeSerializer
-from .mixins import ZaakTypeConceptMixin
+from .mixins import ResponseCacheMixin, ZaakTypeConceptMixin
 
 
 class ResultaatTypeViewSet(
+    ResponseCacheMixin,
     ZaakTypeConceptMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
@@ -1,8 +1,8 @@
 from rest_framework import mixins, viewsets
 from rest_framework.pagination import PageNumberPagination
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openzaak.utils.permissions import AuthRequired
+from openzaak.utils.viewsets import CheckQueryParamsMixin
 
 from ...models import RolType
 from ..filters import RolTypeFilter
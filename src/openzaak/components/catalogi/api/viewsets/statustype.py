@@ -7,10 +7,11 @@ from ...models import StatusType
 from ..filters import StatusTypeFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import StatusTypeSerializer
-from .mixins import ZaakTypeConceptMixin
+from .mixins import ResponseCacheMixin, ZaakTypeConceptMixin
 
 
 class StatusTypeViewSet(
+    ResponseCacheMixin,
     ZaakTypeConceptMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
@@ -1,18 +1,33 @@
-from rest_framework import mixins, viewsets
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import prefetch_related_objects
+
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.serializers import ListSerializer, ValidationError
+from rest_framework.settings import api_settings
+from vng_api_common.serializers import FoutSerializer, ValidatieFoutSerializer
 
 from openzaak.utils.permissions import AuthRequired
+from openzaak.utils.viewsets import ETagMixin, MultiGetMixin
 
 from ...models import ZaakType
+from ...versioning import create_new_version
 from ..filters import ZaakTypeFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
-from ..serializers import ZaakTypeSerializer
-from .mixins import ConceptMixin, M2MConceptCreateMixin
+from ..serializers import ZaakTypeNewVersionSerializer, ZaakTypeSerializer
+from .mixins import ConceptMixin, M2MConceptCreateMixin, ResponseCacheMixin
 
 
 class ZaakTypeViewSet(
+    MultiGetMixin,
+    ResponseCacheMixin,
     ConceptMixin,
     M2MConceptCreateMixin,
+    ETagMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -59,6 +74,14 @@ class ZaakTypeViewSet(
     Verwijder een ZAAKTYPE.
 
     Verwijder een ZAAKTYPE. Dit kan alleen als het een concept betreft.
+
+    new_version:
+    Maak een nieuwe versie van een ZAAKTYPE aan.
+
+    Maak een concept-kopie van een gepubliceerd ZAAKTYPE, met al zijn
+    STATUSTYPEn, RESULTAATTYPEn, ROLTYPEn, EIGENSCHAPpen, ZAAKOBJECTTYPEn en
+    relaties met INFORMATIEOBJECTTYPEn en BESLUITTYPEn. De nieuwe versie is
+    geldig vanaf `beginGeldigheid`, het ZAAKTYPE tot de dag ervoor.
     """
 
     queryset = ZaakType.objects.prefetch_related(
@@ -79,8 +102,91 @@ class ZaakTypeViewSet(
     required_scopes = {
         "list": SCOPE_ZAAKTYPES_READ,
         "retrieve": SCOPE_ZAAKTYPES_READ,
+        "_multiget": SCOPE_ZAAKTYPES_READ,
         "create": SCOPE_ZAAKTYPES_WRITE,
         "destroy": SCOPE_ZAAKTYPES_WRITE,
         "publish": SCOPE_ZAAKTYPES_WRITE,
+        "new_version": SCOPE_ZAAKTYPES_WRITE,
     }
     concept_related_fields = ["besluittype_set"]
+
+    @swagger_auto_schema(
+        request_body=ZaakTypeNewVersionSerializer,
+        responses={
+            status.HTTP_201_CREATED: ZaakTypeSerializer,
+            status.HTTP_400_BAD_REQUEST: openapi.Response(
+                "Bad request", schema=ValidatieFoutSerializer
+            ),
+            status.HTTP_401_UNAUTHORIZED: openapi.Response(
+                "Unauthorized", schema=FoutSerializer
+            ),
+            status.HTTP_403_FORBIDDEN: openapi.Response(
+                "Forbidden", schema=FoutSerializer
+            ),
+            status.HTTP_404_NOT_FOUND: openapi.Response(
+                "Not found", schema=FoutSerializer
+            ),
+            status.HTTP_406_NOT_ACCEPTABLE: openapi.Response(
+                "Not acceptable", schema=FoutSerializer
+            ),
+            status.HTTP_410_GONE: openapi.Response("Gone", schema=FoutSerializer),
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: openapi.Response(
+                "Unsupported media type", schema=FoutSerializer
+            ),
+            status.HTTP_429_TOO_MANY_REQUESTS: openapi.Response(
+                "Throttled", schema=FoutSerializer
+            ),
+            status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
+                "Internal server error", schema=FoutSerializer
+            ),
+        },
+    )
+    @action(detail=True, methods=["post"])
+    def new_version(self, request, *args, **kwargs):
+        zaaktype = self.get_object()
+        input_serializer = ZaakTypeNewVersionSerializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+
+        try:
+            new_version = create_new_version(
+                zaaktype, input_serializer.validated_data.get("begin_geldigheid")
+            )
+        except DjangoValidationError as exc:
+            raise ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: exc.messages}, code=exc.code
+            )
+
+        serializer = self.get_serializer(new_version)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # the related objects are only loaded for the zaaktypen that are not
+        # output from their materialized representation, see get_serializer
+        if self.action in ("list", "retrieve", "_multiget"):
+            queryset = queryset.prefetch_related(None)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        if self.action not in ("list", "retrieve", "_multiget"):
+            return serializer
+        if serializer.instance is None:
+            return serializer
+
+        if isinstance(serializer, ListSerializer):
+            serializer.instance = instances = list(serializer.instance)
+            uses_materialized = serializer.child.uses_materialized()
+        else:
+            instances = [serializer.instance]
+            uses_materialized = serializer.uses_materialized()
+
+        prefetch_related_objects(
+            [
+                instance
+                for instance in instances
+                if not (uses_materialized and instance.materialized)
+            ],
+            *self.serializer_class.Meta.prefetch_related,
+        )
+        return serializer
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class CatalogiConfig(AppConfig):
+    name = "openzaak.components.catalogi"
+
+    def ready(self):
+        from . import signals  # noqa
@@ -0,0 +1,81 @@
+"""
+Cache the rendered responses of published catalogi resources.
+
+Published types rarely change, so their detail and list responses are cached
+in the shared ``default`` cache, keyed on the resource, the query string, the
+API version and the authorization class of the client, see
+:class:`openzaak.components.catalogi.api.viewsets.mixins.ResponseCacheMixin`.
+
+The entries are stamped with the generation of the catalogi. Any change in the
+catalogi (publishing, admin edits, deleting concepts...) starts a new
+generation, see :mod:`openzaak.components.catalogi.signals`, after which the
+entries of older generations are no longer used. A representation includes
+related objects, so invalidating everything at once is the only way to be
+sure, and changes in the catalogi are rare enough for this to be cheap.
+
+The generation and the entry are fetched in a single round-trip.
+"""
+import hashlib
+import logging
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from openzaak.utils.models import get_next_row_version
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "catalogi:responses"
+GENERATION_KEY = f"{CACHE_KEY_PREFIX}:generation"
+
+
+class CachedResponse(NamedTuple):
+    generation: int
+    content: bytes
+    content_type: str
+    etag: Optional[str]
+
+
+def get_cache_key(*parts: str) -> str:
+    digest = hashlib.md5("|".join(parts).encode("utf-8")).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{digest}"
+
+
+def get_generation() -> int:
+    cache = caches["default"]
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, get_next_row_version(), timeout=None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def get_cached(key: str) -> Optional[CachedResponse]:
+    """
+    Retrieve the response cached under ``key``, if it's of the current generation.
+    """
+    values = caches["default"].get_many([GENERATION_KEY, key])
+    entry = values.get(key)
+    if entry is None or entry[0] != values.get(GENERATION_KEY):
+        return None
+    return CachedResponse(*entry)
+
+
+def store(key: str, entry: CachedResponse) -> None:
+    caches["default"].set(
+        key, tuple(entry), timeout=settings.CATALOGI_RESPONSE_CACHE_TIMEOUT
+    )
+
+
+def invalidate() -> None:
+    logger.debug("Invalidating cached catalogi responses")
+
+    def _bump():
+        caches["default"].set(GENERATION_KEY, get_next_row_version(), timeout=None)
+
+    _bump()
+    # concurrent requests may have cached the old state again before the
+    # changes were committed - start another generation after the commit
+    transaction.on_commit(_bump)
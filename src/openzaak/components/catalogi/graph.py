@@ -0,0 +1,104 @@
+"""
+Immutable snapshots of the graph of published zaaktypen.
+
+Writes in the Zaken and Besluiten API validate the related objects against the
+zaaktype of the zaak: whether the informatieobjecttype and besluittype are
+related to it. A :class:`ZaakTypeGraph` holds the primary keys of these, so
+that the validators can check them without queries.
+
+The snapshots of published zaaktypen are kept in an in-process LRU. They carry
+the row version of the zaaktype, which is bumped whenever the graph changes,
+see :mod:`openzaak.components.catalogi.signals`. Snapshots are evicted when
+the zaaktype or a related object changes, in the other workers through
+:mod:`openzaak.utils.invalidation`, and a snapshot that is older than a
+zaaktype at hand is rebuilt.
+"""
+import logging
+from typing import FrozenSet, Iterable, List, NamedTuple, Union
+
+from django.conf import settings
+from django.db import transaction
+
+from openzaak.utils import invalidation
+from openzaak.utils.cache import LRUCache
+
+from .models import BesluitType, ZaakInformatieobjectType, ZaakType
+
+logger = logging.getLogger(__name__)
+
+GRAPH_TOPIC = "catalogi-graph"
+
+local_cache = invalidation.track(
+    LRUCache(
+        maxsize=settings.CATALOGI_GRAPH_CACHE_SIZE,
+        timeout=settings.CATALOGI_GRAPH_CACHE_TIMEOUT,
+    )
+)
+
+
+class ZaakTypeGraph(NamedTuple):
+    pk: int
+    row_version: int
+    concept: bool
+    # only the published ones
+    informatieobjecttypen: FrozenSet[int]
+    besluittypen: FrozenSet[int]
+
+
+def _build(zaaktype_id: int) -> ZaakTypeGraph:
+    zaaktype = ZaakType.objects.values("concept", "row_version").get(pk=zaaktype_id)
+
+    return ZaakTypeGraph(
+        pk=zaaktype_id,
+        row_version=zaaktype["row_version"],
+        concept=zaaktype["concept"],
+        informatieobjecttypen=frozenset(
+            ZaakInformatieobjectType.objects.filter(
+                zaaktype_id=zaaktype_id, informatieobjecttype__concept=False
+            ).values_list("informatieobjecttype_id", flat=True)
+        ),
+        besluittypen=frozenset(
+            BesluitType.zaaktypes.through.objects.filter(
+                zaaktype_id=zaaktype_id
+            ).values_list("besluittype_id", flat=True)
+        ),
+    )
+
+
+def get_graph(zaaktype: Union[int, ZaakType]) -> ZaakTypeGraph:
+    """
+    Retrieve the graph of ``zaaktype``, given as instance or primary key.
+    """
+    if isinstance(zaaktype, ZaakType):
+        zaaktype_id, row_version = zaaktype.pk, zaaktype.row_version
+    else:
+        zaaktype_id, row_version = zaaktype, None
+
+    graph = local_cache.get(zaaktype_id)
+    if graph is not None and (row_version is None or graph.row_version >= row_version):
+        return graph
+
+    graph = _build(zaaktype_id)
+    # concepts are still being edited
+    if not graph.concept:
+        local_cache.set(zaaktype_id, graph)
+    return graph
+
+
+@invalidation.register(GRAPH_TOPIC)
+def _forget(zaaktype_ids: List[int]) -> None:
+    for zaaktype_id in zaaktype_ids:
+        local_cache.delete(zaaktype_id)
+
+
+def invalidate(zaaktype_ids: Iterable[int]) -> None:
+    zaaktype_ids = sorted(set(zaaktype_ids))
+    if not zaaktype_ids:
+        return
+
+    logger.debug("Invalidating cached graphs of zaaktypen %r", zaaktype_ids)
+    _forget(zaaktype_ids)
+    # concurrent requests may have cached the old state again before the
+    # changes were committed
+    transaction.on_commit(lambda: _forget(zaaktype_ids))
+    invalidation.publish(GRAPH_TOPIC, zaaktype_ids)
@@ -0,0 +1,187 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from ...models import (
+    Eigenschap,
+    ResultaatType,
+    RolType,
+    StatusType,
+    ZaakInformatieobjectType,
+    ZaakObjectType,
+    ZaakType,
+)
+from ...versioning import create_new_version
+
+# the number of related objects of every zaaktype
+SIZES = {
+    "statustypen": 8,
+    "roltypen": 5,
+    "eigenschappen": 10,
+    "resultaattypen": 6,
+    "informatieobjecttypen": 10,
+    "zaakobjecttypen": 3,
+}
+
+COPIED_MODELS = {
+    StatusType: "zaaktype",
+    RolType: "zaaktype",
+    Eigenschap: "zaaktype",
+    ResultaatType: "zaaktype",
+    ZaakInformatieobjectType: "zaaktype",
+    ZaakObjectType: "is_relevant_voor",
+}
+
+
+def create_catalogus(count: int):
+    """
+    Create a catalogus with ``count`` published zaaktypen of typical size.
+    """
+    from ...tests.factories import (
+        BesluitTypeFactory,
+        CatalogusFactory,
+        EigenschapFactory,
+        InformatieObjectTypeFactory,
+        ResultaatTypeFactory,
+        RolTypeFactory,
+        StatusTypeFactory,
+        ZaakObjectTypeFactory,
+        ZaakTypeFactory,
+    )
+    from ...tests.factories.relatieklassen import ZaakInformatieobjectTypeFactory
+
+    catalogus = CatalogusFactory.create()
+    informatieobjecttypen = InformatieObjectTypeFactory.create_batch(
+        SIZES["informatieobjecttypen"] * 5,
+        catalogus=catalogus,
+        concept=False,
+        zaaktypes=None,
+    )
+
+    zaaktypen = []
+    for i in range(count):
+        zaaktype = ZaakTypeFactory.create(
+            catalogus=catalogus,
+            concept=False,
+            zaaktype_omschrijving=f"Zaaktype {i}",
+            datum_begin_geldigheid=date(2018, 1, 1),
+            versiedatum=date(2018, 1, 1),
+        )
+        roltypen = [
+            RolTypeFactory.create(zaaktype=zaaktype, omschrijving=f"Roltype {j}")
+            for j in range(SIZES["roltypen"])
+        ]
+        statustypen = [
+            StatusTypeFactory.create(
+                zaaktype=zaaktype, statustypevolgnummer=volgnummer, roltypen=roltypen
+            )
+            for volgnummer in range(1, SIZES["statustypen"] + 1)
+        ]
+        eigenschappen = EigenschapFactory.create_batch(
+            SIZES["eigenschappen"], zaaktype=zaaktype, statustype=statustypen[0]
+        )
+        ziots = [
+            ZaakInformatieobjectTypeFactory.create(
+                zaaktype=zaaktype,
+                informatieobjecttype=informatieobjecttypen[
+                    (i + j) % len(informatieobjecttypen)
+                ],
+                volgnummer=j,
+                statustype=statustypen[-1],
+            )
+            for j in range(1, SIZES["informatieobjecttypen"] + 1)
+        ]
+        for j in range(SIZES["zaakobjecttypen"]):
+            ZaakObjectTypeFactory.create(
+                is_relevant_voor=zaaktype,
+                objecttype=f"Objecttype {j}",
+                ander_objecttype=True,
+            )
+        resultaattypen = [
+            ResultaatTypeFactory.create(
+                zaaktype=zaaktype,
+                omschrijving=f"Resultaattype {j}",
+                heeft_voor_brondatum_archiefprocedure_relevante=eigenschappen[0],
+            )
+            for j in range(SIZES["resultaattypen"])
+        ]
+        for resultaattype in resultaattypen:
+            resultaattype.heeft_verplichte_ziot.set(ziots[:2])
+        zaaktypen.append(zaaktype)
+
+    # every besluittype is related to a tenth of the zaaktypen
+    for i in range(10):
+        BesluitTypeFactory.create(
+            catalogus=catalogus,
+            omschrijving=f"Besluittype {i}",
+            zaaktypes=zaaktypen[i::10],
+            resultaattypes=[
+                zaaktype.resultaattypen.first() for zaaktype in zaaktypen[i::10]
+            ],
+        )
+
+    return catalogus
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure creating a new version of every zaaktype in a catalogus. The "
+        "catalogus is created in a transaction that is rolled back afterwards."
+    )
+    requires_system_checks = False
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--zaaktypen",
+            type=int,
+            default=200,
+            help="Number of zaaktypen in the catalogus",
+        )
+
+    def handle(self, **options):
+        # the test factories are a development dependency
+        try:
+            from ...tests import factories  # noqa
+        except ImportError as exc:
+            raise CommandError(
+                "The benchmark requires the development dependencies "
+                "(factory-boy), install them with "
+                "`pip install -r requirements/dev.txt`."
+            ) from exc
+
+        with transaction.atomic():
+            self.stdout.write("Creating catalogus...")
+            catalogus = create_catalogus(options["zaaktypen"])
+            zaaktypen = list(ZaakType.objects.filter(catalogus=catalogus))
+
+            durations = []
+            new_versions = []
+            with CaptureQueriesContext(connection) as context:
+                for zaaktype in zaaktypen:
+                    start = time.perf_counter()
+                    new_versions.append(create_new_version(zaaktype, date(2020, 1, 1)))
+                    durations.append(time.perf_counter() - start)
+
+            copied = sum(
+                model.objects.filter(**{f"{field}__in": new_versions}).count()
+                for model, field in COPIED_MODELS.items()
+            )
+            transaction.set_rollback(True)
+
+        count = len(zaaktypen)
+        durations.sort()
+        self.stdout.write(f"zaaktypen:              {count:>10}")
+        self.stdout.write(f"objects per zaaktype:   {copied / count:>10.1f}")
+        self.stdout.write(
+            f"queries per zaaktype:   {len(context.captured_queries) / count:>10.1f}"
+        )
+        self.stdout.write(f"total (s):              {sum(durations):>10.2f}")
+        self.stdout.write(
+            f"mean per zaaktype (ms): {sum(durations) / count * 1000:>10.1f}"
+        )
+        self.stdout.write(
+            f"p95 per zaaktype (ms):  {durations[int(count * 0.95)] * 1000:>10.1f}"
+        )
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ...api.materialized import materialize
+from ...models import ZaakType
+
+
+class Command(BaseCommand):
+    help = (
+        "Store the representation of the published zaaktypen, e.g. for the "
+        "zaaktypen that were published before they were materialized."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="Only materialize the zaaktypen without stored representation",
+        )
+
+    def handle(self, **options):
+        zaaktypen = ZaakType.objects.filter(concept=False)
+        if options["missing"]:
+            zaaktypen = zaaktypen.filter(materialized="")
+
+        count = 0
+        for pk in zaaktypen.values_list("pk", flat=True).iterator():
+            with transaction.atomic():
+                count += len(materialize([pk]))
+
+        if options["verbosity"] > 0:
+            self.stdout.write(f"Materialized {count} zaaktypen")
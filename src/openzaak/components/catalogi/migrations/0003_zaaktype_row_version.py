@@ -0,0 +1,21 @@
+# Generated by Django 2.2.4 on 2026-10-18 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("catalogi", "0002_auto_20190911_1520")]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaaktype",
+            name="row_version",
+            field=models.BigIntegerField(
+                default=0,
+                editable=False,
+                help_text="Changes whenever the API representation of the object changes.",
+                verbose_name="row version",
+            ),
+        )
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 2.2.4 on 2026-10-18 23:55
+
+from django.db import migrations, models
+from django.db.models import Case, F, Max, OuterRef, Subquery, Value, When
+
+
+def update_eindstatus(apps, _):
+    StatusType = apps.get_model("catalogi", "StatusType")
+
+    max_volgnummer = (
+        StatusType.objects.filter(zaaktype=OuterRef("zaaktype"))
+        .order_by()
+        .values("zaaktype")
+        .annotate(result=Max("statustypevolgnummer"))
+        .values("result")
+    )
+    StatusType.objects.update(zaaktype_max_volgnummer=Subquery(max_volgnummer))
+    StatusType.objects.update(
+        is_eindstatus=Case(
+            When(statustypevolgnummer=F("zaaktype_max_volgnummer"), then=Value(True)),
+            default=Value(False),
+            output_field=models.BooleanField(),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("catalogi", "0003_zaaktype_row_version")]
+
+    operations = [
+        migrations.AddField(
+            model_name="statustype",
+            name="is_eindstatus",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                help_text="Geeft aan dat dit STATUSTYPE een eindstatus betreft. Dit gegeven is afgeleid uit alle STATUSTYPEn van dit ZAAKTYPE met het hoogste volgnummer.",
+                verbose_name="is eindstatus",
+            ),
+        ),
+        migrations.AddField(
+            model_name="statustype",
+            name="zaaktype_max_volgnummer",
+            field=models.PositiveSmallIntegerField(
+                editable=False,
+                help_text="Het hoogste volgnummer van de STATUSTYPEn van het ZAAKTYPE.",
+                null=True,
+                verbose_name="hoogste volgnummer van het zaaktype",
+            ),
+        ),
+        migrations.RunPython(update_eindstatus, migrations.RunPython.noop),
+    ]
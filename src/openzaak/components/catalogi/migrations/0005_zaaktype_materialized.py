@@ -0,0 +1,21 @@
+# Generated by Django 2.2.4 on 2026-10-19 00:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("catalogi", "0004_statustype_is_eindstatus")]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaaktype",
+            name="materialized",
+            field=models.TextField(
+                blank=True,
+                editable=False,
+                help_text="The rendered API representation of the published ZAAKTYPE, for a placeholder host.",
+                verbose_name="materialized representation",
+            ),
+        )
+    ]
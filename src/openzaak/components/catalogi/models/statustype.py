@@ -2,7 +2,7 @@ import uuid
 
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.db.models import Max
+from django.db.models import Case, F, Max, OuterRef, Subquery, Value, When
 from django.utils.translation import ugettext_lazy as _
 
 
@@ -50,6 +50,30 @@ class CheckListItem(models.Model):
     )
 
 
+class StatusTypeQuerySet(models.QuerySet):
+    def update_eindstatus(self) -> int:
+        """
+        Store the highest volgnummer of the zaaktype and the eindstatus flag.
+        """
+        max_volgnummer = (
+            self.model._default_manager.filter(zaaktype=OuterRef("zaaktype"))
+            .order_by()
+            .values("zaaktype")
+            .annotate(result=Max("statustypevolgnummer"))
+            .values("result")
+        )
+        self.update(zaaktype_max_volgnummer=Subquery(max_volgnummer))
+        return self.update(
+            is_eindstatus=Case(
+                When(
+                    statustypevolgnummer=F("zaaktype_max_volgnummer"), then=Value(True)
+                ),
+                default=Value(False),
+                output_field=models.BooleanField(),
+            )
+        )
+
+
 class StatusType(models.Model):
     """
     Generieke aanduiding van de aard van een STATUS
@@ -146,6 +170,24 @@ class StatusType(models.Model):
         help_text=_("Een eventuele toelichting op dit STATUSTYPE."),
     )
 
+    # maintained when statustypen are added or removed, see
+    # :func:`openzaak.components.catalogi.signals.update_eindstatus`
+    is_eindstatus = models.BooleanField(
+        _("is eindstatus"),
+        default=False,
+        editable=False,
+        help_text=_(
+            "Geeft aan dat dit STATUSTYPE een eindstatus betreft. Dit gegeven is "
+            "afgeleid uit alle STATUSTYPEn van dit ZAAKTYPE met het hoogste volgnummer."
+        ),
+    )
+    zaaktype_max_volgnummer = models.PositiveSmallIntegerField(
+        _("hoogste volgnummer van het zaaktype"),
+        null=True,
+        editable=False,
+        help_text=_("Het hoogste volgnummer van de STATUSTYPEn van het ZAAKTYPE."),
+    )
+
     # TODO: deze relatie is gedefinieerd op RolType en heeft de volgende regel:
     #  De relatiesoort ontstaat en eindigt alleen (materiële historie) op een datum die gelijk is resp. een dag
     # ligt voor een Versiedatum van het gerelateerd zaaktype.er is een regel voor deze relatie
@@ -158,23 +200,12 @@ class StatusType(models.Model):
         ),
     )
 
+    objects = StatusTypeQuerySet.as_manager()
+
     class Meta:
         unique_together = ("zaaktype", "statustypevolgnummer")
         verbose_name = _("Statustype")
         verbose_name_plural = _("Statustypen")
 
-    def is_eindstatus(self):
-        """
-        Een `StatusType` betreft een eindstatus als het volgnummer van het
-        `StatusType` de hoogste is binnen het `ZaakType`.
-
-        # TODO: Can be cached on the model.
-        """
-        max_statustypevolgnummer = self.zaaktype.statustypen.aggregate(
-            result=Max("statustypevolgnummer")
-        )["result"]
-
-        return max_statustypevolgnummer == self.statustypevolgnummer
-
     def __str__(self):
         return "{} - {}".format(self.zaaktype, self.statustypevolgnummer)
@@ -12,6 +12,8 @@ from vng_api_common.descriptors import GegevensGroepType
 from vng_api_common.fields import DaysDurationField, VertrouwelijkheidsAanduidingField
 from vng_api_common.models import APIMixin
 
+from openzaak.utils.models import RowVersionMixin
+
 from ..constants import InternExtern
 from .mixins import ConceptMixin, GeldigheidMixin
 
@@ -241,7 +243,7 @@ class BronZaakType(models.Model):
         verbose_name_plural = _("Bron zaaktypen")
 
 
-class ZaakType(APIMixin, ConceptMixin, GeldigheidMixin, models.Model):
+class ZaakType(APIMixin, ConceptMixin, GeldigheidMixin, RowVersionMixin, models.Model):
     """
     Het geheel van karakteristieke eigenschappen van zaken van eenzelfde soort
 
@@ -551,6 +553,17 @@ class ZaakType(APIMixin, ConceptMixin, GeldigheidMixin, models.Model):
         help_text=_("URL-referentie naar de CATALOGUS waartoe dit ZAAKTYPE behoort."),
     )
 
+    # see :mod:`openzaak.components.catalogi.api.materialized`
+    materialized = models.TextField(
+        _("materialized representation"),
+        blank=True,
+        editable=False,
+        help_text=_(
+            "The rendered API representation of the published ZAAKTYPE, "
+            "for a placeholder host."
+        ),
+    )
+
     class Meta:
         verbose_name = _("Zaaktype")
         verbose_name_plural = _("Zaaktypen")
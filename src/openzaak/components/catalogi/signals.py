@@ -0,0 +1,204 @@
+from typing import Optional, Set
+
+from django.db.models import Model
+from django.db.models.base import ModelBase
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from openzaak.utils.models import bump_row_version
+from openzaak.utils.resources import forget_resource
+
+from . import cache, graph
+from .api.materialized import materialize
+from .models import (
+    BesluitType,
+    Eigenschap,
+    InformatieObjectType,
+    ResultaatType,
+    RolType,
+    StatusType,
+    ZaakInformatieobjectType,
+    ZaakType,
+    ZaakTypenRelatie,
+)
+
+
+@receiver(
+    [post_save, post_delete], sender=ZaakType, dispatch_uid="catalogi.forget_zaaktype"
+)
+@receiver(
+    [post_save, post_delete],
+    sender=InformatieObjectType,
+    dispatch_uid="catalogi.forget_informatieobjecttype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=BesluitType,
+    dispatch_uid="catalogi.forget_besluittype",
+)
+def forget_type(sender: ModelBase, instance: Model, **kwargs) -> None:
+    """
+    Drop the memoized URL of types referenced by authorizations.
+    """
+    forget_resource(instance)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakType,
+    dispatch_uid="catalogi.forget_zaaktype_graph",
+)
+@receiver(
+    post_save,
+    sender=InformatieObjectType,
+    dispatch_uid="catalogi.forget_informatieobjecttype_graphs",
+)
+def forget_graphs(sender: ModelBase, instance: Model, **kwargs) -> None:
+    """
+    Drop the cached graphs of the zaaktype or the zaaktypen related to it.
+
+    The graphs only hold the published informatieobjecttypen, so the row
+    version of the related zaaktypen is bumped too, which makes the workers
+    that missed the invalidation rebuild their graphs.
+    """
+    if sender is ZaakType:
+        graph.invalidate([instance.pk])
+        return
+
+    if kwargs.get("raw"):
+        return
+    zaaktype_ids = list(instance.zaaktypes.values_list("pk", flat=True))
+    bump_row_version(ZaakType.objects.filter(pk__in=zaaktype_ids))
+    graph.invalidate(zaaktype_ids)
+
+
+@receiver(post_save, sender=ZaakType, dispatch_uid="catalogi.materialize_zaaktype")
+def materialize_zaaktype(sender: ModelBase, instance: ZaakType, **kwargs) -> None:
+    """
+    Store the representation of the zaaktype once it's published.
+    """
+    if kwargs.get("raw") or instance.concept:
+        return
+    instance.materialized = materialize([instance.pk]).get(instance.pk, "")
+
+
+@receiver(
+    [post_save, post_delete], sender=StatusType, dispatch_uid="catalogi.bump_statustype"
+)
+@receiver(
+    [post_save, post_delete], sender=Eigenschap, dispatch_uid="catalogi.bump_eigenschap"
+)
+@receiver(
+    [post_save, post_delete], sender=RolType, dispatch_uid="catalogi.bump_roltype"
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ResultaatType,
+    dispatch_uid="catalogi.bump_resultaattype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakInformatieobjectType,
+    dispatch_uid="catalogi.bump_zaakinformatieobjecttype",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=ZaakTypenRelatie,
+    dispatch_uid="catalogi.bump_zaaktypenrelatie",
+)
+def bump_zaaktype(sender: ModelBase, instance: Model, **kwargs) -> None:
+    """
+    Bump the row version of the zaaktype the related object is output with,
+    and update its materialized representation.
+    """
+    if kwargs.get("raw"):
+        return
+    bump_row_version(ZaakType.objects.filter(pk=instance.zaaktype_id))
+    graph.invalidate([instance.zaaktype_id])
+    materialize([instance.zaaktype_id])
+
+
+@receiver(pre_save, sender=StatusType, dispatch_uid="catalogi.track_zaaktype")
+def track_zaaktype(sender: ModelBase, instance: StatusType, **kwargs) -> None:
+    """
+    Remember the zaaktype before the update, the statustype may be moved.
+    """
+    if not instance.pk or kwargs["raw"]:
+        return
+
+    instance._old_zaaktype_id = (
+        StatusType.objects.filter(pk=instance.pk)
+        .values_list("zaaktype_id", flat=True)
+        .first()
+    )
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=StatusType,
+    dispatch_uid="catalogi.update_eindstatus",
+)
+def update_eindstatus(
+    sender: ModelBase, instance: StatusType, created: bool = None, **kwargs
+) -> None:
+    """
+    Maintain the eindstatus flag of the statustypen of the zaaktype, and of the
+    zaaktype the statustype was moved from.
+    """
+    if kwargs.get("raw"):
+        return
+
+    zaaktype_ids = {instance.zaaktype_id, getattr(instance, "_old_zaaktype_id", None)}
+    StatusType.objects.filter(zaaktype_id__in=zaaktype_ids).update_eindstatus()
+    if created is not None:
+        instance.refresh_from_db(fields=["is_eindstatus", "zaaktype_max_volgnummer"])
+
+
+@receiver(
+    m2m_changed,
+    sender=BesluitType.zaaktypes.through,
+    dispatch_uid="catalogi.bump_besluittype_zaaktypes",
+)
+def bump_besluittype_zaaktypes(
+    sender: ModelBase,
+    instance: Model,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[Set[int]],
+    **kwargs
+) -> None:
+    """
+    Bump the row version of the zaaktypen that besluittypen are (un)linked to,
+    and update their materialized representation.
+    """
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if reverse:
+        zaaktype_ids = [instance.pk]
+    elif action == "pre_clear":
+        zaaktype_ids = list(instance.zaaktypes.values_list("pk", flat=True))
+    else:
+        zaaktype_ids = list(pk_set)
+
+    bump_row_version(ZaakType.objects.filter(pk__in=zaaktype_ids))
+    graph.invalidate(zaaktype_ids)
+    if action == "pre_clear":
+        # rendered live until the besluittypen are linked again
+        ZaakType.objects.filter(pk__in=zaaktype_ids).update(materialized="")
+    else:
+        materialize(zaaktype_ids)
+
+
+@receiver(
+    [post_save, post_delete, m2m_changed], dispatch_uid="catalogi.invalidate_responses"
+)
+def invalidate_responses(sender: ModelBase, **kwargs) -> None:
+    """
+    Drop the cached responses on any change in the catalogi.
+    """
+    if sender._meta.app_label != "catalogi":
+        return
+    if not kwargs.get("action", "post_").startswith("post_"):
+        return
+    cache.invalidate()
@@ -0,0 +1,107 @@
+"""
+Cached graphs of zaaktypen, see :mod:`openzaak.components.catalogi.graph`.
+"""
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from ..graph import get_graph, local_cache
+from ..models import ZaakType
+from .factories import BesluitTypeFactory, InformatieObjectTypeFactory, ZaakTypeFactory
+from .factories.relatieklassen import ZaakInformatieobjectTypeFactory
+
+
+class ZaakTypeGraphTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        local_cache.clear()
+        self.addCleanup(local_cache.clear)
+
+        self.zaaktype = ZaakTypeFactory.create(concept=False)
+
+    def test_graph(self):
+        published = ZaakInformatieobjectTypeFactory.create(
+            zaaktype=self.zaaktype, informatieobjecttype__concept=False
+        )
+        ZaakInformatieobjectTypeFactory.create(
+            zaaktype=self.zaaktype, informatieobjecttype__concept=True
+        )
+        besluittype = BesluitTypeFactory.create(zaaktypes=[self.zaaktype])
+
+        graph = get_graph(self.zaaktype.pk)
+
+        self.assertEqual(
+            graph.informatieobjecttypen, {published.informatieobjecttype_id}
+        )
+        self.assertEqual(graph.besluittypen, {besluittype.pk})
+
+    def test_cached(self):
+        get_graph(self.zaaktype.pk)
+
+        with self.assertNumQueries(0):
+            get_graph(self.zaaktype.pk)
+
+    def test_concept_not_cached(self):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+        get_graph(zaaktype.pk)
+
+        self.assertIsNone(local_cache.get(zaaktype.pk))
+
+    def test_invalidated_on_change(self):
+        self.assertEqual(get_graph(self.zaaktype.pk).informatieobjecttypen, set())
+
+        ziot = ZaakInformatieobjectTypeFactory.create(
+            zaaktype=self.zaaktype, informatieobjecttype__concept=False
+        )
+
+        self.assertEqual(
+            get_graph(self.zaaktype.pk).informatieobjecttypen,
+            {ziot.informatieobjecttype_id},
+        )
+
+    def test_invalidated_on_publish_informatieobjecttype(self):
+        informatieobjecttype = InformatieObjectTypeFactory.create(
+            concept=True, zaaktypes=None
+        )
+        ZaakInformatieobjectTypeFactory.create(
+            zaaktype=self.zaaktype, informatieobjecttype=informatieobjecttype
+        )
+        self.assertEqual(get_graph(self.zaaktype.pk).informatieobjecttypen, set())
+
+        informatieobjecttype.concept = False
+        informatieobjecttype.save()
+
+        self.assertEqual(
+            get_graph(self.zaaktype.pk).informatieobjecttypen, {informatieobjecttype.pk}
+        )
+
+    def test_outdated_version(self):
+        get_graph(self.zaaktype.pk)
+        # e.g. changed on another node, and the event was missed
+        local_cache.set(
+            self.zaaktype.pk, local_cache.get(self.zaaktype.pk)._replace(row_version=0)
+        )
+
+        zaaktype = ZaakType.objects.get(pk=self.zaaktype.pk)
+
+        self.assertEqual(get_graph(zaaktype).row_version, zaaktype.row_version)
+
+    def test_outdated_after_publish_informatieobjecttype(self):
+        informatieobjecttype = InformatieObjectTypeFactory.create(
+            concept=True, zaaktypes=None
+        )
+        ZaakInformatieobjectTypeFactory.create(
+            zaaktype=self.zaaktype, informatieobjecttype=informatieobjecttype
+        )
+        get_graph(self.zaaktype.pk)
+
+        # e.g. published on another node, and the event was missed
+        with patch.object(local_cache, "delete"):
+            informatieobjecttype.concept = False
+            informatieobjecttype.save()
+
+        zaaktype = ZaakType.objects.get(pk=self.zaaktype.pk)
+        self.assertEqual(
+            get_graph(zaaktype).informatieobjecttypen, {informatieobjecttype.pk}
+        )
@@ -0,0 +1,95 @@
+"""
+Materialized representations of published zaaktypen, see
+:mod:`openzaak.components.catalogi.api.materialized`.
+"""
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from vng_api_common.tests import reverse
+
+from ..api.materialized import MATERIALIZED_HOST
+from ..models import ZaakType
+from .base import APITestCase
+from .factories import ResultaatTypeFactory, StatusTypeFactory, ZaakTypeFactory
+
+
+class MaterializedZaakTypeTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.zaaktype = ZaakTypeFactory.create(concept=True, catalogus=self.catalogus)
+        StatusTypeFactory.create_batch(3, zaaktype=self.zaaktype)
+        ResultaatTypeFactory.create(zaaktype=self.zaaktype)
+
+    def get(self, url: str, **params):
+        # bypass the cached responses
+        caches["default"].clear()
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(context.captured_queries)
+
+    def test_materialized_on_publish(self):
+        self.assertEqual(self.zaaktype.materialized, "")
+
+        response = self.client.post(
+            reverse("zaaktype-publish", kwargs={"uuid": self.zaaktype.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.zaaktype.refresh_from_db()
+        self.assertIn(MATERIALIZED_HOST, self.zaaktype.materialized)
+        self.assertNotIn(MATERIALIZED_HOST, response.content.decode("utf-8"))
+
+    def test_output_unchanged(self):
+        self.zaaktype.concept = False
+        self.zaaktype.save()
+        url = reverse(self.zaaktype)
+
+        materialized, materialized_queries = self.get(url)
+
+        ZaakType.objects.filter(pk=self.zaaktype.pk).update(materialized="")
+        rendered, rendered_queries = self.get(url)
+
+        self.assertEqual(materialized.json(), rendered.json())
+        self.assertEqual(
+            materialized.json()["url"], f"http://testserver{reverse(self.zaaktype)}"
+        )
+        self.assertLess(materialized_queries, rendered_queries)
+
+    def test_field_selection(self):
+        self.zaaktype.concept = False
+        self.zaaktype.save()
+
+        response, _ = self.get(reverse(self.zaaktype), fields="url,statustypen")
+
+        self.assertEqual(list(response.json()), ["url", "statustypen"])
+        self.assertEqual(len(response.json()["statustypen"]), 3)
+
+    def test_list(self):
+        self.zaaktype.concept = False
+        self.zaaktype.save()
+        ZaakTypeFactory.create(concept=True, catalogus=self.catalogus)
+
+        response, _ = self.get(reverse("zaaktype-list"), status="alles")
+
+        results = response.json()["results"]
+        self.assertEqual(len(results), 2)
+        self.assertEqual({len(result["statustypen"]) for result in results}, {0, 3})
+
+    def test_regenerated_on_edit(self):
+        self.zaaktype.concept = False
+        self.zaaktype.save()
+
+        # e.g. added in the admin
+        statustype = StatusTypeFactory.create(zaaktype=self.zaaktype)
+
+        response, _ = self.get(reverse(self.zaaktype))
+
+        self.assertIn(
+            f"http://testserver{reverse(statustype)}", response.json()["statustypen"]
+        )
@@ -0,0 +1,124 @@
+"""
+Cached responses of published catalogi resources, see
+:class:`openzaak.components.catalogi.api.viewsets.mixins.ResponseCacheMixin`.
+"""
+from django.core.cache import caches
+
+from rest_framework import status
+from vng_api_common.tests import reverse
+
+from .. import cache
+from ..models import StatusType, ZaakType
+from .base import APITestCase
+from .factories import StatusTypeFactory, ZaakTypeFactory
+
+
+class ResponseCacheTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        caches["default"].clear()
+
+    def test_published_detail_cached(self):
+        statustype = StatusTypeFactory.create(
+            statustype_omschrijving="Ontvangen", zaaktype__concept=False
+        )
+        url = reverse(statustype)
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("max-age=60", response["Cache-Control"])
+        self.assertIn("private", response["Cache-Control"])
+
+        # bypasses the signals, so the cached response is still used
+        StatusType.objects.filter(pk=statustype.pk).update(
+            statustype_omschrijving="Gewijzigd"
+        )
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["omschrijving"], "Ontvangen")
+        self.assertIn("max-age=60", response["Cache-Control"])
+
+        # e.g. an edit in the admin
+        statustype.refresh_from_db()
+        statustype.save()
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.json()["omschrijving"], "Gewijzigd")
+
+    def test_concept_not_cached(self):
+        zaaktype = ZaakTypeFactory.create(concept=True, toelichting="concept")
+        url = reverse(zaaktype)
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("no-cache", response["Cache-Control"])
+
+        ZaakType.objects.filter(pk=zaaktype.pk).update(toelichting="gewijzigd")
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.json()["toelichting"], "gewijzigd")
+
+    def test_list_invalidated_on_publish(self):
+        ZaakTypeFactory.create(concept=False, catalogus=self.catalogus)
+        concept = ZaakTypeFactory.create(concept=True, catalogus=self.catalogus)
+        list_url = reverse("zaaktype-list")
+
+        response = self.client.get(list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 1)
+        self.assertIn("max-age=60", response["Cache-Control"])
+
+        response = self.client.post(
+            reverse("zaaktype-publish", kwargs={"uuid": concept.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(list_url)
+
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_invalidated_on_delete_concept(self):
+        concept = ZaakTypeFactory.create(concept=True, catalogus=self.catalogus)
+        generation = cache.get_generation()
+
+        response = self.client.delete(reverse(concept))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertNotEqual(cache.get_generation(), generation)
+
+    def test_list_with_concepts_not_cached(self):
+        ZaakTypeFactory.create(concept=True, catalogus=self.catalogus)
+
+        response = self.client.get(reverse("zaaktype-list"), {"status": "alles"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 1)
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_cached_not_modified(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        url = reverse(zaaktype)
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_key_includes_query_string(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        url = reverse(zaaktype)
+
+        self.client.get(url)
+        response = self.client.get(url, {"fields": "url"})
+
+        self.assertEqual(list(response.json()), ["url"])
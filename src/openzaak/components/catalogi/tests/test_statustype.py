@@ -157,6 +157,58 @@ class StatusTypeAPITests(APITestCase):
 
         self.assertTrue(response_data["isEindstatus"])
 
+    def test_is_eindstatus_maintained(self):
+        zaaktype = ZaakTypeFactory.create()
+        zaaktype_url = reverse(zaaktype)
+
+        response = self.client.post(
+            reverse("statustype-list"),
+            {"omschrijving": "Ontvangen", "zaaktype": zaaktype_url, "volgnummer": 1},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(response.json()["isEindstatus"])
+        statustype_1 = StatusType.objects.get()
+
+        statustype_2 = StatusTypeFactory.create(
+            zaaktype=zaaktype, statustypevolgnummer=2
+        )
+
+        statustype_1.refresh_from_db()
+        self.assertFalse(statustype_1.is_eindstatus)
+        self.assertTrue(statustype_2.is_eindstatus)
+        self.assertEqual(statustype_1.zaaktype_max_volgnummer, 2)
+
+        statustype_2.delete()
+
+        statustype_1.refresh_from_db()
+        self.assertTrue(statustype_1.is_eindstatus)
+        self.assertEqual(statustype_1.zaaktype_max_volgnummer, 1)
+
+    def test_is_eindstatus_maintained_when_moved(self):
+        zaaktype, other_zaaktype = ZaakTypeFactory.create_batch(2)
+        statustype_1 = StatusTypeFactory.create(
+            zaaktype=zaaktype, statustypevolgnummer=1
+        )
+        statustype_2 = StatusTypeFactory.create(
+            zaaktype=zaaktype, statustypevolgnummer=2
+        )
+        other_statustype = StatusTypeFactory.create(
+            zaaktype=other_zaaktype, statustypevolgnummer=1
+        )
+
+        # e.g. in the admin
+        statustype_2.zaaktype = other_zaaktype
+        statustype_2.save()
+
+        statustype_1.refresh_from_db()
+        other_statustype.refresh_from_db()
+        self.assertTrue(statustype_1.is_eindstatus)
+        self.assertEqual(statustype_1.zaaktype_max_volgnummer, 1)
+        self.assertFalse(other_statustype.is_eindstatus)
+        self.assertTrue(statustype_2.is_eindstatus)
+        self.assertEqual(statustype_2.zaaktype_max_volgnummer, 2)
+
 
 class StatusTypeFilterAPITests(APITestCase):
     maxDiff = None
@@ -0,0 +1,173 @@
+"""
+New versions of zaaktypen, see :mod:`openzaak.components.catalogi.versioning`.
+"""
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from vng_api_common.tests import get_validation_errors, reverse
+
+from ..models import ZaakType
+from ..versioning import create_new_version
+from .base import APITestCase
+from .factories import (
+    BesluitTypeFactory,
+    EigenschapFactory,
+    EigenschapSpecificatieFactory,
+    ResultaatTypeFactory,
+    StatusTypeFactory,
+    ZaakObjectTypeFactory,
+    ZaakTypeFactory,
+)
+from .factories.relatieklassen import ZaakInformatieobjectTypeFactory
+
+
+class CreateNewVersionTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.zaaktype = ZaakTypeFactory.create(
+            concept=False,
+            datum_begin_geldigheid=date(2018, 1, 1),
+            versiedatum=date(2018, 1, 1),
+        )
+
+    def test_copies_graph(self):
+        statustype_1 = StatusTypeFactory.create(
+            zaaktype=self.zaaktype, statustypevolgnummer=1
+        )
+        statustype_2 = StatusTypeFactory.create(
+            zaaktype=self.zaaktype, statustypevolgnummer=2
+        )
+        eigenschap = EigenschapFactory.create(
+            zaaktype=self.zaaktype,
+            statustype=statustype_1,
+            specificatie_van_eigenschap=EigenschapSpecificatieFactory.create(),
+        )
+        zaakobjecttype = ZaakObjectTypeFactory.create(
+            is_relevant_voor=self.zaaktype, statustype=statustype_2
+        )
+        ziot = ZaakInformatieobjectTypeFactory.create(
+            zaaktype=self.zaaktype, statustype=statustype_2
+        )
+        resultaattype = ResultaatTypeFactory.create(
+            zaaktype=self.zaaktype,
+            heeft_voor_brondatum_archiefprocedure_relevante=eigenschap,
+        )
+        resultaattype.heeft_verplichte_zot.add(zaakobjecttype)
+        resultaattype.heeft_verplichte_ziot.add(ziot)
+        besluittype = BesluitTypeFactory.create(
+            zaaktypes=[self.zaaktype], resultaattypes=[resultaattype]
+        )
+
+        new_version = create_new_version(self.zaaktype, date(2020, 1, 1))
+
+        self.assertTrue(new_version.concept)
+        self.assertNotEqual(new_version.uuid, self.zaaktype.uuid)
+        self.assertEqual(new_version.datum_begin_geldigheid, date(2020, 1, 1))
+        self.assertEqual(new_version.versiedatum, date(2020, 1, 1))
+        self.assertIsNone(new_version.datum_einde_geldigheid)
+
+        statustypen = new_version.statustypen.order_by("statustypevolgnummer")
+        self.assertEqual(statustypen.count(), 2)
+        self.assertTrue(statustypen[1].is_eindstatus)
+        self.assertEqual(
+            set(statustypen[0].roltypen.values_list("zaaktype", flat=True)),
+            {new_version.pk},
+        )
+        self.assertEqual(new_version.roltype_set.count(), 2)
+
+        new_eigenschap = new_version.eigenschap_set.get()
+        self.assertEqual(new_eigenschap.statustype, statustypen[0])
+        self.assertNotEqual(
+            new_eigenschap.specificatie_van_eigenschap_id,
+            eigenschap.specificatie_van_eigenschap_id,
+        )
+
+        new_ziot = new_version.zaakinformatieobjecttype_set.get()
+        self.assertEqual(new_ziot.statustype, statustypen[1])
+        self.assertEqual(new_ziot.informatieobjecttype, ziot.informatieobjecttype)
+
+        new_resultaattype = new_version.resultaattypen.get()
+        self.assertEqual(
+            new_resultaattype.heeft_voor_brondatum_archiefprocedure_relevante,
+            new_eigenschap,
+        )
+        self.assertEqual(
+            new_resultaattype.heeft_verplichte_zot.get().is_relevant_voor, new_version
+        )
+        self.assertEqual(new_resultaattype.heeft_verplichte_ziot.get(), new_ziot)
+        self.assertEqual(
+            list(besluittype.zaaktypes.order_by("pk")), [self.zaaktype, new_version]
+        )
+        self.assertIn(new_resultaattype, besluittype.resultaattypes.all())
+
+        # the original is left alone
+        self.assertEqual(self.zaaktype.statustypen.count(), 2)
+        self.assertEqual(resultaattype.heeft_verplichte_ziot.get(), ziot)
+
+    def test_ends_previous_version(self):
+        create_new_version(self.zaaktype, date(2020, 1, 1))
+
+        self.zaaktype.refresh_from_db()
+        self.assertEqual(self.zaaktype.datum_einde_geldigheid, date(2019, 12, 31))
+
+    def test_queries_independent_of_size(self):
+        def count_queries(statustypen: int) -> int:
+            zaaktype = ZaakTypeFactory.create(concept=False)
+            StatusTypeFactory.create_batch(statustypen, zaaktype=zaaktype)
+            EigenschapFactory.create_batch(statustypen, zaaktype=zaaktype)
+
+            with CaptureQueriesContext(connection) as context:
+                create_new_version(zaaktype, date(2020, 1, 1))
+            return len(context.captured_queries)
+
+        self.assertEqual(count_queries(1), count_queries(10))
+
+
+class NewVersionAPITests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.zaaktype = ZaakTypeFactory.create(
+            concept=False,
+            catalogus=self.catalogus,
+            datum_begin_geldigheid=date(2018, 1, 1),
+            versiedatum=date(2018, 1, 1),
+        )
+        StatusTypeFactory.create_batch(2, zaaktype=self.zaaktype)
+        self.url = reverse("zaaktype-new-version", kwargs={"uuid": self.zaaktype.uuid})
+
+    def test_new_version(self):
+        response = self.client.post(self.url, {"beginGeldigheid": "2020-01-01"})
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        data = response.json()
+        new_version = ZaakType.objects.get(uuid=data["url"].rsplit("/", 1)[1])
+        self.assertTrue(data["concept"])
+        self.assertEqual(data["beginGeldigheid"], "2020-01-01")
+        self.assertEqual(len(data["statustypen"]), 2)
+        self.assertEqual(new_version.statustypen.count(), 2)
+
+    def test_concept(self):
+        zaaktype = ZaakTypeFactory.create(concept=True, catalogus=self.catalogus)
+
+        response = self.client.post(
+            reverse("zaaktype-new-version", kwargs={"uuid": zaaktype.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "concept")
+
+    def test_overlapping_version(self):
+        self.client.post(self.url, {"beginGeldigheid": "2020-01-01"})
+
+        response = self.client.post(self.url, {"beginGeldigheid": "2019-01-01"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "overlap")
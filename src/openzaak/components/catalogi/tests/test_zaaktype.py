@@ -313,6 +313,21 @@ class ZaakTypeAPITests(TypeCheckMixin, APITestCase):
 
         self.assertEqual(response_data["doorlooptijd"], "P30D")
 
+    def test_multiget(self):
+        zaaktype1, zaaktype2, _ = ZaakTypeFactory.create_batch(3, concept=False)
+        zaaktype2_url = f"http://testserver{reverse(zaaktype2)}"
+
+        response = self.client.post(
+            reverse("zaaktype--multiget"),
+            {"uuids": [zaaktype1.uuid], "urls": [zaaktype2_url]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            {item["url"] for item in response.json()},
+            {f"http://testserver{reverse(zaaktype1)}", zaaktype2_url},
+        )
+
 
 class ZaakTypeCreateDuplicateTests(APITestCase):
     """
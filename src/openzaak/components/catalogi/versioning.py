@@ -0,0 +1,253 @@
+"""
+New versions of zaaktypen.
+
+A new version of a zaaktype is a concept copy of the zaaktype and all of the
+objects that belong to it, which takes over from the published version at the
+begin of its geldigheid. Copying a zaaktype through the API takes a request
+and a round of validation per object, so the copies are inserted in bulk
+instead, with a query per type of object.
+
+Bulk inserts don't send signals. The copies belong to a concept, which isn't
+cached nor materialized, so the zaaktype itself is the only object that's
+saved the regular way, see :mod:`openzaak.components.catalogi.signals`.
+"""
+import uuid
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from .models import (
+    BesluitType,
+    Eigenschap,
+    EigenschapReferentie,
+    EigenschapSpecificatie,
+    ResultaatType,
+    RolType,
+    StatusType,
+    ZaakInformatieobjectType,
+    ZaakInformatieobjectTypeArchiefregime,
+    ZaakObjectType,
+    ZaakType,
+)
+
+# primary key of the original -> copy
+Copies = Dict[int, models.Model]
+
+
+def _get_copy(original: models.Model, **fields) -> models.Model:
+    """
+    Return an unsaved copy of ``original`` with a new UUID.
+
+    The ``fields`` are set on the copy, as value or as function of the original.
+    """
+    values = {
+        field.attname: getattr(original, field.attname)
+        for field in original._meta.concrete_fields
+        if not field.primary_key
+    }
+    if "uuid" in values:
+        values["uuid"] = uuid.uuid4()
+    for name, value in fields.items():
+        values[name] = value(original) if callable(value) else value
+    return type(original)(**values)
+
+
+def _copy(objects: Iterable[models.Model], **fields) -> Copies:
+    originals = list(objects)
+    if not originals:
+        return {}
+
+    copies = [_get_copy(original, **fields) for original in originals]
+    type(originals[0]).objects.bulk_create(copies)
+    return {original.pk: copy for original, copy in zip(originals, copies)}
+
+
+def _remap(copies: Copies, attname: str):
+    """
+    Point the foreign key ``attname`` of the copies to the copy of its target.
+    """
+
+    def remap(original: models.Model) -> Optional[int]:
+        pk = getattr(original, attname)
+        return copies[pk].pk if pk in copies else pk
+
+    return remap
+
+
+def _copy_links(
+    field: models.ManyToManyField,
+    copies: Copies,
+    related: Optional[Copies] = None,
+    reverse: bool = False,
+) -> None:
+    """
+    Link the copies like their originals through the many-to-many ``field``.
+
+    Links to ``related`` objects that were copied as well are pointed to their
+    copies. With ``reverse``, the copies are instances of the related model of
+    the field rather than of the model that defines it.
+    """
+    through = field.remote_field.through
+    names = [field.m2m_field_name(), field.m2m_reverse_field_name()]
+    if reverse:
+        names.reverse()
+    source, target = (through._meta.get_field(name).attname for name in names)
+    related = related or {}
+
+    links = []
+    queryset = through.objects.filter(**{f"{source}__in": list(copies)})
+    for source_id, target_id in queryset.values_list(source, target):
+        if target_id in related:
+            target_id = related[target_id].pk
+        links.append(through(**{source: copies[source_id].pk, target: target_id}))
+    through.objects.bulk_create(links)
+
+
+def validate_new_version(zaaktype: ZaakType, datum_begin_geldigheid: date) -> None:
+    if zaaktype.concept:
+        raise ValidationError(
+            _(
+                "Alleen van gepubliceerde zaaktypen kan een nieuwe versie worden "
+                "gemaakt."
+            ),
+            code="concept",
+        )
+
+    if datum_begin_geldigheid <= zaaktype.datum_begin_geldigheid:
+        raise ValidationError(
+            _(
+                "De nieuwe versie moet na de datum begin geldigheid van het "
+                "zaaktype ingaan."
+            ),
+            code="invalid-date",
+        )
+
+    overlapping = (
+        ZaakType.objects.filter(
+            Q(datum_einde_geldigheid=None)
+            | Q(datum_einde_geldigheid__gte=datum_begin_geldigheid),
+            catalogus=zaaktype.catalogus_id,
+            zaaktype_omschrijving=zaaktype.zaaktype_omschrijving,
+        )
+        .exclude(pk=zaaktype.pk)
+        .exists()
+    )
+    if overlapping:
+        raise ValidationError(
+            _("Zaaktype-omschrijving moet uniek zijn binnen de CATALOGUS."),
+            code="overlap",
+        )
+
+
+@transaction.atomic
+def create_new_version(
+    zaaktype: ZaakType, datum_begin_geldigheid: Optional[date] = None
+) -> ZaakType:
+    """
+    Copy ``zaaktype`` and its related objects into a new concept version.
+
+    The new version is valid from ``datum_begin_geldigheid``, today by default,
+    and ``zaaktype`` until the day before.
+    """
+    datum_begin_geldigheid = datum_begin_geldigheid or timezone.now().date()
+    # serialize the new versions of a zaaktype
+    zaaktype = ZaakType.objects.select_for_update().get(pk=zaaktype.pk)
+    validate_new_version(zaaktype, datum_begin_geldigheid)
+
+    new_version = _get_copy(
+        zaaktype,
+        concept=True,
+        versiedatum=datum_begin_geldigheid,
+        datum_begin_geldigheid=datum_begin_geldigheid,
+        datum_einde_geldigheid=None,
+        materialized="",
+        row_version=0,
+    )
+    new_version.save()
+    zaaktypen = {zaaktype.pk: new_version}
+
+    _copy_links(ZaakType._meta.get_field("formulier"), zaaktypen)
+    _copy_links(ZaakType._meta.get_field("is_deelzaaktype_van"), zaaktypen)
+    _copy_links(BesluitType._meta.get_field("zaaktypes"), zaaktypen, reverse=True)
+    _copy(zaaktype.zaaktypenrelaties.all(), zaaktype_id=new_version.pk)
+
+    roltypen = _copy(
+        RolType.objects.filter(zaaktype=zaaktype), zaaktype_id=new_version.pk
+    )
+    statustypen = _copy(zaaktype.statustypen.all(), zaaktype_id=new_version.pk)
+    _copy_links(StatusType._meta.get_field("checklistitem"), statustypen)
+    _copy_links(StatusType._meta.get_field("roltypen"), statustypen, roltypen)
+
+    # the specificaties are edited along with the eigenschappen
+    specificaties = _copy(
+        EigenschapSpecificatie.objects.filter(eigenschap__zaaktype=zaaktype).distinct()
+    )
+    referenties = _copy(
+        EigenschapReferentie.objects.filter(eigenschap__zaaktype=zaaktype).distinct()
+    )
+    eigenschappen = _copy(
+        Eigenschap.objects.filter(zaaktype=zaaktype),
+        zaaktype_id=new_version.pk,
+        statustype_id=_remap(statustypen, "statustype_id"),
+        specificatie_van_eigenschap_id=_remap(
+            specificaties, "specificatie_van_eigenschap_id"
+        ),
+        referentie_naar_eigenschap_id=_remap(
+            referenties, "referentie_naar_eigenschap_id"
+        ),
+    )
+
+    zaakobjecttypen = _copy(
+        ZaakObjectType.objects.filter(is_relevant_voor=zaaktype),
+        is_relevant_voor_id=new_version.pk,
+        statustype_id=_remap(statustypen, "statustype_id"),
+        datum_begin_geldigheid=datum_begin_geldigheid,
+        datum_einde_geldigheid=None,
+    )
+    ziots = _copy(
+        ZaakInformatieobjectType.objects.filter(zaaktype=zaaktype),
+        zaaktype_id=new_version.pk,
+        statustype_id=_remap(statustypen, "statustype_id"),
+    )
+
+    resultaattypen = _copy(
+        zaaktype.resultaattypen.all(),
+        zaaktype_id=new_version.pk,
+        heeft_voor_brondatum_archiefprocedure_relevante_id=_remap(
+            eigenschappen, "heeft_voor_brondatum_archiefprocedure_relevante_id"
+        ),
+    )
+    _copy_links(
+        ResultaatType._meta.get_field("heeft_verplichte_zot"),
+        resultaattypen,
+        zaakobjecttypen,
+    )
+    _copy_links(
+        ResultaatType._meta.get_field("heeft_verplichte_ziot"), resultaattypen, ziots
+    )
+    _copy_links(
+        BesluitType._meta.get_field("resultaattypes"), resultaattypen, reverse=True
+    )
+    _copy(
+        ZaakInformatieobjectTypeArchiefregime.objects.filter(
+            resultaattype__zaaktype=zaaktype
+        ),
+        resultaattype_id=_remap(resultaattypen, "resultaattype_id"),
+        zaak_informatieobject_type_id=_remap(ziots, "zaak_informatieobject_type_id"),
+    )
+
+    # the published version remains valid until the new version takes over
+    datum_einde_geldigheid = datum_begin_geldigheid - timedelta(days=1)
+    if (
+        zaaktype.datum_einde_geldigheid is None
+        or zaaktype.datum_einde_geldigheid > datum_einde_geldigheid
+    ):
+        zaaktype.datum_einde_geldigheid = datum_einde_geldigheid
+        zaaktype.save(update_fields=["datum_einde_geldigheid"])
+
+    return new_version
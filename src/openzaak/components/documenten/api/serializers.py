@@ -23,9 +23,11 @@ from vng_api_common.utils import get_help_text
 from vng_api_common.validators import IsImmutableValidator
 
 from openzaak.components.besluiten.models import Besluit
+from openzaak.components.catalogi.api.scopes import SCOPE_ZAAKTYPES_READ
 from openzaak.components.catalogi.models import InformatieObjectType
 from openzaak.components.zaken.models import Zaak
 from openzaak.utils.serializer_fields import LengthHyperlinkedRelatedField
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
 
 from ..constants import ChecksumAlgoritmes, OndertekeningSoorten, Statussen
 from ..models import (
@@ -138,7 +140,9 @@ class EnkelvoudigInformatieObjectHyperlinkedRelatedField(LengthHyperlinkedRelate
             self.fail("does_not_exist")
 
 
-class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class EnkelvoudigInformatieObjectSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     """
     Serializer for the EnkelvoudigInformatieObject model
     """
@@ -197,6 +201,13 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
         ),
     )
 
+    expandable_fields = {
+        "informatieobjecttype": (
+            "openzaak.components.catalogi.api.serializers.InformatieObjectTypeSerializer",
+            {"scope": SCOPE_ZAAKTYPES_READ},
+        )
+    }
+
     class Meta:
         model = EnkelvoudigInformatieObject
         fields = (
@@ -417,7 +428,9 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
         return self.instance
 
 
-class GebruiksrechtenSerializer(serializers.HyperlinkedModelSerializer):
+class GebruiksrechtenSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     informatieobject = EnkelvoudigInformatieObjectHyperlinkedRelatedField(
         view_name="enkelvoudiginformatieobject-detail",
         lookup_field="uuid",
@@ -440,7 +453,9 @@ class GebruiksrechtenSerializer(serializers.HyperlinkedModelSerializer):
         }
 
 
-class ObjectInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class ObjectInformatieObjectSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     informatieobject = EnkelvoudigInformatieObjectHyperlinkedRelatedField(
         view_name="enkelvoudiginformatieobject-detail",
         lookup_field="uuid",
@@ -5,7 +5,6 @@ from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from rest_framework.settings import api_settings
@@ -22,14 +21,21 @@ from vng_api_common.notifications.viewsets import (
     NotificationViewSetMixin,
 )
 from vng_api_common.serializers import FoutSerializer
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.pagination import CachedCount, OptionalCursorPagination
+from openzaak.utils.viewsets import (
+    CheckQueryParamsMixin,
+    ETagMixin,
+    MultiGetMixin,
+    QueryPlanMixin,
+)
 
 from ..models import (
     EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
     Gebruiksrechten,
     ObjectInformatieObject,
 )
@@ -77,8 +83,11 @@ REGISTRATIE_QUERY_PARAM = openapi.Parameter(
 
 class EnkelvoudigInformatieObjectViewSet(
     NotificationViewSetMixin,
+    MultiGetMixin,
     ListFilterByAuthorizationsMixin,
     AuditTrailViewsetMixin,
+    ETagMixin,
+    QueryPlanMixin,
     viewsets.ModelViewSet,
 ):
     """
@@ -166,13 +175,17 @@ class EnkelvoudigInformatieObjectViewSet(
     queryset = EnkelvoudigInformatieObject.objects.order_by(
         "canonical", "-versie"
     ).distinct("canonical")
+    # unique after the distinct, the latest version is selected by the ordering
+    cursor_ordering = ("canonical",)
     lookup_field = "uuid"
     serializer_class = EnkelvoudigInformatieObjectSerializer
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
+    count_strategy = CachedCount()
     permission_classes = (InformationObjectAuthRequired,)
     required_scopes = {
         "list": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "retrieve": SCOPE_DOCUMENTEN_ALLES_LEZEN,
+        "_multiget": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "create": SCOPE_DOCUMENTEN_AANMAKEN,
         "destroy": SCOPE_DOCUMENTEN_ALLES_VERWIJDEREN,
         "update": SCOPE_DOCUMENTEN_BIJWERKEN,
@@ -218,6 +231,13 @@ class EnkelvoudigInformatieObjectViewSet(
             return EnkelvoudigInformatieObjectWithLockSerializer
         return super().get_serializer_class()
 
+    def get_current_row_version(self, instance: EnkelvoudigInformatieObject) -> int:
+        # updates create a new version, so lock the document instead
+        EnkelvoudigInformatieObjectCanonical.objects.select_for_update().get(
+            pk=instance.canonical_id
+        )
+        return instance.canonical.latest_version.row_version
+
     @swagger_auto_schema(
         manual_parameters=[VERSIE_QUERY_PARAM, REGISTRATIE_QUERY_PARAM]
     )
@@ -346,7 +366,7 @@ class EnkelvoudigInformatieObjectViewSet(
     @action(detail=True, methods=["post"])
     def unlock(self, request, *args, **kwargs):
         eio = self.get_object()
-        eio_data = self.get_serializer(eio).data
+        eio_data = InformationObjectAuthRequired().format_data(eio, self.request)
         canonical = eio.canonical
 
         # check if it's a force unlock by administrator
@@ -1,17 +1,20 @@
-from typing import Dict, Tuple
-from urllib.parse import urlparse
+from typing import Dict, Iterable, Tuple
 
 from django.apps import apps
 from django.db import models
-from django.db.models import Case, IntegerField, Value, When
 
 from vng_api_common.constants import ObjectTypes, VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
-from vng_api_common.utils import get_resource_for_path
 
+from openzaak.components.authorizations.models import CatalogusAutorisatie
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
-from openzaak.utils.query import BlockChangeMixin
+from openzaak.utils.query import (
+    BlockChangeMixin,
+    filter_max_orders,
+    get_catalogus_max_orders,
+)
+from openzaak.utils.resources import get_resource_pks
 
 from .typing import IORelation
 
@@ -20,7 +23,10 @@ class AuthorizationsFilterMixin:
     authorizations_lookup = None
 
     def filter_for_authorizations(
-        self, scope: Scope, authorizations: models.QuerySet
+        self,
+        scope: Scope,
+        authorizations: models.QuerySet,
+        catalogus_authorizations: Iterable[CatalogusAutorisatie] = (),
     ) -> models.QuerySet:
         """
         Filter objects whitelisted by the authorizations.
@@ -42,71 +48,67 @@ class AuthorizationsFilterMixin:
           authorizations
         :param authorizations: queryset of
           :class:`vng_api_common.authorizations.Autorisatie` objects
+        :param catalogus_authorizations: authorizations for all the
+          ``informatieobjecttypen`` of a ``catalogus``
 
         :return: a queryset of filtered results according to the
           authorizations provided
         """
-        # keep a list of allowed informatieobjecttypen
-        informatieobjecttypen = []
-
-        # annotate the queryset so we can map a string value to a logical number
-        order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-            "vertrouwelijkheidaanduiding"
+        # only the authorizations that have the scope that's needed apply
+        authorizations = [
+            authorization
+            for authorization in authorizations
+            if scope.is_contained_in(authorization.scopes)
+        ]
+
+        # resolve all informatieobjecttypen at once
+        informatieobjecttype_pks = get_resource_pks(
+            authorization.informatieobjecttype for authorization in authorizations
         )
 
-        # build the case/when to map the max_vertrouwelijkheidaanduiding based
-        # on the ``informatieobjecttype``
-        vertrouwelijkheidaanduiding_whens = []
+        # map the allowed informatieobjecttypen to the highest confidentiality
+        # level they're authorized for
+        max_orders = {}
         for authorization in authorizations:
-            # test if this authorization has the scope that's needed
-            if not scope.is_contained_in(authorization.scopes):
-                continue
-
-            # this informatieobjecttype is allowed
-            informatieobjecttype_path = urlparse(
+            # informatieobjecttypen that don't exist (anymore) can't have any
+            # informatieobjecten
+            informatieobjecttype = informatieobjecttype_pks.get(
                 authorization.informatieobjecttype
-            ).path
-            informatieobjecttype = get_resource_for_path(informatieobjecttype_path)
-            informatieobjecttypen.append(informatieobjecttype)
+            )
+            if informatieobjecttype is None:
+                continue
 
             # extract the order and map it to the database value
-            choice_item = VertrouwelijkheidsAanduiding.get_choice(
+            order = VertrouwelijkheidsAanduiding.get_choice(
                 authorization.max_vertrouwelijkheidaanduiding
+            ).order
+            max_orders[informatieobjecttype] = max(
+                order, max_orders.get(informatieobjecttype, order)
             )
-            vertrouwelijkheidaanduiding_whens.append(
-                When(
-                    **{"informatieobjecttype": informatieobjecttype},
-                    then=Value(choice_item.order),
-                )
-            )
 
-        # apply the order annnotation so we can filter later
-        annotations = {"_va_order": order_case}
-        # filtering:
-        # * only allow the white-listed informatieobjecttypen, explicitly
-        # * apply the filtering to limit cases within case-types to the maximal
-        #   confidentiality level
-        filters = {
-            "informatieobjecttype__in": informatieobjecttypen,
-            "_va_order__lte": Case(
-                *vertrouwelijkheidaanduiding_whens, output_field=IntegerField()
-            ),
-        }
+        catalogus_max_orders = get_catalogus_max_orders(scope, catalogus_authorizations)
+
         if self.authorizations_lookup:
             # If the current queryset is not an InformatieObjectQuerySet, first
             # retrieve the canonical IDs of EnkelvoudigInformatieObjects
             # for which the user is authorized and then return the objects
             # related to those EnkelvoudigInformatieObjectCanonicals
             model = apps.get_model("documenten", "EnkelvoudigInformatieObject")
-            filtered = (
-                model.objects.annotate(**annotations)
-                .filter(**filters)
-                .values("canonical")
-            )
+            filtered = filter_max_orders(
+                model.objects.all(),
+                "informatieobjecttype",
+                max_orders,
+                catalogus_max_orders=catalogus_max_orders,
+            ).values("canonical")
             queryset = self.filter(informatieobject__in=filtered)
         # bring it all together now to build the resulting queryset
         else:
-            queryset = self.annotate(**annotations).filter(**filters)
+            queryset = filter_max_orders(
+                self,
+                "informatieobjecttype",
+                max_orders,
+                catalogus_max_orders=catalogus_max_orders,
+            )
         return queryset
 
 
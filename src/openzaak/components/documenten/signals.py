@@ -6,8 +6,13 @@ from django.dispatch import receiver
 
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
+from openzaak.utils.models import bump_row_version
 
-from .models import ObjectInformatieObject
+from .models import (
+    EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
+    ObjectInformatieObject,
+)
 from .typing import IORelation
 
 logger = logging.getLogger(__name__)
@@ -50,3 +55,19 @@ def sync_oio(
 
     else:
         raise NotImplementedError(f"Signal {signal} is not supported")
+
+
+@receiver(
+    post_save,
+    sender=EnkelvoudigInformatieObjectCanonical,
+    dispatch_uid="documenten.bump_lock",
+)
+def bump_lock(
+    sender: ModelBase, instance: EnkelvoudigInformatieObjectCanonical, **kwargs
+) -> None:
+    """
+    Bump the row version of the versions of a document when it's (un)locked.
+    """
+    if kwargs["created"] or kwargs["raw"]:
+        return
+    bump_row_version(EnkelvoudigInformatieObject.objects.filter(canonical=instance))
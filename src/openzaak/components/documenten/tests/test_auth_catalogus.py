@@ -0,0 +1,73 @@
+"""
+Guarantee that authorizations for an entire catalogus are applied.
+"""
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.authorizations.models import CatalogusAutorisatie
+from openzaak.components.catalogi.tests.factories import (
+    CatalogusFactory,
+    InformatieObjectTypeFactory,
+)
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_DOCUMENTEN_ALLES_LEZEN
+from .factories import EnkelvoudigInformatieObjectFactory
+
+
+class CatalogusAutorisatieTests(JWTAuthMixin, APITestCase):
+    # the regular autorisatie grants nothing
+    scopes = []
+    component = ComponentTypes.drc
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.catalogus = CatalogusFactory.create()
+        cls.informatieobjecttype = InformatieObjectTypeFactory.create(
+            catalogus=cls.catalogus
+        )
+        CatalogusAutorisatie.objects.create(
+            applicatie=cls.applicatie,
+            component=ComponentTypes.drc,
+            catalogus=cls.catalogus,
+            scopes=[SCOPE_DOCUMENTEN_ALLES_LEZEN],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+
+    def test_enkelvoudiginformatieobject_list(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        # types added to the catalogus later on are covered as well
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=InformatieObjectTypeFactory.create(
+                catalogus=self.catalogus
+            ),
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        response = self.client.get(reverse("enkelvoudiginformatieobject-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        urls = {eio["url"] for eio in response.data["results"]}
+        self.assertEqual(
+            urls, {f"http://testserver{reverse(eio)}" for eio in (eio1, eio2)}
+        )
+
+    @override_settings(AUTHORIZATIONS_JOIN_THRESHOLD=0)
+    def test_enkelvoudiginformatieobject_list_joined(self):
+        self.test_enkelvoudiginformatieobject_list()
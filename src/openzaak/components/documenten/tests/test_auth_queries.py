@@ -0,0 +1,49 @@
+"""
+Guarantee that the authorizations are loaded only once per request.
+"""
+import uuid
+from base64 import b64encode
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import InformatieObjectTypeFactory
+from openzaak.utils.tests import AuthorizationQueriesMixin, JWTAuthMixin
+
+from ..api.scopes import SCOPE_DOCUMENTEN_AANMAKEN
+from ..models import EnkelvoudigInformatieObject
+
+
+@temp_private_root()
+class AuthorizationQueriesTests(AuthorizationQueriesMixin, JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_DOCUMENTEN_AANMAKEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.geheim
+    component = ComponentTypes.drc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.informatieobjecttype = InformatieObjectTypeFactory.create(concept=False)
+        super().setUpTestData()
+
+    def test_create_enkelvoudiginformatieobject(self):
+        data = {
+            "identificatie": uuid.uuid4().hex,
+            "bronorganisatie": "159351741",
+            "creatiedatum": "2018-06-27",
+            "titel": "detailed summary",
+            "auteur": "test_auteur",
+            "formaat": "txt",
+            "taal": "eng",
+            "bestandsnaam": "dummy.txt",
+            "inhoud": b64encode(b"some file content").decode("utf-8"),
+            "informatieobjecttype": f"http://testserver{reverse(self.informatieobjecttype)}",
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+        }
+
+        with self.assertMaxAuthorizationQueries(1):
+            response = self.client.post(reverse(EnkelvoudigInformatieObject), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
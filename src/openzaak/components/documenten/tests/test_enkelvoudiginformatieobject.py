@@ -1,6 +1,7 @@
 import uuid
 from base64 import b64encode
 from datetime import date
+from unittest.mock import patch
 
 from django.test import override_settings
 from django.utils import timezone
@@ -13,6 +14,7 @@ from vng_api_common.tests import get_validation_errors, reverse
 
 from openzaak.components.catalogi.tests.factories import InformatieObjectTypeFactory
 from openzaak.components.zaken.tests.factories import ZaakInformatieObjectFactory
+from openzaak.utils.pagination import KeysetPagination
 from openzaak.utils.tests import JWTAuthMixin
 
 from ..models import EnkelvoudigInformatieObject, EnkelvoudigInformatieObjectCanonical
@@ -574,3 +576,24 @@ class EnkelvoudigInformatieObjectPaginationAPITests(JWTAuthMixin, APITestCase):
         self.assertEqual(response_data["count"], 2)
         self.assertIsNone(response_data["previous"])
         self.assertIsNone(response_data["next"])
+
+    @patch.object(KeysetPagination, "page_size", 1)
+    def test_pagination_cursor_param(self):
+        eio1, eio2 = EnkelvoudigInformatieObjectFactory.create_batch(2)
+        eio1_latest = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio1.canonical, versie=2
+        )
+
+        response = self.client.get(self.list_url, {"cursor": ""})
+        first_page = response.json()
+        response = self.client.get(first_page["next"])
+        second_page = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            first_page["results"][0]["url"], f"http://testserver{reverse(eio1_latest)}"
+        )
+        self.assertEqual(
+            second_page["results"][0]["url"], f"http://testserver{reverse(eio2)}"
+        )
+        self.assertIsNone(second_page["next"])
@@ -61,6 +61,10 @@ class ZaakAdmin(admin.ModelAdmin):
         RelevanteZaakRelatieInline,
     ]
 
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        Zaak.objects.filter(pk=form.instance.pk).update_current_status()
+
 
 @admin.register(Status)
 class StatusAdmin(admin.ModelAdmin):
@@ -68,6 +72,22 @@ class StatusAdmin(admin.ModelAdmin):
     list_select_related = ["zaak"]
     raw_id_fields = ["zaak"]
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        zaken = {obj.zaak_id}
+        if "zaak" in form.initial:
+            zaken.add(form.initial["zaak"])
+        Zaak.objects.filter(pk__in=zaken).update_current_status()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        Zaak.objects.filter(pk=obj.zaak_id).update_current_status()
+
+    def delete_queryset(self, request, queryset):
+        zaken = list(queryset.values_list("zaak", flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        Zaak.objects.filter(pk__in=zaken).update_current_status()
+
 
 @admin.register(ZaakObject)
 class ZaakObjectAdmin(admin.ModelAdmin):
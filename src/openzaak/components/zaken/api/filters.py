@@ -1,11 +1,25 @@
 from django_filters import filters
+from vng_api_common.filters import URLModelChoiceFilter
 from vng_api_common.filtersets import FilterSet
 from vng_api_common.utils import get_help_text
 
+from openzaak.components.catalogi.models import StatusType
+
 from ..models import Resultaat, Rol, Status, Zaak, ZaakInformatieObject, ZaakObject
 
 
 class ZaakFilter(FilterSet):
+    status = URLModelChoiceFilter(
+        field_name="current_status",
+        queryset=Status.objects.all(),
+        help_text=get_help_text("zaken.Zaak", "current_status"),
+    )
+    status__statustype = URLModelChoiceFilter(
+        field_name="current_status__statustype",
+        queryset=StatusType.objects.all(),
+        help_text=get_help_text("zaken.Status", "statustype"),
+    )
+
     class Meta:
         model = Zaak
         fields = {
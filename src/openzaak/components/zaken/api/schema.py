@@ -30,6 +30,12 @@ genereren.
 
 Deze API publiceert notificaties op het kanaal `{KANAAL_ZAKEN.label}`.
 
+STATUSsen, ROLlen, ZAAKOBJECTen en ZAAKEIGENSCHAPpen kunnen tegelijk
+aangemaakt worden door een lijst te posten. Daarbij wordt per ZAAK een enkele
+notificatie verstuurd in plaats van een notificatie per resource. De
+`resourceUrl` van deze notificatie is de URL van de lijst van de resources van
+de ZAAK, bijv. `/statussen?zaak=<zaak-url>` of `/zaken/<uuid>/zaakeigenschappen`.
+
 **Handige links**
 
 * [Documentatie](https://zaakgerichtwerken.vng.cloud/standaard)
@@ -7,6 +7,8 @@ from vng_api_common.polymorphism import Discriminator, PolymorphicSerializer
 from vng_api_common.serializers import add_choice_values_help_text
 from vng_api_common.validators import URLValidator
 
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
+
 from ...models import ZaakObject
 from .address import ObjectAdresSerializer
 from .betrokkenen import (
@@ -42,7 +44,7 @@ from .objecten import (
 )
 
 
-class ZaakObjectSerializer(PolymorphicSerializer):
+class ZaakObjectSerializer(FlexFieldsSerializerMixin, PolymorphicSerializer):
     discriminator = Discriminator(
         discriminator_field="object_type",
         mapping={
@@ -2,7 +2,7 @@ import logging
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Max, Subquery
+from django.db.models import Max, Prefetch, Subquery
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
@@ -33,6 +33,7 @@ from vng_api_common.validators import (
 )
 
 from openzaak.components.besluiten.models import Besluit
+from openzaak.components.catalogi.api.scopes import SCOPE_ZAAKTYPES_READ
 from openzaak.components.catalogi.models import (
     Eigenschap,
     ResultaatType,
@@ -50,6 +51,7 @@ from openzaak.components.documenten.models import (
 from openzaak.utils.auth import get_auth
 from openzaak.utils.exceptions import DetermineProcessEndDateException
 from openzaak.utils.serializer_fields import LengthHyperlinkedRelatedField
+from openzaak.utils.serializers import FlexFieldsSerializerMixin
 
 from ...brondatum import BrondatumCalculator
 from ...constants import AardZaakRelatie, BetalingsIndicatie, IndicatieMachtiging
@@ -64,6 +66,7 @@ from ...models import (
     ZaakInformatieObject,
     ZaakKenmerk,
 )
+from ..scopes import SCOPE_ZAKEN_ALLES_LEZEN
 from ..validators import (
     CorrectZaaktypeValidator,
     DateNotInFutureValidator,
@@ -130,6 +133,7 @@ class RelevanteZaakSerializer(serializers.ModelSerializer):
 
 
 class ZaakSerializer(
+    FlexFieldsSerializerMixin,
     NestedGegevensGroepMixin,
     NestedCreateMixin,
     NestedUpdateMixin,
@@ -145,11 +149,11 @@ class ZaakSerializer(
         help_text=get_help_text("zaken.Zaak", "zaaktype"),
     )
     status = serializers.HyperlinkedRelatedField(
-        source="current_status_uuid",
+        source="current_status",
         read_only=True,
         allow_null=True,
         view_name="status-detail",
-        lookup_url_kwarg="uuid",
+        lookup_field="uuid",
         help_text=_("Indien geen status bekend is, dan is de waarde 'null'"),
     )
 
@@ -207,6 +211,45 @@ class ZaakSerializer(
         many=True, required=False, help_text=_("Een lijst van relevante andere zaken.")
     )
 
+    expandable_fields = {
+        "zaaktype": (
+            "openzaak.components.catalogi.api.serializers.ZaakTypeSerializer",
+            {"scope": SCOPE_ZAAKTYPES_READ},
+        ),
+        "hoofdzaak": (
+            "openzaak.components.zaken.api.serializers.ZaakSerializer",
+            {"scope": SCOPE_ZAKEN_ALLES_LEZEN},
+        ),
+        "deelzaken": (
+            "openzaak.components.zaken.api.serializers.ZaakSerializer",
+            {"many": True, "scope": SCOPE_ZAKEN_ALLES_LEZEN},
+        ),
+        "status": (
+            "openzaak.components.zaken.api.serializers.StatusSerializer",
+            {"source": "current_status"},
+        ),
+        "resultaat": (
+            "openzaak.components.zaken.api.serializers.ResultaatSerializer",
+            {},
+        ),
+        "rollen": (
+            "openzaak.components.zaken.api.serializers.RolSerializer",
+            {"source": "rol_set", "many": True},
+        ),
+        "zaakobjecten": (
+            "openzaak.components.zaken.api.serializers.ZaakObjectSerializer",
+            {"source": "zaakobject_set", "many": True},
+        ),
+        "zaakinformatieobjecten": (
+            "openzaak.components.zaken.api.serializers.ZaakInformatieObjectSerializer",
+            {"source": "zaakinformatieobject_set", "many": True},
+        ),
+        "eigenschappen": (
+            "openzaak.components.zaken.api.serializers.ZaakEigenschapSerializer",
+            {"source": "zaakeigenschap_set", "many": True},
+        ),
+    }
+
     class Meta:
         model = Zaak
         fields = (
@@ -249,6 +292,15 @@ class ZaakSerializer(
             "archiefactiedatum",
             "resultaat",
         )
+        select_related = ("zaaktype", "hoofdzaak", "resultaat", "current_status")
+        prefetch_related = (
+            "deelzaken",
+            "zaakkenmerk_set",
+            Prefetch(
+                "relevante_andere_zaken",
+                queryset=RelevanteZaakRelatie.objects.select_related("url"),
+            ),
+        )
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "uuid": {"read_only": True},
@@ -421,7 +473,9 @@ class ZaakZoekSerializer(serializers.Serializer):
     zaakgeometrie = GeoWithinSerializer(required=True)
 
 
-class StatusSerializer(serializers.HyperlinkedModelSerializer):
+class StatusSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     statustype = LengthHyperlinkedRelatedField(
         view_name="statustype-detail",
         lookup_field="uuid",
@@ -431,6 +485,13 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
         help_text=get_help_text("zaken.Status", "statustype"),
     )
 
+    expandable_fields = {
+        "statustype": (
+            "openzaak.components.catalogi.api.serializers.StatusTypeSerializer",
+            {"scope": SCOPE_ZAAKTYPES_READ},
+        )
+    }
+
     class Meta:
         model = Status
         fields = (
@@ -441,6 +502,7 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
             "datum_status_gezet",
             "statustoelichting",
         )
+        select_related = ("zaak", "statustype")
         validators = [CorrectZaaktypeValidator("statustype")]
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
@@ -453,7 +515,8 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
         validated_attrs = super().validate(attrs)
 
         statustype = validated_attrs["statustype"]
-        validated_attrs["__is_eindstatus"] = statustype.is_eindstatus()
+        validated_attrs["__is_eindstatus"] = statustype.is_eindstatus
+        validated_attrs["__brondatum_calculator"] = None
 
         # validate that all InformationObjects have indicatieGebruiksrecht set
         # and are unlocked
@@ -510,8 +573,8 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
                     exc.args[0], code="archiefactiedatum-error"
                 )
 
-            # nasty to pass state around...
-            self.context["brondatum_calculator"] = brondatum_calculator
+            # kept with the item, the context is shared by the items of a bulk create
+            validated_attrs["__brondatum_calculator"] = brondatum_calculator
 
         return validated_attrs
 
@@ -529,7 +592,7 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
         _zaak_fields_changed = []
 
         is_eindstatus = validated_data.pop("__is_eindstatus")
-        brondatum_calculator = self.context.pop("brondatum_calculator", None)
+        brondatum_calculator = validated_data.pop("__brondatum_calculator")
 
         # are we re-opening the case?
         is_reopening = zaak.einddatum and not is_eindstatus
@@ -567,10 +630,16 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
             # Save updated information on the ZAAK
             zaak.save(update_fields=_zaak_fields_changed)
 
+            # the zaak row is locked by now, so concurrent status changes
+            # see each other's statuses when determining the current one
+            Zaak.objects.filter(pk=zaak.pk).update_current_status()
+
         return obj
 
 
-class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class ZaakInformatieObjectSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     aard_relatie_weergave = serializers.ChoiceField(
         source="get_aard_relatie_display",
         read_only=True,
@@ -608,11 +677,19 @@ class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "uuid": {"read_only": True},
-            "zaak": {"lookup_field": "uuid", "validators": [IsImmutableValidator()]},
+            "zaak": {
+                "lookup_field": "uuid",
+                # the zaaktype is validated against, see
+                # ZaaktypeInformatieobjecttypeRelationValidator
+                "queryset": Zaak.objects.select_related("zaaktype"),
+                "validators": [IsImmutableValidator()],
+            },
         }
 
 
-class ZaakEigenschapSerializer(NestedHyperlinkedModelSerializer):
+class ZaakEigenschapSerializer(
+    FlexFieldsSerializerMixin, NestedHyperlinkedModelSerializer
+):
     parent_lookup_kwargs = {"zaak_uuid": "zaak__uuid"}
 
     eigenschap = LengthHyperlinkedRelatedField(
@@ -624,6 +701,13 @@ class ZaakEigenschapSerializer(NestedHyperlinkedModelSerializer):
         help_text=get_help_text("zaken.ZaakEigenschap", "eigenschap"),
     )
 
+    expandable_fields = {
+        "eigenschap": (
+            "openzaak.components.catalogi.api.serializers.EigenschapSerializer",
+            {"scope": SCOPE_ZAAKTYPES_READ},
+        )
+    }
+
     class Meta:
         model = ZaakEigenschap
         fields = ("url", "uuid", "zaak", "eigenschap", "naam", "waarde")
@@ -643,7 +727,9 @@ class ZaakEigenschapSerializer(NestedHyperlinkedModelSerializer):
         return attrs
 
 
-class KlantContactSerializer(serializers.HyperlinkedModelSerializer):
+class KlantContactSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     class Meta:
         model = KlantContact
         fields = ("url", "uuid", "zaak", "identificatie", "datumtijd", "kanaal")
@@ -656,7 +742,7 @@ class KlantContactSerializer(serializers.HyperlinkedModelSerializer):
         }
 
 
-class RolSerializer(PolymorphicSerializer):
+class RolSerializer(FlexFieldsSerializerMixin, PolymorphicSerializer):
     roltype = LengthHyperlinkedRelatedField(
         view_name="roltype-detail",
         lookup_field="uuid",
@@ -679,6 +765,13 @@ class RolSerializer(PolymorphicSerializer):
         same_model=False,
     )
 
+    expandable_fields = {
+        "roltype": (
+            "openzaak.components.catalogi.api.serializers.RolTypeSerializer",
+            {"scope": SCOPE_ZAAKTYPES_READ},
+        )
+    }
+
     class Meta:
         model = Rol
         fields = (
@@ -694,6 +787,16 @@ class RolSerializer(PolymorphicSerializer):
             "registratiedatum",
             "indicatie_machtiging",
         )
+        select_related = (
+            "zaak",
+            "roltype",
+            # the betrokkene identificatie of each betrokkene type
+            "natuurlijkpersoon",
+            "nietnatuurlijkpersoon",
+            "vestiging",
+            "organisatorischeeenheid",
+            "medewerker",
+        )
         validators = [
             RolOccurenceValidator(RolOmschrijving.initiator, max_amount=1),
             RolOccurenceValidator(RolOmschrijving.zaakcoordinator, max_amount=1),
@@ -747,7 +850,9 @@ class RolSerializer(PolymorphicSerializer):
         return rol
 
 
-class ResultaatSerializer(serializers.HyperlinkedModelSerializer):
+class ResultaatSerializer(
+    FlexFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     resultaattype = LengthHyperlinkedRelatedField(
         view_name="resultaattype-detail",
         lookup_field="uuid",
@@ -758,9 +863,17 @@ class ResultaatSerializer(serializers.HyperlinkedModelSerializer):
         help_text=get_help_text("zaken.Resultaat", "resultaattype"),
     )
 
+    expandable_fields = {
+        "resultaattype": (
+            "openzaak.components.catalogi.api.serializers.ResultaatTypeSerializer",
+            {"scope": SCOPE_ZAAKTYPES_READ},
+        )
+    }
+
     class Meta:
         model = Resultaat
         fields = ("url", "uuid", "zaak", "resultaattype", "toelichting")
+        select_related = ("zaak", "resultaattype")
         validators = [CorrectZaaktypeValidator("resultaattype")]
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
@@ -769,7 +882,7 @@ class ResultaatSerializer(serializers.HyperlinkedModelSerializer):
         }
 
 
-class ZaakBesluitSerializer(serializers.Serializer):
+class ZaakBesluitSerializer(FlexFieldsSerializerMixin, serializers.Serializer):
     """
     Serializer the reverse relation between Besluit-Zaak.
 
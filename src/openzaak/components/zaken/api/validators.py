@@ -9,6 +9,8 @@ from vng_api_common.validators import (
     UniekeIdentificatieValidator as _UniekeIdentificatieValidator,
 )
 
+from openzaak.components.catalogi.graph import get_graph
+
 
 class RolOccurenceValidator:
     """
@@ -30,6 +32,8 @@ class RolOccurenceValidator:
         """
         # Determine the existing instance, if this is an update operation.
         self.instance = getattr(serializer, "instance", None)
+        # the rollen validated before this one in a bulk create
+        self.pending = getattr(serializer.parent, "validated_items", ())
 
     def __call__(self, attrs):
         roltype = attrs["roltype"]
@@ -52,6 +56,12 @@ class RolOccurenceValidator:
             .rol_set.filter(omschrijving_generiek=self.omschrijving_generiek)
             .count()
         )
+        existing += sum(
+            1
+            for item in self.pending
+            if item["zaak"] == attrs["zaak"]
+            and item["roltype"].omschrijving_generiek == self.omschrijving_generiek
+        )
 
         if existing >= self.max_amount:
             message = self.message.format(
@@ -116,7 +126,8 @@ class CorrectZaaktypeValidator:
         if not url or not zaak:
             return
 
-        if url.zaaktype != zaak.zaaktype:
+        # compare the keys, there's no need to fetch the zaaktypen
+        if url.zaaktype_id != zaak.zaaktype_id:
             raise serializers.ValidationError(self.message, code=self.code)
 
 
@@ -131,9 +142,8 @@ class ZaaktypeInformatieobjecttypeRelationValidator:
             return
 
         io = informatieobject.enkelvoudiginformatieobject_set.first()
-        if not zaak.zaaktype.heeft_relevant_informatieobjecttype.filter(
-            id=io.informatieobjecttype_id, concept=False
-        ).exists():
+        zaaktype = get_graph(zaak.zaaktype)
+        if io.informatieobjecttype_id not in zaaktype.informatieobjecttypen:
             raise serializers.ValidationError(self.message, code=self.code)
 
 
@@ -8,7 +8,6 @@ from rest_framework import mixins, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.filters import OrderingFilter
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.reverse import reverse
 from vng_api_common.audittrails.viewsets import (
     AuditTrailCreateMixin,
@@ -24,10 +23,19 @@ from vng_api_common.notifications.viewsets import (
 )
 from vng_api_common.search import SearchMixin
 from vng_api_common.utils import lookup_kwargs_to_filters
-from vng_api_common.viewsets import CheckQueryParamsMixin, NestedViewSetMixin
+from vng_api_common.viewsets import NestedViewSetMixin
 
 from openzaak.components.besluiten.models import Besluit
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.pagination import EstimatedCount, OptionalCursorPagination
+from openzaak.utils.viewsets import (
+    BulkCreateMixin,
+    CheckQueryParamsMixin,
+    ETagMixin,
+    MultiGetMixin,
+    QueryPlanMixin,
+    StreamingListMixin,
+)
 
 from ..models import (
     KlantContact,
@@ -81,8 +89,11 @@ class ZaakViewSet(
     AuditTrailViewsetMixin,
     GeoMixin,
     SearchMixin,
+    MultiGetMixin,
     CheckQueryParamsMixin,
+    ETagMixin,
     ListFilterByAuthorizationsMixin,
+    QueryPlanMixin,
     viewsets.ModelViewSet,
 ):
     """
@@ -190,20 +201,22 @@ class ZaakViewSet(
     - `klantcontact` - alle klantcontacten bij een zaak
     """
 
-    queryset = Zaak.objects.prefetch_related("deelzaken").order_by("-pk")
+    queryset = Zaak.objects.order_by("-pk")
     serializer_class = ZaakSerializer
     search_input_serializer_class = ZaakZoekSerializer
     filter_backends = (Backend, OrderingFilter)
     filterset_class = ZaakFilter
     ordering_fields = ("startdatum",)
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
+    count_strategy = EstimatedCount()
 
     permission_classes = (ZaakAuthRequired,)
     required_scopes = {
         "list": SCOPE_ZAKEN_ALLES_LEZEN,
         "retrieve": SCOPE_ZAKEN_ALLES_LEZEN,
         "_zoek": SCOPE_ZAKEN_ALLES_LEZEN,
+        "_multiget": SCOPE_ZAKEN_ALLES_LEZEN,
         "create": SCOPE_ZAKEN_CREATE,
         "update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "partial_update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
@@ -243,8 +256,8 @@ class ZaakViewSet(
         insufficient permissions
 
         """
-        zaak = self.get_object()
-        zaak_data = self.get_serializer(zaak).data
+        zaak = serializer.instance
+        zaak_data = ZaakAuthRequired().format_data(zaak, self.request)
 
         if not self.request.jwt_auth.has_auth(
             scopes=SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
@@ -259,10 +272,13 @@ class ZaakViewSet(
 
 
 class StatusViewSet(
+    BulkCreateMixin,
     NotificationCreateMixin,
     AuditTrailCreateMixin,
     CheckQueryParamsMixin,
+    StreamingListMixin,
     ListFilterByAuthorizationsMixin,
+    QueryPlanMixin,
     mixins.CreateModelMixin,
     viewsets.ReadOnlyModelViewSet,
 ):
@@ -316,8 +332,43 @@ class StatusViewSet(
         Perform the create of the Status.
 
         After input validation and before DB persistance we need to check
-        scope-related permissions. Three scopes are allowed to create new
-        Status objects:
+        scope-related permissions, see :meth:`check_zaak_permissions`.
+        """
+        zaak = serializer.validated_data["zaak"]
+        self.check_zaak_permissions(
+            zaak, has_status=zaak.status_set.exists(), closed=bool(zaak.einddatum)
+        )
+        super().perform_create(serializer)
+
+    def perform_bulk_create(self, serializer):
+        """
+        Check the permissions for every status, in order.
+
+        Each status is checked against the state the zaak is in after the
+        statussen before it, so closing and reopening a zaak in one request
+        requires the same scopes as doing it in separate requests.
+        """
+        states = {}
+        for item in serializer.validated_data:
+            zaak = item["zaak"]
+            if zaak not in states:
+                states[zaak] = (zaak.status_set.exists(), bool(zaak.einddatum))
+            has_status, closed = states[zaak]
+            self.check_zaak_permissions(zaak, has_status=has_status, closed=closed)
+            # an eindstatus closes the zaak, any other status (re)opens it
+            states[zaak] = (True, item["__is_eindstatus"])
+        super().perform_bulk_create(serializer)
+
+    def check_zaak_permissions(
+        self, zaak: Zaak, has_status: bool, closed: bool
+    ) -> None:
+        """
+        Check that a status may be created for ``zaak``.
+
+        ``has_status`` and ``closed`` describe the state of the zaak before
+        the status is created.
+
+        Three scopes are allowed to create new Status objects:
         - create initial status
         - create initial status and subsequent statuses until the case is closed
         - create any status before or after the case is closed
@@ -325,8 +376,7 @@ class StatusViewSet(
         :raises: PermissionDenied if attempting to create another Status with
           insufficient permissions
         """
-        zaak = serializer.validated_data["zaak"]
-        zaak_data = ZaakSerializer(zaak, context={"request": self.request}).data
+        zaak_data = ZaakAuthRequired().format_data(zaak, self.request)
         component = self.queryset.model._meta.app_label
 
         if not self.request.jwt_auth.has_auth(
@@ -335,7 +385,7 @@ class StatusViewSet(
             vertrouwelijkheidaanduiding=zaak_data["vertrouwelijkheidaanduiding"],
             init_component=component,
         ):
-            if zaak.status_set.exists():
+            if has_status:
                 msg = f"Met de '{SCOPE_ZAKEN_CREATE}' scope mag je slechts 1 status zetten"
                 raise PermissionDenied(detail=msg)
 
@@ -345,15 +395,15 @@ class StatusViewSet(
             vertrouwelijkheidaanduiding=zaak_data["vertrouwelijkheidaanduiding"],
             init_component=component,
         ):
-            if zaak.einddatum:
+            if closed:
                 msg = "Reopening a closed case with current scope is forbidden"
                 raise PermissionDenied(detail=msg)
 
-        super().perform_create(serializer)
-
 
 class ZaakObjectViewSet(
+    BulkCreateMixin,
     NotificationCreateMixin,
+    StreamingListMixin,
     ListFilterByAuthorizationsMixin,
     AuditTrailCreateMixin,
     mixins.CreateModelMixin,
@@ -484,9 +534,11 @@ class ZaakInformatieObjectViewSet(
 
 
 class ZaakEigenschapViewSet(
+    BulkCreateMixin,
     NotificationCreateMixin,
     AuditTrailCreateMixin,
     NestedViewSetMixin,
+    QueryPlanMixin,
     mixins.CreateModelMixin,
     viewsets.ReadOnlyModelViewSet,
 ):
@@ -529,6 +581,10 @@ class ZaakEigenschapViewSet(
             self._zaak = get_object_or_404(Zaak, **filters)
         return self._zaak
 
+    def get_bulk_resource_url(self, main_object_url: str) -> str:
+        # the collection is nested under the zaak already
+        return self.request.build_absolute_uri(self.request.path)
+
 
 class KlantContactViewSet(
     NotificationCreateMixin,
@@ -572,10 +628,13 @@ class KlantContactViewSet(
 
 
 class RolViewSet(
+    BulkCreateMixin,
     NotificationCreateMixin,
     AuditTrailCreateMixin,
     CheckQueryParamsMixin,
+    StreamingListMixin,
     ListFilterByAuthorizationsMixin,
+    QueryPlanMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -625,7 +684,9 @@ class ResultaatViewSet(
     NotificationViewSetMixin,
     AuditTrailViewsetMixin,
     CheckQueryParamsMixin,
+    StreamingListMixin,
     ListFilterByAuthorizationsMixin,
+    QueryPlanMixin,
     viewsets.ModelViewSet,
 ):
     """
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max, Min
+
+from ...models import Zaak
+
+
+class Command(BaseCommand):
+    help = (
+        "Point every zaak to its most recent status again, e.g. after statuses "
+        "were changed outside of the API. The zaken are updated in chunks of "
+        "consecutive primary keys, each in its own transaction, to avoid "
+        "locking the whole table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of zaken to update per transaction",
+        )
+
+    def handle(self, **options):
+        chunk_size = options["chunk_size"]
+        bounds = Zaak.objects.aggregate(first=Min("pk"), last=Max("pk"))
+        if bounds["first"] is None:
+            return
+
+        updated = 0
+        for start in range(bounds["first"], bounds["last"] + 1, chunk_size):
+            with transaction.atomic():
+                updated += Zaak.objects.filter(
+                    pk__gte=start, pk__lt=start + chunk_size
+                ).update_current_status()
+
+            if options["verbosity"] > 1:
+                self.stdout.write(f"Updated {updated} zaken")
+
+        if options["verbosity"] > 0:
+            self.stdout.write(f"Updated the current status of {updated} zaken")
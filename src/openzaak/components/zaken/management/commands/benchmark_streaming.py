@@ -0,0 +1,145 @@
+import gc
+import multiprocessing
+import os
+import threading
+import time
+from unittest.mock import patch
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+
+from vng_api_common.authorizations.models import Applicatie
+from vng_api_common.models import JWTSecret
+from vng_api_common.tests import generate_jwt_auth, reverse
+
+from ...api.viewsets import StatusViewSet
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+STRATEGIES = {"buffered": float("inf"), "streaming": StatusViewSet.stream_threshold}
+
+INSERT_STATUSSEN = """
+INSERT INTO zaken_status (uuid, zaak_id, statustype_id, datum_status_gezet, statustoelichting)
+SELECT md5(random()::text || i)::uuid, %s, %s, now() - i * interval '1 second', repeat('x', 100)
+FROM generate_series(1, %s) AS i
+"""
+
+
+def get_rss() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * PAGE_SIZE
+
+
+class PeakRSS(threading.Thread):
+    """
+    Sample the resident set size of the process until stopped.
+    """
+
+    def __init__(self, interval=0.001):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = get_rss()
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.is_set():
+            self.peak = max(self.peak, get_rss())
+            time.sleep(self.interval)
+
+    def stop(self) -> int:
+        self._stopped.set()
+        self.join()
+        return max(self.peak, get_rss())
+
+
+def measure(count: int, threshold: float) -> float:
+    """
+    List ``count`` statussen and return the increase of the RSS in MB.
+    """
+    from ...tests.factories import StatusFactory
+
+    with transaction.atomic(), override_settings(ALLOWED_HOSTS=["*"]):
+        JWTSecret.objects.create(identifier="benchmark", secret="benchmark")
+        Applicatie.objects.create(
+            client_ids=["benchmark"], label="Benchmark", heeft_alle_autorisaties=True
+        )
+        status = StatusFactory.create()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                INSERT_STATUSSEN, [status.zaak_id, status.statustype_id, count - 1]
+            )
+
+        client = Client(HTTP_AUTHORIZATION=generate_jwt_auth("benchmark", "benchmark"))
+        gc.collect()
+
+        sampler = PeakRSS()
+        baseline = sampler.peak
+        sampler.start()
+        with patch.object(StatusViewSet, "stream_threshold", threshold):
+            response = client.get(reverse("status-list"))
+            assert response.status_code == 200, response.status_code
+            if response.streaming:
+                size = sum(len(chunk) for chunk in response.streaming_content)
+            else:
+                size = len(response.content)
+            del response
+        peak = sampler.stop()
+
+        assert size > count * 100, size
+        transaction.set_rollback(True)
+
+    return (peak - baseline) / 2 ** 20
+
+
+def run(queue, count: int, threshold: float) -> None:
+    try:
+        queue.put(measure(count, threshold))
+    except Exception as exc:
+        queue.put(exc)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the peak memory use of listing statussen with a buffered and "
+        "a streaming response. Every measurement is done in a new process, on "
+        "statussen created in a transaction that is rolled back afterwards."
+    )
+    requires_system_checks = False
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--counts",
+            nargs="+",
+            type=int,
+            default=[1000, 10000, 50000, 100000],
+            help="Numbers of statussen to list",
+        )
+
+    def handle(self, **options):
+        # the test factories are a development dependency
+        try:
+            from ...tests import factories  # noqa
+        except ImportError as exc:
+            raise CommandError(
+                "The benchmark requires the development dependencies "
+                "(factory-boy), install them with "
+                "`pip install -r requirements/dev.txt`."
+            ) from exc
+
+        # the measurements are forked, which mustn't share the connection
+        connection.close()
+        context = multiprocessing.get_context("fork")
+
+        self.stdout.write(f"{'statussen':>10}  {'response':<10}{'peak RSS (MB)':>15}")
+        for count in options["counts"]:
+            for strategy, threshold in STRATEGIES.items():
+                queue = context.Queue()
+                process = context.Process(target=run, args=(queue, count, threshold))
+                process.start()
+                increase = queue.get()
+                process.join()
+                if isinstance(increase, Exception):
+                    raise CommandError(f"Measurement failed: {increase!r}")
+
+                self.stdout.write(f"{count:>10}  {strategy:<10}{increase:>15.1f}")
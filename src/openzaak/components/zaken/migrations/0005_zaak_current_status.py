@@ -0,0 +1,35 @@
+# Generated by Django 2.2.4 on 2026-10-18 21:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def update_current_status(apps, _):
+    Status = apps.get_model("zaken", "Status")
+    Zaak = apps.get_model("zaken", "Zaak")
+
+    latest = Status.objects.filter(zaak=OuterRef("pk")).order_by("-datum_status_gezet")
+    Zaak.objects.update(current_status=Subquery(latest.values("pk")[:1]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("zaken", "0004_auto_20190820_0945")]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaak",
+            name="current_status",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="De STATUS met de meest recente datum status gezet.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="zaken.Status",
+            ),
+        ),
+        migrations.RunPython(update_current_status, migrations.RunPython.noop),
+    ]
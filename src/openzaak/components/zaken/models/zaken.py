@@ -29,6 +29,8 @@ from vng_api_common.models import APICredential, APIMixin
 from vng_api_common.utils import generate_unique_identification
 from vng_api_common.validators import alphanumeric_excluding_diacritic
 
+from openzaak.utils.models import RowVersionMixin
+
 from ..constants import AardZaakRelatie, BetalingsIndicatie, IndicatieMachtiging
 from ..query import ZaakInformatieObjectQuerySet, ZaakQuerySet, ZaakRelatedQuerySet
 
@@ -48,7 +50,7 @@ __all__ = [
 ]
 
 
-class Zaak(APIMixin, models.Model):
+class Zaak(APIMixin, RowVersionMixin, models.Model):
     """
     Modelleer de structuur van een ZAAK.
 
@@ -282,6 +284,17 @@ class Zaak(APIMixin, models.Model):
         ),
     )
 
+    # denormalized, see ZaakQuerySet.update_current_status
+    current_status = models.ForeignKey(
+        "zaken.Status",
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        help_text=_("De STATUS met de meest recente datum status gezet."),
+    )
+
     objects = ZaakQuerySet.as_manager()
 
     class Meta:
@@ -308,8 +321,9 @@ class Zaak(APIMixin, models.Model):
 
     @property
     def current_status_uuid(self):
-        status = self.status_set.order_by("-datum_status_gezet").first()
-        return status.uuid if status else None
+        if not self.current_status_id:
+            return None
+        return self.current_status.uuid
 
     def unique_representation(self):
         return f"{self.bronorganisatie} - {self.identificatie}"
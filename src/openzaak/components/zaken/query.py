@@ -1,20 +1,28 @@
-from urllib.parse import urlparse
+from typing import Iterable
 
 from django.db import models
-from django.db.models import Case, IntegerField, Value, When
 
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
-from vng_api_common.utils import get_resource_for_path
 
-from openzaak.utils.query import BlockChangeMixin
+from openzaak.components.authorizations.models import CatalogusAutorisatie
+from openzaak.utils.models import bump_row_version
+from openzaak.utils.query import (
+    BlockChangeMixin,
+    filter_max_orders,
+    get_catalogus_max_orders,
+)
+from openzaak.utils.resources import get_resource_pks
 
 
 class AuthorizationsFilterMixin:
     authorizations_lookup = None
 
     def filter_for_authorizations(
-        self, scope: Scope, authorizations: models.QuerySet
+        self,
+        scope: Scope,
+        authorizations: models.QuerySet,
+        catalogus_authorizations: Iterable[CatalogusAutorisatie] = (),
     ) -> models.QuerySet:
         """
         Filter objects whitelisted by the authorizations.
@@ -36,63 +44,67 @@ class AuthorizationsFilterMixin:
           authorizations
         :param authorizations: queryset of
           :class:`vng_api_common.authorizations.Autorisatie` objects
+        :param catalogus_authorizations: authorizations for all the
+          ``zaaktypen`` of a ``catalogus``
 
         :return: a queryset of filtered results according to the
           authorizations provided
         """
-        # keep a list of allowed zaaktypen
-        zaaktypen = []
-
         prefix = (
             "" if not self.authorizations_lookup else f"{self.authorizations_lookup}__"
         )
 
-        # annotate the queryset so we can map a string value to a logical number
-        order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-            f"{prefix}vertrouwelijkheidaanduiding"
+        # only the authorizations that have the scope that's needed apply
+        authorizations = [
+            authorization
+            for authorization in authorizations
+            if scope.is_contained_in(authorization.scopes)
+        ]
+
+        # resolve all zaaktypen at once
+        zaaktype_pks = get_resource_pks(
+            authorization.zaaktype for authorization in authorizations
         )
 
-        # build the case/when to map the max_vertrouwelijkheidaanduiding based
-        # on the ``zaaktype``
-        vertrouwelijkheidaanduiding_whens = []
+        # map the allowed zaaktypen to the highest confidentiality level
+        # they're authorized for
+        max_orders = {}
         for authorization in authorizations:
-            # test if this authorization has the scope that's needed
-            if not scope.is_contained_in(authorization.scopes):
+            # zaaktypen that don't exist (anymore) can't have any zaken
+            zaaktype = zaaktype_pks.get(authorization.zaaktype)
+            if zaaktype is None:
                 continue
 
-            # this zaaktype is allowed
-            zaaktype_path = urlparse(authorization.zaaktype).path
-            zaaktype = get_resource_for_path(zaaktype_path)
-            zaaktypen.append(zaaktype)
-
             # extract the order and map it to the database value
-            choice_item = VertrouwelijkheidsAanduiding.get_choice(
+            order = VertrouwelijkheidsAanduiding.get_choice(
                 authorization.max_vertrouwelijkheidaanduiding
-            )
-            vertrouwelijkheidaanduiding_whens.append(
-                When(**{f"{prefix}zaaktype": zaaktype}, then=Value(choice_item.order))
-            )
-
-        # apply the order annnotation so we can filter later
-        annotations = {f"{prefix}_va_order": order_case}
-        # filtering:
-        # * only allow the white-listed zaaktypen, explicitly
-        # * apply the filtering to limit cases within case-types to the maximal
-        #   confidentiality level
-        filters = {
-            f"{prefix}zaaktype__in": zaaktypen,
-            f"{prefix}_va_order__lte": Case(
-                *vertrouwelijkheidaanduiding_whens, output_field=IntegerField()
-            ),
-        }
-
-        # bring it all together now to build the resulting queryset
-        queryset = self.annotate(**annotations).filter(**filters)
-        return queryset
+            ).order
+            max_orders[zaaktype] = max(order, max_orders.get(zaaktype, order))
+
+        catalogus_max_orders = get_catalogus_max_orders(scope, catalogus_authorizations)
+
+        return filter_max_orders(
+            self,
+            "zaaktype",
+            max_orders,
+            prefix=prefix,
+            catalogus_max_orders=catalogus_max_orders,
+        )
 
 
 class ZaakQuerySet(AuthorizationsFilterMixin, models.QuerySet):
-    pass
+    def update_current_status(self) -> int:
+        """
+        Point the zaken to the status with the most recent datum status gezet.
+        """
+        from .models import Status
+
+        latest = Status.objects.filter(zaak=models.OuterRef("pk")).order_by(
+            "-datum_status_gezet"
+        )
+        return bump_row_version(
+            self, current_status=models.Subquery(latest.values("pk")[:1])
+        )
 
 
 class ZaakRelatedQuerySet(AuthorizationsFilterMixin, models.QuerySet):
@@ -0,0 +1,41 @@
+from django.db.models import Model
+from django.db.models.base import ModelBase
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from openzaak.utils.models import bump_row_version
+
+from .models import RelevanteZaakRelatie, Resultaat, Zaak, ZaakKenmerk
+
+
+@receiver(
+    [post_save, post_delete], sender=Resultaat, dispatch_uid="zaken.bump_resultaat"
+)
+@receiver(
+    [post_save, post_delete], sender=ZaakKenmerk, dispatch_uid="zaken.bump_kenmerk"
+)
+@receiver(
+    [post_save, post_delete],
+    sender=RelevanteZaakRelatie,
+    dispatch_uid="zaken.bump_relevante_zaak",
+)
+def bump_zaak(sender: ModelBase, instance: Model, **kwargs) -> None:
+    """
+    Bump the row version of the zaak the related object is output with.
+
+    The current status is bumped by :meth:`ZaakQuerySet.update_current_status`.
+    """
+    if kwargs.get("raw"):
+        return
+    bump_row_version(Zaak.objects.filter(pk=instance.zaak_id))
+
+
+@receiver([post_save, post_delete], sender=Zaak, dispatch_uid="zaken.bump_hoofdzaak")
+def bump_hoofdzaak(sender: ModelBase, instance: Zaak, **kwargs) -> None:
+    """
+    Bump the row version of the hoofdzaak when a deelzaak is added or removed.
+    """
+    if kwargs.get("raw") or not kwargs.get("created", True):
+        return
+    if instance.hoofdzaak_id:
+        bump_row_version(Zaak.objects.filter(pk=instance.hoofdzaak_id))
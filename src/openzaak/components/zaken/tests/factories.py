@@ -20,6 +20,8 @@ from openzaak.components.documenten.tests.factories import (
     EnkelvoudigInformatieObjectCanonicalFactory,
 )
 
+from ..models import Zaak
+
 
 class ZaakFactory(factory.django.DjangoModelFactory):
     zaaktype = factory.SubFactory(ZaakTypeFactory)
@@ -83,6 +85,12 @@ class StatusFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = "zaken.Status"
 
+    @factory.post_generation
+    def update_current_status(obj, create, extracted, **kwargs):
+        # like the API does when a status is set
+        if create:
+            Zaak.objects.filter(pk=obj.zaak_id).update_current_status()
+
 
 class ResultaatFactory(factory.django.DjangoModelFactory):
     zaak = factory.SubFactory(ZaakFactory)
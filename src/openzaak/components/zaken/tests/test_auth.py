@@ -1,6 +1,8 @@
 """
 Guarantee that the proper authorization machinery is in place.
 """
+from django.test import override_settings
+
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
@@ -625,3 +627,17 @@ class ZaakBesluitTests(JWTAuthMixin, APITestCase):
                 response = self.client.get(url)
 
                 self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(AUTHORIZATIONS_JOIN_THRESHOLD=0)
+class ZaakReadJoinedAuthorizationsTests(ZaakReadCorrectScopeTests):
+    """
+    Run the same checks with the authorizations joined as a relation.
+    """
+
+
+@override_settings(AUTHORIZATIONS_JOIN_THRESHOLD=0)
+class StatusReadJoinedAuthorizationsTests(StatusReadTests):
+    """
+    Run the same checks with the authorizations joined as a relation.
+    """
@@ -0,0 +1,119 @@
+"""
+Guarantee that authorizations for an entire catalogus are applied.
+"""
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.authorizations.models import CatalogusAutorisatie
+from openzaak.components.catalogi.tests.factories import (
+    CatalogusFactory,
+    ZaakTypeFactory,
+)
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN, SCOPE_ZAKEN_CREATE
+from .factories import ZaakFactory
+from .utils import ZAAK_READ_KWARGS, ZAAK_WRITE_KWARGS
+
+
+class CatalogusAutorisatieTests(JWTAuthMixin, APITestCase):
+    # the regular autorisatie grants nothing
+    scopes = []
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.catalogus = CatalogusFactory.create()
+        cls.zaaktype = ZaakTypeFactory.create(catalogus=cls.catalogus)
+        CatalogusAutorisatie.objects.create(
+            applicatie=cls.applicatie,
+            component=ComponentTypes.zrc,
+            catalogus=cls.catalogus,
+            scopes=[SCOPE_ZAKEN_ALLES_LEZEN, SCOPE_ZAKEN_CREATE],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+
+    def test_zaak_list(self):
+        zaak1 = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        # types added to the catalogus later on are covered as well
+        zaak2 = ZaakFactory.create(
+            zaaktype=ZaakTypeFactory.create(catalogus=self.catalogus),
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+        )
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        urls = {zaak["url"] for zaak in response.data["results"]}
+        self.assertEqual(
+            urls, {f"http://testserver{reverse(zaak)}" for zaak in (zaak1, zaak2)}
+        )
+
+    @override_settings(AUTHORIZATIONS_JOIN_THRESHOLD=0)
+    def test_zaak_list_joined(self):
+        self.test_zaak_list()
+
+    def test_zaak_retrieve(self):
+        zaak1 = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        zaak2 = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+        )
+        zaak3 = ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        response1 = self.client.get(reverse(zaak1), **ZAAK_READ_KWARGS)
+        response2 = self.client.get(reverse(zaak2), **ZAAK_READ_KWARGS)
+        response3 = self.client.get(reverse(zaak3), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response1.status_code, status.HTTP_200_OK)
+        self.assertEqual(response2.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response3.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_zaak_create(self):
+        data = {
+            "zaaktype": f"http://testserver{reverse(self.zaaktype)}",
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            "bronorganisatie": "517439943",
+            "verantwoordelijkeOrganisatie": "517439943",
+            "registratiedatum": "2018-06-11",
+            "startdatum": "2018-06-11",
+        }
+
+        response = self.client.post(reverse("zaak-list"), data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+    def test_zaak_create_other_catalogus(self):
+        data = {
+            "zaaktype": f"http://testserver{reverse(ZaakTypeFactory.create())}",
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            "bronorganisatie": "517439943",
+            "verantwoordelijkeOrganisatie": "517439943",
+            "registratiedatum": "2018-06-11",
+            "startdatum": "2018-06-11",
+        }
+
+        response = self.client.post(reverse("zaak-list"), data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,261 @@
+"""
+Guarantee that the authorizations are loaded only once per request.
+"""
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework.versioning import URLPathVersioning
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.constants import (
+    ComponentTypes,
+    RolTypes,
+    VertrouwelijkheidsAanduiding,
+    ZaakobjectTypes,
+)
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.models import ZaakType
+from openzaak.components.catalogi.tests.factories import (
+    EigenschapFactory,
+    RolTypeFactory,
+    StatusTypeFactory,
+    ZaakTypeFactory,
+)
+from openzaak.utils.resources import resolved_paths
+from openzaak.utils.tests import AuthorizationQueriesMixin, JWTAuthMixin
+
+from ..api.permissions import ZaakAuthRequired
+from ..api.scopes import (
+    SCOPE_STATUSSEN_TOEVOEGEN,
+    SCOPE_ZAKEN_ALLES_LEZEN,
+    SCOPE_ZAKEN_BIJWERKEN,
+    SCOPE_ZAKEN_CREATE,
+)
+from ..api.serializers import ZaakSerializer
+from ..models import Zaak
+from .factories import ZaakFactory
+from .utils import ZAAK_READ_KWARGS, ZAAK_WRITE_KWARGS, get_operation_url, isodatetime
+
+
+class AuthorizationQueriesTests(AuthorizationQueriesMixin, JWTAuthMixin, APITestCase):
+    scopes = [
+        SCOPE_ZAKEN_CREATE,
+        SCOPE_ZAKEN_BIJWERKEN,
+        SCOPE_ZAKEN_ALLES_LEZEN,
+        SCOPE_STATUSSEN_TOEVOEGEN,
+    ]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.geheim
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        self.zaak_url = f"http://testserver{reverse(self.zaak)}"
+
+    def test_create_zaak(self):
+        url = reverse("zaak-list")
+        data = {
+            "zaaktype": f"http://testserver{reverse(self.zaaktype)}",
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            "bronorganisatie": "517439943",
+            "verantwoordelijkeOrganisatie": "517439943",
+            "registratiedatum": "2018-06-11",
+            "startdatum": "2018-06-11",
+        }
+
+        with self.assertMaxAuthorizationQueries(1):
+            response = self.client.post(url, data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+    def test_update_zaak(self):
+        with self.assertMaxAuthorizationQueries(1):
+            response = self.client.patch(
+                self.zaak_url, {"omschrijving": "updated"}, **ZAAK_WRITE_KWARGS
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+    def test_create_status(self):
+        statustype = StatusTypeFactory.create(zaaktype=self.zaaktype)
+        # setting the last status requires a resultaat
+        StatusTypeFactory.create(zaaktype=self.zaaktype)
+        data = {
+            "zaak": self.zaak_url,
+            "statustype": f"http://testserver{reverse(statustype)}",
+            "datumStatusGezet": isodatetime(2018, 10, 1, 10, 00, 00),
+        }
+
+        with self.assertMaxAuthorizationQueries(1):
+            response = self.client.post(reverse("status-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+    def test_create_rol(self):
+        roltype = RolTypeFactory.create(zaaktype=self.zaaktype)
+        data = {
+            "zaak": self.zaak_url,
+            "betrokkene": "http://www.zamora-silva.org/api/betrokkene/8768c581-2817-4fe5-933d-37af92d819dd",
+            "betrokkene_type": RolTypes.natuurlijk_persoon,
+            "roltype": f"http://testserver{reverse(roltype)}",
+            "roltoelichting": "awerw",
+        }
+
+        with self.assertMaxAuthorizationQueries(1):
+            response = self.client.post(reverse("rol-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+    @override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
+    def test_create_zaakobject(self):
+        data = {
+            "zaak": self.zaak_url,
+            "object": "http://example.org/api/zaakobjecten/8768c581-2817-4fe5-933d-37af92d819dd",
+            "objectType": ZaakobjectTypes.besluit,
+            "relatieomschrijving": "test",
+        }
+
+        with self.assertMaxAuthorizationQueries(1):
+            response = self.client.post(reverse("zaakobject-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+    def test_create_zaakeigenschap(self):
+        eigenschap = EigenschapFactory.create(zaaktype=self.zaaktype)
+        url = get_operation_url("zaakeigenschap_create", zaak_uuid=self.zaak.uuid)
+        data = {
+            "zaak": self.zaak_url,
+            "eigenschap": f"http://testserver{reverse(eigenschap)}",
+            "waarde": "overlast_water",
+        }
+
+        with self.assertMaxAuthorizationQueries(1):
+            response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+
+class AuthorizationFilterQueriesTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+        cls.zaaktypen = ZaakTypeFactory.create_batch(10)
+        for zaaktype in cls.zaaktypen:
+            Autorisatie.objects.create(
+                applicatie=cls.applicatie,
+                component=ComponentTypes.zrc,
+                scopes=[SCOPE_ZAKEN_ALLES_LEZEN],
+                zaaktype=f"http://testserver{reverse(zaaktype)}",
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+            )
+
+    def setUp(self):
+        super().setUp()
+
+        resolved_paths.clear()
+
+    def get_zaaktype_queries(self, context) -> list:
+        # the queries resolving the zaaktype URLs, as opposed to the ones
+        # looking up the zaaktype of a zaak
+        lookup = f'"{ZaakType._meta.db_table}"."uuid" IN'
+        return [
+            query["sql"] for query in context.captured_queries if lookup in query["sql"]
+        ]
+
+    def test_list_resolves_zaaktypen_at_once(self):
+        ZaakFactory.create(
+            zaaktype=self.zaaktypen[0],
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 1)
+        queries = self.get_zaaktype_queries(context)
+        self.assertEqual(len(queries), 1, "\n".join(queries))
+
+        # the resolved zaaktypen are remembered
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(self.get_zaaktype_queries(context), [])
+
+    def test_deleted_zaaktype_forgotten(self):
+        zaaktype = self.zaaktypen[-1]
+        self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+        path = reverse(zaaktype)
+        self.assertIsNotNone(resolved_paths.get((path, "pk")))
+
+        zaaktype.delete()
+
+        self.assertIsNone(resolved_paths.get((path, "pk")))
+        response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class PermissionFieldsProjectionTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.request = Request(APIRequestFactory().get("/"))
+        self.request.version = "1"
+        self.request.versioning_scheme = URLPathVersioning()
+
+    def test_fetched_with_single_query(self):
+        zaak = ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim
+        )
+        zaak = Zaak.objects.only("pk").get(pk=zaak.pk)
+
+        with self.assertNumQueries(1):
+            data = ZaakAuthRequired().format_data(zaak, self.request)
+
+        self.assertEqual(
+            data,
+            {
+                "zaaktype": f"http://testserver{reverse(zaak.zaaktype)}",
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.geheim,
+            },
+        )
+
+    def test_loaded_values_used(self):
+        zaak = ZaakFactory.create()
+        zaak = Zaak.objects.select_related("zaaktype").get(pk=zaak.pk)
+
+        with self.assertNumQueries(0):
+            data = ZaakAuthRequired().format_data(zaak, self.request)
+
+        serialized = ZaakSerializer(zaak, context={"request": self.request}).data
+        self.assertEqual(data["zaaktype"], serialized["zaaktype"])
+        self.assertEqual(
+            data["vertrouwelijkheidaanduiding"],
+            serialized["vertrouwelijkheidaanduiding"],
+        )
@@ -0,0 +1,288 @@
+"""
+Create several sub-resources of zaken at once by posting a list, see
+:class:`openzaak.utils.viewsets.BulkCreateMixin`.
+"""
+from datetime import date
+from unittest.mock import patch
+from urllib.parse import urlencode
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import (
+    Archiefnominatie,
+    BrondatumArchiefprocedureAfleidingswijze,
+    RolOmschrijving,
+    RolTypes,
+)
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import (
+    EigenschapFactory,
+    ResultaatTypeFactory,
+    RolTypeFactory,
+    StatusTypeFactory,
+)
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_STATUSSEN_TOEVOEGEN, SCOPE_ZAKEN_CREATE
+from ..models import Rol, Status, ZaakEigenschap
+from .factories import ResultaatFactory, ZaakFactory
+from .utils import get_operation_url
+
+
+def get_status(zaak, statustype, datum_status_gezet: str) -> dict:
+    return {
+        "zaak": f"http://testserver{reverse(zaak)}",
+        "statustype": f"http://testserver{reverse(statustype)}",
+        "datumStatusGezet": datum_status_gezet,
+    }
+
+
+def create_resultaat(zaak) -> None:
+    # the archive parameters are derived from the resultaat when closing the zaak
+    resultaattype = ResultaatTypeFactory.create(
+        archiefactietermijn="P10Y",
+        archiefnominatie=Archiefnominatie.blijvend_bewaren,
+        brondatum_archiefprocedure_afleidingswijze=BrondatumArchiefprocedureAfleidingswijze.afgehandeld,
+        zaaktype=zaak.zaaktype,
+    )
+    ResultaatFactory.create(zaak=zaak, resultaattype=resultaattype)
+
+
+class BulkCreateTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaak = ZaakFactory.create()
+        self.zaak_url = f"http://testserver{reverse(self.zaak)}"
+
+    def get_rol(self, zaak, **kwargs) -> dict:
+        roltype = RolTypeFactory.create(zaaktype=zaak.zaaktype, **kwargs)
+        return {
+            "zaak": f"http://testserver{reverse(zaak)}",
+            "betrokkene": "https://example.com/medewerker/1",
+            "betrokkeneType": RolTypes.medewerker,
+            "roltype": f"http://testserver{reverse(roltype)}",
+            "roltoelichting": "Behandelaar",
+        }
+
+    def test_create_rollen(self):
+        data = [self.get_rol(self.zaak) for _ in range(3)]
+
+        response = self.client.post(reverse("rol-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(len(response.json()), 3)
+        self.assertEqual(
+            [item["roltype"] for item in response.json()],
+            [item["roltype"] for item in data],
+        )
+        self.assertEqual(Rol.objects.filter(zaak=self.zaak).count(), 3)
+
+        audittrails = AuditTrail.objects.filter(hoofd_object=self.zaak_url)
+        self.assertEqual(
+            {trail.resource_url for trail in audittrails},
+            {item["url"] for item in response.json()},
+        )
+        for trail in audittrails:
+            self.assertEqual(trail.actie, "create")
+            self.assertEqual(trail.resultaat, 201)
+            self.assertEqual(trail.resource, "rol")
+
+    def test_create_single_rol(self):
+        response = self.client.post(reverse("rol-list"), self.get_rol(self.zaak))
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertIsInstance(response.json(), dict)
+
+    def test_invalid_item(self):
+        data = [self.get_rol(self.zaak), self.get_rol(self.zaak)]
+        data[1]["roltype"] = "http://testserver/foo"
+
+        response = self.client.post(reverse("rol-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [param["name"] for param in response.json()["invalidParams"]], ["1.roltype"]
+        )
+        self.assertFalse(Rol.objects.exists())
+        self.assertFalse(AuditTrail.objects.exists())
+
+    def test_max_occurences_within_request(self):
+        rol = self.get_rol(
+            self.zaak,
+            omschrijving=RolOmschrijving.initiator,
+            omschrijving_generiek=RolOmschrijving.initiator,
+        )
+
+        response = self.client.post(reverse("rol-list"), [rol, rol])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json()["invalidParams"],
+            [
+                {
+                    "name": "1.roltype",
+                    "code": "max-occurences",
+                    "reason": response.json()["invalidParams"][0]["reason"],
+                }
+            ],
+        )
+        self.assertFalse(Rol.objects.exists())
+
+    def test_shared_lookups(self):
+        roltype_url = self.get_rol(self.zaak)["roltype"]
+        data = [dict(self.get_rol(self.zaak), roltype=roltype_url) for _ in range(5)]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(reverse("rol-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        roltype_queries = [
+            query
+            for query in context.captured_queries
+            if query["sql"].startswith('SELECT "catalogi_roltype"')
+        ]
+        self.assertEqual(len(roltype_queries), 1)
+
+    def test_create_statussen(self):
+        statustype_1 = StatusTypeFactory.create(zaaktype=self.zaak.zaaktype)
+        statustype_2 = StatusTypeFactory.create(zaaktype=self.zaak.zaaktype)
+        StatusTypeFactory.create(zaaktype=self.zaak.zaaktype)
+        data = [
+            {
+                "zaak": self.zaak_url,
+                "statustype": f"http://testserver{reverse(statustype)}",
+                "datumStatusGezet": datum_status_gezet,
+            }
+            for statustype, datum_status_gezet in (
+                (statustype_1, "2019-01-01T12:00:00Z"),
+                (statustype_2, "2019-01-02T12:00:00Z"),
+            )
+        ]
+
+        response = self.client.post(reverse("status-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.zaak.refresh_from_db()
+        self.assertEqual(self.zaak.current_status.statustype, statustype_2)
+        self.assertEqual(Status.objects.filter(zaak=self.zaak).count(), 2)
+
+    def test_create_statussen_with_eindstatus(self):
+        statustype = StatusTypeFactory.create(zaaktype=self.zaak.zaaktype)
+        eindstatustype = StatusTypeFactory.create(zaaktype=self.zaak.zaaktype)
+        create_resultaat(self.zaak)
+        data = [
+            get_status(self.zaak, statustype, "2019-01-01T12:00:00Z"),
+            get_status(self.zaak, eindstatustype, "2019-01-02T12:00:00Z"),
+        ]
+
+        response = self.client.post(reverse("status-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.zaak.refresh_from_db()
+        self.assertEqual(self.zaak.current_status.statustype, eindstatustype)
+        self.assertEqual(self.zaak.einddatum, date(2019, 1, 2))
+        self.assertEqual(self.zaak.archiefnominatie, Archiefnominatie.blijvend_bewaren)
+        self.assertEqual(self.zaak.archiefactiedatum, date(2029, 1, 2))
+
+    def test_create_zaakeigenschappen(self):
+        url = get_operation_url("zaakeigenschap_create", zaak_uuid=self.zaak.uuid)
+        data = [
+            {
+                "zaak": self.zaak_url,
+                "eigenschap": f"http://testserver{reverse(eigenschap)}",
+                "waarde": "overlast_water",
+            }
+            for eigenschap in EigenschapFactory.create_batch(
+                2, zaaktype=self.zaak.zaaktype
+            )
+        ]
+
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(ZaakEigenschap.objects.filter(zaak=self.zaak).count(), 2)
+
+    @override_settings(NOTIFICATIONS_DISABLED=False)
+    @patch("zds_client.Client.from_url")
+    def test_notifications_per_zaak(self, mock_client):
+        client = mock_client.return_value
+        other_zaak = ZaakFactory.create()
+        data = [
+            self.get_rol(self.zaak),
+            self.get_rol(other_zaak),
+            self.get_rol(self.zaak),
+        ]
+
+        response = self.client.post(reverse("rol-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(client.create.call_count, 2)
+        messages = [call[0][1] for call in client.create.call_args_list]
+        self.assertEqual(
+            [message["hoofdObject"] for message in messages],
+            [self.zaak_url, data[1]["zaak"]],
+        )
+        self.assertEqual(
+            messages[0]["resourceUrl"],
+            f"http://testserver{reverse('rol-list')}?{urlencode({'zaak': self.zaak_url})}",
+        )
+        self.assertEqual(messages[0]["resource"], "rol")
+        self.assertEqual(messages[0]["actie"], "create")
+
+
+class BulkCreateScopeTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_CREATE]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaak = ZaakFactory.create()
+        cls.zaaktype = cls.zaak.zaaktype
+        super().setUpTestData()
+
+    def test_create_statussen_initial_status_only(self):
+        data = [
+            {
+                "zaak": f"http://testserver{reverse(self.zaak)}",
+                "statustype": f"http://testserver{reverse(statustype)}",
+                "datumStatusGezet": "2019-01-01T12:00:00Z",
+            }
+            for statustype in StatusTypeFactory.create_batch(2, zaaktype=self.zaaktype)
+        ]
+        # the eindstatus
+        StatusTypeFactory.create(zaaktype=self.zaaktype)
+
+        response = self.client.post(reverse("status-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Status.objects.exists())
+
+    def test_create_statussen_reopen_after_eindstatus(self):
+        statustype = StatusTypeFactory.create(zaaktype=self.zaaktype)
+        eindstatustype = StatusTypeFactory.create(zaaktype=self.zaaktype)
+        create_resultaat(self.zaak)
+        self.autorisatie.scopes = [SCOPE_STATUSSEN_TOEVOEGEN]
+        self.autorisatie.save()
+        data = [
+            get_status(self.zaak, eindstatustype, "2019-01-01T12:00:00Z"),
+            get_status(self.zaak, statustype, "2019-01-02T12:00:00Z"),
+        ]
+
+        response = self.client.post(reverse("status-list"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(
+            response.json()["detail"],
+            "Reopening a closed case with current scope is forbidden",
+        )
+        self.assertFalse(Status.objects.exists())
+        self.zaak.refresh_from_db()
+        self.assertIsNone(self.zaak.einddatum)
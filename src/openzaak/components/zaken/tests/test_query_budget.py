@@ -0,0 +1,90 @@
+"""
+Guarantee that the number of queries to output zaken does not grow with the
+number of zaken, see :func:`openzaak.utils.query.apply_query_plan`.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from ..constants import AardZaakRelatie
+from ..models import RelevanteZaakRelatie, ZaakKenmerk
+from .factories import ResultaatFactory, StatusFactory, ZaakFactory
+from .utils import ZAAK_READ_KWARGS
+
+# count, paginated zaken, deelzaken, kenmerken, relevante andere zaken
+LIST_QUERIES = 5
+
+
+class ZaakQueryBudgetTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.zeer_geheim
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def create_zaak(self):
+        hoofdzaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype, hoofdzaak=hoofdzaak)
+        StatusFactory.create_batch(2, zaak=zaak)
+        ResultaatFactory.create(zaak=zaak)
+        ZaakKenmerk.objects.create(zaak=zaak, kenmerk="kenmerk", bron="bron")
+        RelevanteZaakRelatie.objects.create(
+            zaak=zaak, url=hoofdzaak, aard_relatie=AardZaakRelatie.vervolg
+        )
+        return zaak
+
+    def count_queries(self, url: str, **params) -> int:
+        # the authorizations are loaded once and cached
+        self.client.get(url, params, **ZAAK_READ_KWARGS)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_list(self):
+        self.create_zaak()
+        url = reverse("zaak-list")
+
+        queries = self.count_queries(url)
+
+        for _ in range(10):
+            self.create_zaak()
+
+        self.assertEqual(self.count_queries(url), queries)
+        self.assertLessEqual(queries, LIST_QUERIES)
+
+    def test_list_output(self):
+        zaak = self.create_zaak()
+
+        response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        data = next(
+            item
+            for item in response.json()["results"]
+            if item["url"].endswith(str(zaak.uuid))
+        )
+        current_status = zaak.status_set.order_by("-datum_status_gezet").first()
+        self.assertTrue(data["status"].endswith(str(current_status.uuid)))
+        self.assertTrue(data["resultaat"].endswith(str(zaak.resultaat.uuid)))
+        self.assertTrue(data["hoofdzaak"].endswith(str(zaak.hoofdzaak.uuid)))
+        self.assertEqual(len(data["relevanteAndereZaken"]), 1)
+        self.assertEqual(data["kenmerken"], [{"kenmerk": "kenmerk", "bron": "bron"}])
+
+    def test_retrieve(self):
+        zaak = self.create_zaak()
+
+        queries = self.count_queries(reverse(zaak))
+
+        self.assertLessEqual(queries, LIST_QUERIES)
@@ -1,10 +1,19 @@
+from django.core.management import call_command
+from django.test import TestCase
+
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.tests import reverse
 
+from openzaak.components.catalogi.tests.factories import (
+    StatusTypeFactory,
+    ZaakTypeFactory,
+)
 from openzaak.utils.tests import JWTAuthMixin
 
-from .factories import StatusFactory
+from ..models import Zaak
+from .factories import StatusFactory, ZaakFactory
+from .utils import ZAAK_READ_KWARGS, isodatetime, utcdatetime
 
 
 class StatusTests(JWTAuthMixin, APITestCase):
@@ -28,3 +37,76 @@ class StatusTests(JWTAuthMixin, APITestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["url"], f"http://testserver{status1_url}")
         self.assertNotEqual(response.data[0]["url"], f"http://testserver{status2_url}")
+
+    def test_current_status_maintained(self):
+        zaaktype = ZaakTypeFactory.create()
+        statustype = StatusTypeFactory.create(zaaktype=zaaktype)
+        StatusTypeFactory.create(zaaktype=zaaktype)
+        zaak = ZaakFactory.create(zaaktype=zaaktype)
+        zaak_url = reverse(zaak)
+
+        for day in [2, 1]:
+            response = self.client.post(
+                reverse("status-list"),
+                {
+                    "zaak": zaak_url,
+                    "statustype": f"http://testserver{reverse(statustype)}",
+                    "datumStatusGezet": isodatetime(2018, 10, day, 10, 00, 00),
+                },
+            )
+            self.assertEqual(
+                response.status_code, status.HTTP_201_CREATED, response.data
+            )
+
+        # the status set later in time remains the current one
+        zaak.refresh_from_db()
+        self.assertEqual(
+            zaak.current_status.datum_status_gezet, utcdatetime(2018, 10, 2, 10)
+        )
+
+        response = self.client.get(zaak_url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(
+            response.json()["status"],
+            f"http://testserver{reverse(zaak.current_status)}",
+        )
+
+
+class CurrentStatusTests(TestCase):
+    def test_backfill(self):
+        zaken = ZaakFactory.create_batch(3)
+        statussen = [
+            StatusFactory.create(
+                zaak=zaak, datum_status_gezet=utcdatetime(2018, 10, day)
+            )
+            for zaak in zaken[:2]
+            for day in [1, 2]
+        ]
+        Zaak.objects.update(current_status=None)
+
+        call_command("backfill_current_status", chunk_size=1, verbosity=0)
+
+        current_statussen = dict(Zaak.objects.values_list("pk", "current_status"))
+        self.assertEqual(
+            current_statussen,
+            {
+                zaken[0].pk: statussen[1].pk,
+                zaken[1].pk: statussen[3].pk,
+                zaken[2].pk: None,
+            },
+        )
+
+    def test_deleted_status(self):
+        zaak = ZaakFactory.create()
+        first = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=utcdatetime(2018, 10, 1)
+        )
+        StatusFactory.create(zaak=zaak, datum_status_gezet=utcdatetime(2018, 10, 2))
+
+        zaak.refresh_from_db()
+
+        zaak.current_status.delete()
+        Zaak.objects.filter(pk=zaak.pk).update_current_status()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.current_status, first)
@@ -0,0 +1,56 @@
+"""
+Test the streaming of large list responses, see :mod:`openzaak.utils.streaming`.
+"""
+import json
+from unittest.mock import patch
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.viewsets import StatusViewSet
+from .factories import StatusFactory
+
+
+class StreamingTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def get(self, viewset, url: str, threshold: int, **kwargs):
+        with patch.object(viewset, "stream_threshold", threshold), patch.object(
+            viewset, "stream_chunk_size", 2
+        ):
+            return self.client.get(url, **kwargs)
+
+    def assertStreamed(self, response, expected):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+        content = b"".join(response.streaming_content)
+        self.assertEqual(json.loads(content), expected.json())
+
+    def test_unpaginated(self):
+        StatusFactory.create_batch(5)
+        url = reverse("status-list")
+
+        response = self.get(StatusViewSet, url, threshold=1)
+
+        expected = self.get(StatusViewSet, url, threshold=1000)
+        self.assertFalse(expected.streaming)
+        self.assertEqual(len(expected.json()), 5)
+        self.assertStreamed(response, expected)
+
+    def test_unpaginated_below_threshold(self):
+        StatusFactory.create_batch(2)
+
+        response = self.get(StatusViewSet, reverse("status-list"), threshold=2)
+
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(response.json()), 2)
+
+    def test_empty(self):
+        response = self.get(StatusViewSet, reverse("status-list"), threshold=0)
+
+        self.assertEqual(response.json(), [])
@@ -0,0 +1,148 @@
+"""
+Conditional requests on zaken, see :class:`openzaak.utils.viewsets.ETagMixin`.
+"""
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..models import Zaak
+from .factories import ResultaatFactory, StatusFactory, ZaakFactory
+from .utils import ZAAK_READ_KWARGS, ZAAK_WRITE_KWARGS
+
+
+class ZaakETagTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaak = ZaakFactory.create()
+        self.url = reverse(self.zaak)
+
+    def get_etag(self, url: str, **params) -> str:
+        response = self.client.get(url, params, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response["ETag"]
+
+    def test_not_modified(self):
+        etag = self.get_etag(self.url)
+
+        response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=etag, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_modified(self):
+        etag = self.get_etag(self.url)
+
+        self.zaak.toelichting = "gewijzigd"
+        self.zaak.save()
+
+        response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=etag, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_modified_related(self):
+        etags = {self.get_etag(self.url)}
+
+        StatusFactory.create(zaak=self.zaak)
+        Zaak.objects.filter(pk=self.zaak.pk).update_current_status()
+        etags.add(self.get_etag(self.url))
+
+        ResultaatFactory.create(zaak=self.zaak)
+        etags.add(self.get_etag(self.url))
+
+        ZaakFactory.create(hoofdzaak=self.zaak)
+        etags.add(self.get_etag(self.url))
+
+        self.assertEqual(len(etags), 4)
+
+    def test_etag_depends_on_fields(self):
+        self.assertNotEqual(
+            self.get_etag(self.url), self.get_etag(self.url, fields="url")
+        )
+
+    def test_no_etag_with_expand(self):
+        response = self.client.get(self.url, {"expand": "zaaktype"}, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", response)
+
+    def test_list(self):
+        url = reverse("zaak-list")
+        etag = self.get_etag(url)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        for change in (
+            lambda: ZaakFactory.create(),
+            lambda: self.zaak.save(),
+            lambda: self.zaak.delete(),
+        ):
+            with self.subTest(change=change):
+                change()
+
+                response = self.client.get(
+                    url, HTTP_IF_NONE_MATCH=etag, **ZAAK_READ_KWARGS
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertNotEqual(response["ETag"], etag)
+                etag = response["ETag"]
+
+    def test_if_match(self):
+        etag = self.get_etag(self.url)
+
+        response = self.client.patch(
+            self.url,
+            {"toelichting": "gewijzigd"},
+            HTTP_IF_MATCH=etag,
+            **ZAAK_WRITE_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        # the ETag is outdated now
+        response = self.client.patch(
+            self.url,
+            {"toelichting": "opnieuw gewijzigd"},
+            HTTP_IF_MATCH=etag,
+            **ZAAK_WRITE_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.zaak.refresh_from_db()
+        self.assertEqual(self.zaak.toelichting, "gewijzigd")
+
+    def test_weak_if_none_match(self):
+        etag = self.get_etag(self.url)
+
+        response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=f"W/{etag}", **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_weak_if_match(self):
+        etag = self.get_etag(self.url)
+
+        # If-Match uses the strong comparison, weak ETags never match
+        response = self.client.patch(
+            self.url,
+            {"toelichting": "gewijzigd"},
+            HTTP_IF_MATCH=f"W/{etag}",
+            **ZAAK_WRITE_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.zaak.refresh_from_db()
+        self.assertEqual(self.zaak.toelichting, "")
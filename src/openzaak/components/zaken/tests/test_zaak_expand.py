@@ -0,0 +1,172 @@
+"""
+Output related resources as nested objects with ``?expand=``, see
+:class:`openzaak.utils.serializers.FlexFieldsSerializerMixin`.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.constants import (
+    ComponentTypes,
+    RolTypes,
+    VertrouwelijkheidsAanduiding,
+)
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.api.scopes import SCOPE_ZAAKTYPES_READ
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from .factories import ResultaatFactory, RolFactory, StatusFactory, ZaakFactory
+from .utils import ZAAK_READ_KWARGS
+
+
+class ZaakExpandTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def create_zaak(self):
+        zaak = ZaakFactory.create()
+        StatusFactory.create_batch(2, zaak=zaak)
+        ResultaatFactory.create(zaak=zaak)
+        RolFactory.create_batch(2, zaak=zaak, betrokkene_type=RolTypes.medewerker)
+        ZaakFactory.create(hoofdzaak=zaak)
+        return zaak
+
+    def count_queries(self, url: str, **params) -> int:
+        # the authorizations are loaded once and cached
+        self.client.get(url, params, **ZAAK_READ_KWARGS)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_expand(self):
+        zaak = self.create_zaak()
+        current_status = zaak.status_set.order_by("-datum_status_gezet").first()
+
+        response = self.client.get(
+            reverse(zaak),
+            {"expand": "zaaktype,status.statustype,rollen,deelzaken"},
+            **ZAAK_READ_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            data["zaaktype"]["identificatie"], zaak.zaaktype.zaaktype_identificatie
+        )
+        self.assertTrue(data["status"]["url"].endswith(str(current_status.uuid)))
+        self.assertEqual(
+            data["status"]["statustype"]["omschrijving"],
+            current_status.statustype.statustype_omschrijving,
+        )
+        self.assertEqual(len(data["rollen"]), 2)
+        self.assertEqual(len(data["deelzaken"]), 1)
+        self.assertIn("zaaktype", data["deelzaken"][0])
+        # not expanded
+        self.assertIsInstance(data["resultaat"], str)
+
+    def test_expand_fields(self):
+        zaak = self.create_zaak()
+
+        response = self.client.get(
+            reverse(zaak),
+            {"expand": "status", "fields": "url,status.url"},
+            **ZAAK_READ_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["status"], {"url": response.json()["status"]["url"]}
+        )
+
+    def test_expand_batched(self):
+        self.create_zaak()
+        url = reverse("zaak-list")
+        expand = "zaaktype,status,resultaat.resultaattype,rollen.roltype,deelzaken"
+
+        queries = self.count_queries(url, expand=expand)
+
+        for _ in range(5):
+            self.create_zaak()
+
+        self.assertEqual(self.count_queries(url, expand=expand), queries)
+
+
+class ZaakExpandAuthorizationTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        # other zaaktype
+        ZaakFactory.create(
+            hoofdzaak=self.zaak,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        # too confidential
+        ZaakFactory.create(
+            hoofdzaak=self.zaak,
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        self.deelzaak = ZaakFactory.create(
+            hoofdzaak=self.zaak,
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+    def test_expand_filtered(self):
+        response = self.client.get(
+            reverse("zaak-list"), {"expand": "deelzaken"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = next(
+            item
+            for item in response.json()["results"]
+            if item["url"].endswith(str(self.zaak.uuid))
+        )
+        # the URLs aren't filtered, the expanded objects are
+        self.assertEqual(len(data["deelzaken"]), 1)
+        self.assertTrue(data["deelzaken"][0]["url"].endswith(str(self.deelzaak.uuid)))
+
+    def test_expand_without_scope(self):
+        response = self.client.get(
+            reverse(self.zaak), {"expand": "zaaktype"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.json()["zaaktype"])
+
+    def test_expand_with_scope(self):
+        Autorisatie.objects.create(
+            applicatie=self.applicatie,
+            component=ComponentTypes.ztc,
+            scopes=[SCOPE_ZAAKTYPES_READ],
+        )
+
+        response = self.client.get(
+            reverse(self.zaak), {"expand": "zaaktype"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["zaaktype"]["url"],
+            f"http://testserver{reverse(self.zaaktype)}",
+        )
@@ -0,0 +1,99 @@
+"""
+Select the fields to output with ``?fields=`` and ``?omit=``, see
+:class:`openzaak.utils.serializers.FlexFieldsSerializerMixin`.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import RolTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from .factories import RolFactory, StatusFactory, ZaakFactory
+from .utils import ZAAK_READ_KWARGS
+
+
+class ZaakFieldsTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.zeer_geheim
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def setUp(self):
+        super().setUp()
+
+        hoofdzaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        self.zaak = ZaakFactory.create(zaaktype=self.zaaktype, hoofdzaak=hoofdzaak)
+        StatusFactory.create(zaak=self.zaak)
+
+    def get(self, url: str, **params):
+        # the authorizations are loaded once and cached
+        self.client.get(url, params, **ZAAK_READ_KWARGS)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return response, context.captured_queries
+
+    def test_fields(self):
+        response, _ = self.get(reverse(self.zaak), fields="url,einddatumGepland,status")
+
+        self.assertEqual(list(response.json()), ["url", "einddatumGepland", "status"])
+
+    def test_omit(self):
+        response, _ = self.get(reverse(self.zaak), omit="deelzaken,einddatumGepland")
+
+        data = response.json()
+        self.assertNotIn("deelzaken", data)
+        self.assertNotIn("einddatumGepland", data)
+        self.assertIn("hoofdzaak", data)
+
+    def test_list(self):
+        response, _ = self.get(reverse("zaak-list"), fields="url")
+
+        for item in response.json()["results"]:
+            self.assertEqual(list(item), ["url"])
+
+    def test_omit_skips_prefetch(self):
+        url = reverse("zaak-list")
+        _, queries = self.get(url)
+
+        _, omitted = self.get(url, omit="deelzaken,kenmerken")
+
+        self.assertEqual(len(omitted), len(queries) - 2)
+
+    def test_omit_skips_join(self):
+        _, queries = self.get(reverse("zaak-list"), omit="status")
+
+        self.assertFalse(
+            any('"zaken_status"' in query["sql"] for query in queries), queries
+        )
+
+    def test_fields_skip_joins(self):
+        _, queries = self.get(reverse("zaak-list"), fields="url,uuid")
+
+        for query in queries:
+            self.assertNotIn("JOIN", query["sql"])
+
+    def test_unknown_query_param(self):
+        response = self.client.get(
+            reverse("zaak-list"), {"fields": "url", "foo": "bar"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_polymorphic_fields(self):
+        rol = RolFactory.create(zaak=self.zaak, betrokkene_type=RolTypes.medewerker)
+
+        response, _ = self.get(reverse(rol), fields="url,betrokkeneType")
+
+        self.assertEqual(list(response.json()), ["url", "betrokkeneType"])
@@ -0,0 +1,113 @@
+"""
+Retrieve several zaken at once, see :class:`openzaak.utils.viewsets.MultiGetMixin`.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from .factories import ZaakFactory
+from .utils import ZAAK_WRITE_KWARGS
+
+
+class ZaakMultiGetTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.url = reverse("zaak--multiget")
+
+    def test_multiget_uuids(self):
+        zaak_1, zaak_2, _ = ZaakFactory.create_batch(3)
+
+        response = self.client.post(
+            self.url, {"uuids": [zaak_1.uuid, zaak_2.uuid]}, **ZAAK_WRITE_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            {item["url"] for item in response.json()},
+            {
+                f"http://testserver{reverse(zaak_1)}",
+                f"http://testserver{reverse(zaak_2)}",
+            },
+        )
+
+    def test_multiget_urls(self):
+        zaak_1, zaak_2, _ = ZaakFactory.create_batch(3)
+        urls = [
+            f"http://testserver{reverse(zaak_1)}",
+            f"http://testserver{reverse(zaak_2)}",
+            # not a zaak
+            f"http://testserver{reverse(zaak_1.zaaktype)}",
+            "http://testserver/foo",
+        ]
+
+        response = self.client.post(self.url, {"urls": urls}, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual({item["url"] for item in response.json()}, set(urls[:2]))
+
+    def test_multiget_required(self):
+        response = self.client.post(self.url, {}, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["invalidParams"][0]["code"], "required")
+
+    def test_multiget_queries(self):
+        def count_queries(zaken) -> int:
+            urls = [f"http://testserver{reverse(zaak)}" for zaak in zaken]
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(
+                    self.url, {"urls": urls}, **ZAAK_WRITE_KWARGS
+                )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(context.captured_queries)
+
+        # the authorizations are loaded once and cached
+        queries = count_queries(ZaakFactory.create_batch(2))
+
+        self.assertEqual(count_queries(ZaakFactory.create_batch(10)), queries)
+
+
+class ZaakMultiGetAuthorizationTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def test_multiget_filtered(self):
+        zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        other_zaaktype = ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+        too_confidential = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+
+        response = self.client.post(
+            reverse("zaak--multiget"),
+            {"uuids": [zaak.uuid, other_zaaktype.uuid, too_confidential.uuid]},
+            **ZAAK_WRITE_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            [item["url"] for item in response.json()],
+            [f"http://testserver{reverse(zaak)}"],
+        )
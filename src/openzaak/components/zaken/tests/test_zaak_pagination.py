@@ -0,0 +1,137 @@
+"""
+Test the pagination of large tables, see :mod:`openzaak.utils.pagination`.
+"""
+from datetime import date
+from unittest.mock import patch
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.utils.pagination import EstimatedCount, KeysetPagination
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.viewsets import ZaakViewSet
+from ..models import Zaak
+from .factories import ZaakFactory
+from .utils import ZAAK_READ_KWARGS
+
+
+@patch.object(KeysetPagination, "page_size", 2)
+class ZaakCursorPaginationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.zaaktype = ZaakTypeFactory.create()
+
+    def get_pages(self, url: str, params: dict, link: str = "next") -> list:
+        response = self.client.get(url, params, **ZAAK_READ_KWARGS)
+        pages = []
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertNotIn("count", data)
+            pages.append([zaak["identificatie"] for zaak in data["results"]])
+
+            if not data[link]:
+                return pages
+            response = self.client.get(data[link], **ZAAK_READ_KWARGS)
+
+    def test_pagination(self):
+        for identificatie in "ABCDE":
+            ZaakFactory.create(zaaktype=self.zaaktype, identificatie=identificatie)
+
+        pages = self.get_pages(reverse(Zaak), {"cursor": ""})
+
+        self.assertEqual(pages, [["E", "D"], ["C", "B"], ["A"]])
+
+    def test_previous(self):
+        for identificatie in "ABCDE":
+            ZaakFactory.create(zaaktype=self.zaaktype, identificatie=identificatie)
+        url = reverse(Zaak)
+
+        last_page = self.client.get(url, {"cursor": ""}, **ZAAK_READ_KWARGS)
+        while last_page.json()["next"]:
+            last_page = self.client.get(last_page.json()["next"], **ZAAK_READ_KWARGS)
+        previous = last_page.json()["previous"]
+
+        pages = self.get_pages(previous, {}, link="previous")
+
+        self.assertEqual(pages, [["C", "B"], ["E", "D"]])
+
+    def test_ordering_on_non_unique_field(self):
+        for identificatie, day in zip("ABCDE", [2, 1, 2, 1, 2]):
+            ZaakFactory.create(
+                zaaktype=self.zaaktype,
+                identificatie=identificatie,
+                startdatum=date(2019, 1, day),
+            )
+
+        pages = self.get_pages(reverse(Zaak), {"cursor": "", "ordering": "startdatum"})
+
+        self.assertEqual(pages, [["B", "D"], ["A", "C"], ["E"]])
+
+    def test_stable_under_inserts(self):
+        for identificatie in "ABC":
+            ZaakFactory.create(zaaktype=self.zaaktype, identificatie=identificatie)
+
+        response = self.client.get(reverse(Zaak), {"cursor": ""}, **ZAAK_READ_KWARGS)
+        ZaakFactory.create(zaaktype=self.zaaktype, identificatie="D")
+        response = self.client.get(response.json()["next"], **ZAAK_READ_KWARGS)
+
+        identificaties = [zaak["identificatie"] for zaak in response.json()["results"]]
+        self.assertEqual(identificaties, ["A"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            reverse(Zaak), {"cursor": "cD1mb28="}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_pagination_by_default(self):
+        ZaakFactory.create_batch(3, zaaktype=self.zaaktype)
+
+        response = self.client.get(reverse(Zaak), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.json()["count"], 3)
+
+
+@patch.object(ZaakViewSet, "count_strategy", EstimatedCount(threshold=2))
+class ZaakEstimatedCountTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_exact_below_threshold(self):
+        ZaakFactory.create_batch(2)
+
+        response = self.client.get(reverse(Zaak), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.json()["count"], 2)
+        self.assertNotIn("X-Count-Approximate", response)
+
+    @patch.object(EstimatedCount, "estimate", return_value=1)
+    def test_estimated_above_threshold(self, mock_estimate):
+        ZaakFactory.create_batch(5)
+
+        with patch("openzaak.utils.pagination.OptionalCursorPagination.page_size", 2):
+            response = self.client.get(reverse(Zaak), **ZAAK_READ_KWARGS)
+            pages = [response.json()]
+            while pages[-1]["next"]:
+                response = self.client.get(pages[-1]["next"], **ZAAK_READ_KWARGS)
+                pages.append(response.json())
+
+        self.assertEqual(response["X-Count-Approximate"], "true")
+        # never less than the exactly counted objects
+        self.assertEqual(pages[0]["count"], 3)
+        # the pages are not limited by the estimate
+        self.assertEqual([len(page["results"]) for page in pages], [2, 2, 1])
+
+    def test_planner_estimate(self):
+        ZaakFactory.create_batch(3)
+
+        estimate = EstimatedCount().estimate(Zaak.objects.all())
+
+        self.assertIsInstance(estimate, int)
@@ -485,6 +485,38 @@ class ZakenTests(JWTAuthMixin, APITestCase):
         self.assertEqual(response_gte.data["results"][0]["startdatum"], "2019-03-01")
         self.assertEqual(response_lte.data["results"][0]["startdatum"], "2019-01-01")
 
+    def test_filter_current_status(self):
+        zaak1, zaak2 = ZaakFactory.create_batch(2, zaaktype=self.zaaktype)
+        StatusFactory.create(
+            zaak=zaak1,
+            statustype=self.statustype,
+            datum_status_gezet=utcdatetime(2019, 1, 1),
+        )
+        current = StatusFactory.create(
+            zaak=zaak1,
+            statustype=self.statustype2,
+            datum_status_gezet=utcdatetime(2019, 1, 2),
+        )
+        StatusFactory.create(zaak=zaak2, statustype=self.statustype)
+        Zaak.objects.update_current_status()
+        url = reverse("zaak-list")
+
+        response_status = self.client.get(
+            url, {"status": f"http://testserver{reverse(current)}"}, **ZAAK_READ_KWARGS
+        )
+        response_statustype = self.client.get(
+            url,
+            {"status__statustype": f"http://testserver{reverse(self.statustype)}"},
+            **ZAAK_READ_KWARGS,
+        )
+
+        for response, zaak in [(response_status, zaak1), (response_statustype, zaak2)]:
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+            self.assertEqual(response.data["count"], 1)
+            self.assertEqual(
+                response.data["results"][0]["url"], f"http://testserver{reverse(zaak)}"
+            )
+
     def test_sort_startdatum(self):
         ZaakFactory.create(startdatum="2019-01-01", zaaktype=self.zaaktype)
         ZaakFactory.create(startdatum="2019-03-01", zaaktype=self.zaaktype)
@@ -27,3 +27,4 @@ AXES_BEHIND_REVERSE_PROXY = False
 # Open Zaak specific settings
 #
 NOTIFICATIONS_DISABLED = True
+CACHE_INVALIDATION_BUS = False
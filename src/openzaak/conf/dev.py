@@ -65,6 +65,9 @@ CACHES = {
     "axes": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
 }
 
+# the in memory cache has no pub/sub
+CACHE_INVALIDATION_BUS = False
+
 REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] += (
     "rest_framework.renderers.BrowsableAPIRenderer",
 )
@@ -128,6 +128,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "openzaak.utils.middleware.LogHeadersMiddleware",
+    "openzaak.utils.middleware.InvalidationBusMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     # 'django.middleware.locale.LocaleMiddleware',
     "django.middleware.common.CommonMiddleware",
@@ -338,6 +339,43 @@ SHOW_ALERT = True
 # settings for uploading large files
 MIN_UPLOAD_SIZE = config("MIN_UPLOAD_SIZE", 4 * 2 ** 30)
 
+# caching of the authorizations of clients (in seconds), shared between the
+# workers through the default cache, with a short-lived in-process tier in front
+AUTHORIZATIONS_CACHE_TIMEOUT = config("AUTHORIZATIONS_CACHE_TIMEOUT", 60 * 60)
+AUTHORIZATIONS_LOCAL_CACHE_SIZE = config("AUTHORIZATIONS_LOCAL_CACHE_SIZE", 1000)
+AUTHORIZATIONS_LOCAL_CACHE_TIMEOUT = config("AUTHORIZATIONS_LOCAL_CACHE_TIMEOUT", 5)
+
+# caching of verified JWT payloads (in seconds), per worker. Bounds how long a
+# changed secret takes effect in the other workers.
+JWT_CACHE_SIZE = config("JWT_CACHE_SIZE", 1000)
+JWT_CACHE_TIMEOUT = config("JWT_CACHE_TIMEOUT", 60)
+
+# number of resolved (catalogi) resource URLs memoized per worker, used when
+# filtering on authorizations
+RESOLVED_PATHS_CACHE_SIZE = config("RESOLVED_PATHS_CACHE_SIZE", 10000)
+
+# caching of the responses of published catalogi resources (in seconds), shared
+# between the workers through the default cache, and how long clients may
+# cache them themselves
+CATALOGI_RESPONSE_CACHE_TIMEOUT = config("CATALOGI_RESPONSE_CACHE_TIMEOUT", 60 * 60)
+CATALOGI_RESPONSE_MAX_AGE = config("CATALOGI_RESPONSE_MAX_AGE", 60)
+
+# number of graphs of published zaaktypen cached per worker for the validation
+# of zaken and besluiten, and for how long (in seconds)
+CATALOGI_GRAPH_CACHE_SIZE = config("CATALOGI_GRAPH_CACHE_SIZE", 1000)
+CATALOGI_GRAPH_CACHE_TIMEOUT = config("CATALOGI_GRAPH_CACHE_TIMEOUT", 5 * 60)
+
+# above this number of authorized types, list queries are filtered by joining
+# against the authorizations instead of using a CASE/WHEN per type
+AUTHORIZATIONS_JOIN_THRESHOLD = config("AUTHORIZATIONS_JOIN_THRESHOLD", 100)
+
+# propagate the invalidation of the in-process caches above to the other
+# workers and nodes, through Redis pub/sub on the default cache
+CACHE_INVALIDATION_BUS = config("CACHE_INVALIDATION_BUS", True)
+CACHE_INVALIDATION_CHANNEL = config(
+    "CACHE_INVALIDATION_CHANNEL", "openzaak:invalidation"
+)
+
 # urls for OAS3 specifications
 SPEC_URL = {
     "zaken": os.path.join(
@@ -413,7 +451,10 @@ CORS_ALLOW_HEADERS = (
     "accept-encoding",
     "accept-crs",
     "content-crs",
+    "if-match",
+    "if-none-match",
 )
+CORS_EXPOSE_HEADERS = ("etag",)
 
 #
 # DJANGO-PRIVATES -- safely serve files after authorization
@@ -0,0 +1,77 @@
+import random
+import re
+from statistics import median
+
+from django.core.management.base import BaseCommand
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from openzaak.components.documenten.models import EnkelvoudigInformatieObject
+from openzaak.components.zaken.models import Zaak
+from openzaak.utils.query import filter_max_orders
+
+PLANNING_TIME = re.compile(r"planning time: ([\d.]+) ms", re.IGNORECASE)
+EXECUTION_TIME = re.compile(r"execution time: ([\d.]+) ms", re.IGNORECASE)
+
+QUERYSETS = {
+    "zaken": (Zaak, "zaaktype"),
+    "documenten": (EnkelvoudigInformatieObject, "informatieobjecttype"),
+}
+STRATEGIES = {"case/when": False, "join": True}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the planning and execution time of filtering on authorizations "
+        "with a CASE/WHEN per type and with a join against the authorizations"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[10, 100, 1000, 5000],
+            help="Numbers of authorized types to benchmark",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of runs per measurement, the median is reported",
+        )
+
+    def measure(self, queryset, repeat: int):
+        planning, execution = [], []
+        for _ in range(repeat):
+            plan = queryset.explain(analyze=True)
+            planning.append(float(PLANNING_TIME.search(plan).group(1)))
+            execution.append(float(EXECUTION_TIME.search(plan).group(1)))
+        return median(planning), median(execution)
+
+    def handle(self, **options):
+        # the types don't have to exist - the cost is in planning the query
+        random.seed(0)
+        orders = [
+            VertrouwelijkheidsAanduiding.get_choice(value).order
+            for value in VertrouwelijkheidsAanduiding.values
+        ]
+
+        self.stdout.write(
+            f"{'component':<12}{'types':>8}  {'strategy':<12}"
+            f"{'planning (ms)':>15}{'execution (ms)':>16}"
+        )
+        for component, (model, type_field) in QUERYSETS.items():
+            for size in options["sizes"]:
+                max_orders = {
+                    type_id: random.choice(orders) for type_id in range(1, size + 1)
+                }
+                for strategy, join in STRATEGIES.items():
+                    queryset = filter_max_orders(
+                        model.objects.all(), type_field, max_orders, join=join
+                    )
+                    planning, execution = self.measure(queryset, options["repeat"])
+                    self.stdout.write(
+                        f"{component:<12}{size:>8}  {strategy:<12}"
+                        f"{planning:>15.2f}{execution:>16.2f}"
+                    )
@@ -0,0 +1,189 @@
+"""
+Simulate two nodes in a single process to test the propagation of cache
+invalidations.
+
+Each node has its own in-process caches and its own bus, connected through an
+in-memory stand-in for Redis pub/sub. The shared (default) cache and the
+database are, like in a real deployment, shared by both nodes.
+"""
+from collections import deque
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TransactionTestCase, override_settings
+
+from vng_api_common.models import JWTSecret
+from vng_api_common.tests import reverse
+
+from openzaak.components.authorizations import cache
+from openzaak.components.authorizations.tests.factories import (
+    ApplicatieFactory,
+    AutorisatieFactory,
+)
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.utils import invalidation, resources
+from openzaak.utils.cache import LRUCache
+
+
+class InMemoryBroker:
+    """
+    Deliver the published messages to the inbox of every subscriber.
+    """
+
+    def __init__(self):
+        self.inboxes = []
+
+    def publish(self, channel: str, message: str) -> None:
+        for inbox in self.inboxes:
+            inbox.append(message)
+
+    def subscribe(self, channel: str) -> deque:
+        inbox = deque()
+        self.inboxes.append(inbox)
+        return inbox
+
+
+class Node:
+    def __init__(self, broker: InMemoryBroker):
+        self.bus = invalidation.InvalidationBus(broker, channel="test")
+        self.inbox = broker.subscribe("test")
+        self.caches = {
+            (cache, "local_cache"): LRUCache(maxsize=100, timeout=60),
+            (cache, "token_cache"): LRUCache(maxsize=100, timeout=60),
+            (resources, "resolved_paths"): LRUCache(maxsize=100, timeout=60),
+        }
+
+    @contextmanager
+    def active(self):
+        """
+        Run the code in the context of this node.
+        """
+        patchers = [
+            patch.object(module, name, node_cache)
+            for (module, name), node_cache in self.caches.items()
+        ]
+        patchers.append(patch.object(invalidation, "bus", self.bus))
+
+        for patcher in patchers:
+            patcher.start()
+        try:
+            yield
+        finally:
+            for patcher in reversed(patchers):
+                patcher.stop()
+
+    def receive(self) -> None:
+        with self.active():
+            while self.inbox:
+                self.bus.dispatch(self.inbox.popleft())
+
+
+@override_settings(CACHE_INVALIDATION_BUS=True)
+class InvalidationBusTests(TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+
+        broker = InMemoryBroker()
+        self.node_a = Node(broker)
+        self.node_b = Node(broker)
+
+        with self.node_a.active():
+            cache.invalidate(["client-1"])
+            self.applicatie = ApplicatieFactory.create(client_ids=["client-1"])
+            self.autorisatie = AutorisatieFactory.create(
+                applicatie=self.applicatie, scopes=["zaken.lezen"]
+            )
+        self.node_a.receive()
+        self.node_b.receive()
+
+    def test_autorisatie_changed(self):
+        with self.node_b.active():
+            cache.get_authorizations("client-1")
+
+        with self.node_a.active():
+            self.autorisatie.scopes = ["zaken.bijwerken"]
+            self.autorisatie.save()
+
+            autorisaties = cache.get_authorizations("client-1").autorisaties
+            self.assertEqual(autorisaties[0].scopes, ["zaken.bijwerken"])
+
+        with self.node_b.active():
+            autorisaties = cache.get_authorizations("client-1").autorisaties
+            self.assertEqual(autorisaties[0].scopes, ["zaken.lezen"])
+
+        self.node_b.receive()
+
+        with self.node_b.active():
+            autorisaties = cache.get_authorizations("client-1").autorisaties
+            self.assertEqual(autorisaties[0].scopes, ["zaken.bijwerken"])
+
+    def test_applicatie_deleted(self):
+        with self.node_b.active():
+            cache.get_authorizations("client-1")
+
+        with self.node_a.active():
+            self.applicatie.delete()
+
+        self.node_b.receive()
+
+        with self.node_b.active():
+            self.assertEqual(cache.get_authorizations("client-1").applicaties, [])
+
+    def test_zaaktype_deleted(self):
+        with self.node_a.active():
+            zaaktype = ZaakTypeFactory.create()
+        self.node_b.receive()
+
+        url = f"http://testserver{reverse(zaaktype)}"
+        path = resources.get_path(url)
+        with self.node_b.active():
+            resources.get_resource_pks([url])
+            self.assertIsNotNone(resources.resolved_paths.get((path, "pk")))
+
+        with self.node_a.active():
+            zaaktype.delete()
+
+        self.node_b.receive()
+
+        with self.node_b.active():
+            self.assertIsNone(resources.resolved_paths.get((path, "pk")))
+            self.assertEqual(resources.get_resource_pks([url]), {})
+
+    def test_jwt_secret_changed(self):
+        with self.node_a.active():
+            secret = JWTSecret.objects.create(identifier="client-1", secret="oops")
+        self.node_b.receive()
+
+        with self.node_b.active():
+            cache.cache_payload("token", {"client_id": "client-1"})
+
+        with self.node_a.active():
+            secret.secret = "rotated"
+            secret.save()
+
+        self.node_b.receive()
+
+        with self.node_b.active():
+            self.assertIsNone(cache.get_cached_payload("token"))
+
+    def test_rolled_back_changes_not_published(self):
+        with self.node_a.active():
+            try:
+                with transaction.atomic():
+                    self.autorisatie.delete()
+                    raise ValueError("Rollback")
+            except ValueError:
+                pass
+
+        self.assertEqual(len(self.node_b.inbox), 0)
+
+    def test_own_events_ignored(self):
+        with self.node_a.active():
+            cache.get_authorizations("client-1")
+            invalidation.publish("autorisaties", ["client-1"])
+
+        self.node_a.receive()
+
+        with self.node_a.active():
+            self.assertIsNotNone(cache.local_cache.get(cache.get_cache_key("client-1")))
@@ -0,0 +1,69 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Bounded, thread-safe in-process cache with a time-to-live.
+
+    Meant as a tier in front of the shared cache, so that hot lookups don't
+    need a network round-trip. Entries are evicted least-recently-used first
+    once ``maxsize`` is reached, and expire ``timeout`` seconds after they
+    were set.
+    """
+
+    def __init__(self, maxsize: int, timeout: float):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default=None) -> Any:
+        with self._lock:
+            value, expires = self._data.get(key, (_MISSING, None))
+            if value is _MISSING:
+                return default
+
+            if expires < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, timeout: float = None) -> None:
+        if timeout is None:
+            timeout = self.timeout
+
+        if self.maxsize <= 0 or timeout <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + timeout)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Any], bool]) -> None:
+        """
+        Evict all entries for which ``predicate(value)`` holds.
+        """
+        with self._lock:
+            keys = [key for key, (value, _) in self._data.items() if predicate(value)]
+            for key in keys:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
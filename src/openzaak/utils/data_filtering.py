@@ -1,3 +1,8 @@
+from django.db import models
+
+from vng_api_common.scopes import Scope
+
+
 class ListFilterByAuthorizationsMixin:
     """
     Filter list-action data by the authorizations configured.
@@ -25,16 +30,33 @@ class ListFilterByAuthorizationsMixin:
         if not self.action == "list":
             return base
 
-        # get the auth apps that are relevant for this particular request
-        apps = self.request.jwt_auth.applicaties
+        scope_needed = self.required_scopes[self.action]
+        return filter_by_authorizations(base, self.request, scope_needed)
 
-        # as soon as there's one matching app that gives you all permissions,
-        # you're good - no further detailed data filtering is applied
-        if any(app.heeft_alle_autorisaties for app in apps):
-            return base
 
-        scope_needed = self.required_scopes[self.action]
-        component = base.model._meta.app_label
-        authorizations = self.request.jwt_auth.get_autorisaties(component)
+def filter_by_authorizations(
+    queryset: models.QuerySet, request, scope: Scope
+) -> models.QuerySet:
+    """
+    Limit ``queryset`` to the objects the client may access with ``scope``.
 
-        return base.filter_for_authorizations(scope_needed, authorizations)
+    Models without ``filter_for_authorizations``, like the types in the
+    catalogi, are authorized for the whole component.
+    """
+    # as soon as there's one matching app that gives you all permissions,
+    # you're good - no further detailed data filtering is applied
+    if request.jwt_auth.matrix.heeft_alle_autorisaties:
+        return queryset
+
+    component = queryset.model._meta.app_label
+    if not hasattr(queryset, "filter_for_authorizations"):
+        if request.jwt_auth.has_auth(scope, component):
+            return queryset
+        return queryset.none()
+
+    authorizations = request.jwt_auth.get_autorisaties(component)
+    catalogus_authorizations = request.jwt_auth.get_catalogus_autorisaties(component)
+
+    return queryset.filter_for_authorizations(
+        scope, authorizations, catalogus_authorizations
+    )
@@ -0,0 +1,193 @@
+"""
+Propagate the invalidation of in-process caches to the other nodes.
+
+The in-process caches (see :class:`openzaak.utils.cache.LRUCache`) are local to
+a worker. When the data behind them changes, the worker handling the change
+drops its own entries and publishes an event on a Redis pub/sub channel. Every
+worker runs a subscriber thread applying the events published by the others.
+
+Events are published on a topic, with the arguments for the handlers
+registered on that topic::
+
+    @register("resources")
+    def forget(label, pk):
+        ...
+
+    publish("resources", "catalogi.ZaakType", 1)
+
+Events are only sent once the current transaction is committed, so that other
+nodes don't load the old state again. Messages published while a subscriber is
+disconnected are lost, so the tracked caches are cleared entirely whenever it
+(re)connects.
+"""
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Callable, Dict, Iterator, List
+
+from django.conf import settings
+from django.db import transaction
+
+from .cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# topic -> handlers
+_handlers: Dict[str, List[Callable]] = defaultdict(list)
+
+# caches to clear if events may have been missed
+_tracked: List[LRUCache] = []
+
+
+def register(topic: str) -> Callable:
+    """
+    Register a handler applying the events on ``topic`` published by other nodes.
+    """
+
+    def decorator(handler: Callable) -> Callable:
+        _handlers[topic].append(handler)
+        return handler
+
+    return decorator
+
+
+def track(cache: LRUCache) -> LRUCache:
+    """
+    Clear ``cache`` when invalidation events may have been missed.
+    """
+    _tracked.append(cache)
+    return cache
+
+
+class RedisTransport:
+    """
+    Publish and receive messages through Redis pub/sub on a configured cache.
+    """
+
+    def __init__(self, alias: str = "default"):
+        self.alias = alias
+
+    def _get_connection(self):
+        from django_redis import get_redis_connection
+
+        return get_redis_connection(self.alias)
+
+    def publish(self, channel: str, message: str) -> None:
+        self._get_connection().publish(channel, message)
+
+    def subscribe(self, channel: str) -> Iterator[str]:
+        pubsub = self._get_connection().pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(channel)
+        return self._listen(pubsub)
+
+    @staticmethod
+    def _listen(pubsub) -> Iterator[str]:
+        try:
+            for message in pubsub.listen():
+                yield message["data"]
+        finally:
+            pubsub.close()
+
+
+class InvalidationBus:
+    """
+    Exchange invalidation events between the nodes over a transport.
+    """
+
+    reconnect_delay = 5
+
+    def __init__(self, transport, channel: str = None):
+        self.transport = transport
+        self.channel = channel or settings.CACHE_INVALIDATION_CHANNEL
+        self._id = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._pid = None
+
+    @property
+    def node(self) -> str:
+        """
+        Identify this process, which applies its own events when publishing them.
+        """
+        # worker processes may share the bus created before they were forked
+        return f"{self._id}:{os.getpid()}"
+
+    def publish(self, topic: str, *args) -> None:
+        message = json.dumps({"node": self.node, "topic": topic, "args": args})
+        transaction.on_commit(lambda: self._send(message))
+
+    def _send(self, message: str) -> None:
+        try:
+            self.transport.publish(self.channel, message)
+        # the other nodes fall back on the expiry of their caches
+        except Exception:
+            logger.warning("Could not publish invalidation %s", message, exc_info=True)
+
+    def dispatch(self, message) -> None:
+        if isinstance(message, bytes):
+            message = message.decode("utf-8")
+
+        event = json.loads(message)
+        if event["node"] == self.node:
+            return
+
+        logger.debug("Applying invalidation %r", event)
+        for handler in _handlers.get(event["topic"], []):
+            handler(*event["args"])
+
+    def connected(self) -> None:
+        """
+        Clear the tracked caches, events may have been missed until now.
+        """
+        for cache in _tracked:
+            cache.clear()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                messages = self.transport.subscribe(self.channel)
+                self.connected()
+                for message in messages:
+                    self.dispatch(message)
+            except Exception:
+                logger.warning("Invalidation subscriber failed", exc_info=True)
+            time.sleep(self.reconnect_delay)
+
+    def start(self) -> None:
+        """
+        Start the subscriber thread for this process, if not running already.
+        """
+        # worker processes may be forked after the thread was started
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+
+            thread = threading.Thread(
+                target=self._run, name="invalidation-subscriber", daemon=True
+            )
+            thread.start()
+            self._pid = os.getpid()
+
+
+bus = InvalidationBus(RedisTransport())
+
+
+def publish(topic: str, *args) -> None:
+    """
+    Notify the other nodes, after the current transaction is committed.
+    """
+    if not settings.CACHE_INVALIDATION_BUS:
+        return
+    bus.publish(topic, *args)
+
+
+def start() -> None:
+    if not settings.CACHE_INVALIDATION_BUS:
+        return
+    bus.start()
@@ -2,6 +2,8 @@ import logging
 
 from django.http import HttpRequest
 
+from . import invalidation
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,3 +17,19 @@ class LogHeadersMiddleware:
 
     def log(self, request: HttpRequest):
         logger.debug("Request headers for %s: %r", request.path, request.headers)
+
+
+class InvalidationBusMiddleware:
+    """
+    Subscribe the worker to the cache invalidations published by other nodes.
+
+    Started on the first request rather than when loading the application,
+    since the worker processes may be forked afterwards.
+    """
+
+    def __init__(self, get_response=None):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        invalidation.start()
+        return self.get_response(request) if self.get_response else None
@@ -0,0 +1,68 @@
+"""
+Row versions of the objects that are exposed with an ETag.
+
+The row version changes whenever the API representation of the object changes,
+so the ETag can be computed from the row instead of by rendering the object,
+see :class:`openzaak.utils.viewsets.ETagMixin`.
+
+The versions are timestamps in microseconds, taken from the clock of the
+database and bumped in SQL by at least one on every change. They only increase,
+no matter which application node saves the object or how its clock is set.
+"""
+import time
+
+from django.db import models
+from django.db.models.functions import Greatest
+from django.utils.translation import ugettext_lazy as _
+
+
+def get_next_row_version() -> int:
+    return time.time_ns() // 1000
+
+
+class RowVersionClock(models.Func):
+    """
+    The current time of the database clock in microseconds.
+    """
+
+    template = "(EXTRACT(EPOCH FROM CLOCK_TIMESTAMP()) * 1000000)::bigint"
+    arity = 0
+    output_field = models.BigIntegerField()
+
+
+def get_bumped_row_version() -> models.Func:
+    return Greatest(models.F("row_version") + 1, RowVersionClock())
+
+
+class RowVersionMixin(models.Model):
+    row_version = models.BigIntegerField(
+        _("row version"),
+        default=0,
+        editable=False,
+        help_text=_("Changes whenever the API representation of the object changes."),
+    )
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        self.row_version = (
+            RowVersionClock() if self._state.adding else get_bumped_row_version()
+        )
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "row_version"}
+
+        super().save(*args, **kwargs)
+        self.refresh_from_db(fields=["row_version"])
+
+
+def bump_row_version(queryset: models.QuerySet, **fields) -> int:
+    """
+    Bump the row version of the objects in ``queryset``, updating ``fields``.
+
+    Used when the representation of the objects changes without saving them,
+    e.g. when a related object is added.
+    """
+    return queryset.update(**fields, row_version=get_bumped_row_version())
@@ -0,0 +1,328 @@
+"""
+Pagination of the list endpoints on large tables.
+
+The page number pagination counts the matching objects on every page and skips
+the rows of the previous pages with an ``OFFSET``, which gets slow on large
+tables.
+
+The count is done according to the ``count_strategy`` of the view, see
+:class:`ExactCount`, :class:`EstimatedCount` and :class:`CachedCount`.
+Approximate counts are flagged with the ``X-Count-Approximate`` header.
+
+Passing ``?cursor=`` switches to keyset pagination instead: pages are selected
+with a ``WHERE`` clause on the ordering of the last object returned, so each
+page is a single index range scan, no count is done, and objects created while
+paginating don't shift the pages.
+"""
+import hashlib
+import json
+from functools import partial, reduce
+from operator import or_
+from typing import List, Optional, Tuple
+
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.encoding import force_text
+from django.utils.functional import cached_property
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework.compat import coreapi, coreschema
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import Cursor, CursorPagination, PageNumberPagination
+
+
+class ExactCount:
+    """
+    Count all the objects.
+    """
+
+    def __call__(self, queryset: QuerySet) -> Tuple[int, bool]:
+        return queryset.count(), False
+
+
+class EstimatedCount(ExactCount):
+    """
+    Count exactly up to ``threshold`` objects, estimate beyond that.
+
+    The estimate is the number of rows the Postgres planner expects the query
+    to return, which relies on the table statistics being up to date.
+    """
+
+    def __init__(self, threshold: int = 10000):
+        self.threshold = threshold
+
+    def __call__(self, queryset: QuerySet) -> Tuple[int, bool]:
+        queryset = queryset.order_by()
+
+        # bounded, so cheap even if there are many more objects
+        count = queryset[: self.threshold + 1].count()
+        if count <= self.threshold:
+            return count, False
+
+        return max(self.estimate(queryset), count), True
+
+    def estimate(self, queryset: QuerySet) -> int:
+        sql, params = queryset.query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            (plan,) = cursor.fetchone()
+        return plan[0]["Plan"]["Plan Rows"]
+
+
+class CachedCount(EstimatedCount):
+    """
+    Count exactly up to ``threshold`` objects, cache the count beyond that.
+
+    The key is derived from the SQL of the query, which contains both the
+    filters and the authorizations of the application.
+    """
+
+    def __init__(self, threshold: int = 10000, timeout: int = 60, alias="default"):
+        super().__init__(threshold=threshold)
+        self.timeout = timeout
+        self.alias = alias
+
+    def get_cache_key(self, queryset: QuerySet) -> str:
+        sql, params = queryset.query.sql_with_params()
+        digest = hashlib.md5(f"{sql}:{params!r}".encode("utf-8")).hexdigest()
+        return f"pagination:count:{queryset.model._meta.label_lower}:{digest}"
+
+    def estimate(self, queryset: QuerySet) -> int:
+        cache = caches[self.alias]
+        key = self.get_cache_key(queryset)
+
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, self.timeout)
+        return count
+
+
+class ApproximatePage(Page):
+    next_exists = False
+
+    def has_next(self) -> bool:
+        return self.next_exists
+
+
+class CountPaginator(Paginator):
+    """
+    Paginate with a count strategy.
+
+    An approximate count can't be relied on to determine the last page, so
+    one more object is fetched instead to find out if there is a next page.
+    """
+
+    def __init__(self, object_list, per_page, count_strategy=ExactCount(), **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = count_strategy
+        self.approximate = False
+
+    @cached_property
+    def count(self) -> int:
+        count, self.approximate = self.count_strategy(self.object_list)
+        return count
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # pages beyond an approximate count may still exist
+            if not self.approximate or int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number) -> Page:
+        number = self.validate_number(number)
+        if not self.approximate:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not object_list and number > 1:
+            raise EmptyPage(_("That page contains no results"))
+
+        page = ApproximatePage(object_list[: self.per_page], number, self)
+        page.next_exists = len(object_list) > self.per_page
+        return page
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination on one or more fields, rather than DRF's single field.
+
+    The ordering requested through the :class:`OrderingFilter` of the view is
+    made unique by adding the primary key. Without it, the view's
+    ``cursor_ordering`` is used, which must identify the objects uniquely.
+    """
+
+    ordering = ("-pk",)
+
+    def get_keys(self, request, queryset: QuerySet, view) -> Tuple[str, ...]:
+        for backend in getattr(view, "filter_backends", ()):
+            if not issubclass(backend, OrderingFilter):
+                continue
+
+            ordering = backend().get_ordering(request, queryset, view)
+            if not ordering:
+                break
+
+            keys = tuple(ordering)
+            if not {"pk", "-pk"} & set(keys):
+                keys += ("-pk" if keys[0].startswith("-") else "pk",)
+            return keys
+
+        return tuple(getattr(view, "cursor_ordering", self.ordering))
+
+    def get_position(self, instance) -> str:
+        values = []
+        for key in self.keys:
+            name = key.lstrip("-")
+            if name != "pk":
+                name = instance._meta.get_field(name).attname
+            values.append(getattr(instance, name))
+        return json.dumps(values, cls=DjangoJSONEncoder)
+
+    def get_filter(self, position: str, reverse: bool) -> Q:
+        """
+        Select the objects following the position, in the order of the keys.
+        """
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.keys):
+            raise NotFound(self.invalid_cursor_message)
+
+        conditions = []
+        preceding = {}
+        for key, value in zip(self.keys, values):
+            name = key.lstrip("-")
+            descending = key.startswith("-") != reverse
+            lookup = "lt" if descending else "gt"
+            conditions.append(Q(**preceding, **{f"{name}__{lookup}": value}))
+            preceding[name] = value
+        return reduce(or_, conditions)
+
+    def get_order_by(self, queryset: QuerySet, reverse: bool) -> List[str]:
+        keys = list(self.keys)
+        if reverse:
+            keys = [key[1:] if key.startswith("-") else f"-{key}" for key in keys]
+
+        # keep the remaining ordering of the queryset, which may be required
+        # for ``distinct`` on fields
+        return keys + [
+            field for field in queryset.query.order_by if field not in self.keys
+        ]
+
+    def paginate_queryset(self, queryset, request, view=None) -> Optional[list]:
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.keys = self.get_keys(request, queryset, view)
+        self.cursor = self.decode_cursor(request) or Cursor(
+            offset=0, reverse=False, position=None
+        )
+        reverse, position = self.cursor.reverse, self.cursor.position
+
+        queryset = queryset.order_by(*self.get_order_by(queryset, reverse))
+        if position is not None:
+            try:
+                queryset = queryset.filter(self.get_filter(position, reverse))
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset[: self.page_size + 1])
+        has_following = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if reverse:
+            self.page.reverse()
+
+        self.has_next = has_following if not reverse else position is not None
+        self.has_previous = position is not None if not reverse else has_following
+        if self.template is not None and (self.has_next or self.has_previous):
+            self.display_page_controls = True
+        self.request = request
+        return self.page
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        cursor = Cursor(
+            offset=0, reverse=False, position=self.get_position(self.page[-1])
+        )
+        return self.encode_cursor(cursor)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous or not self.page:
+            return None
+        cursor = Cursor(
+            offset=0, reverse=True, position=self.get_position(self.page[0])
+        )
+        return self.encode_cursor(cursor)
+
+
+class OptionalCursorPagination(PageNumberPagination):
+    """
+    Paginate on page number, or on keyset if the ``cursor`` parameter is given.
+
+    The response of the keyset pagination has no ``count``.
+    """
+
+    cursor_pagination_class = KeysetPagination
+    cursor_query_param = KeysetPagination.cursor_query_param
+    cursor_query_description = _(
+        "The pagination cursor value. Pass an empty value to get the first page "
+        "with keyset pagination, which has no count."
+    )
+    count_strategy = ExactCount()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_pagination = None
+        if self.cursor_query_param not in request.query_params:
+            self.django_paginator_class = partial(
+                CountPaginator,
+                count_strategy=getattr(view, "count_strategy", self.count_strategy),
+            )
+            return super().paginate_queryset(queryset, request, view=view)
+
+        paginator = self.cursor_pagination_class()
+        paginator.cursor_query_param = self.cursor_query_param
+        self.cursor_pagination = paginator
+        page = paginator.paginate_queryset(queryset, request, view=view)
+        self.display_page_controls = paginator.display_page_controls
+        return page
+
+    def get_paginated_response(self, data):
+        if self.cursor_pagination:
+            return self.cursor_pagination.get_paginated_response(data)
+
+        response = super().get_paginated_response(data)
+        if self.page.paginator.approximate:
+            response["X-Count-Approximate"] = "true"
+        return response
+
+    def get_html_context(self):
+        if self.cursor_pagination:
+            return self.cursor_pagination.get_html_context()
+        return super().get_html_context()
+
+    def get_schema_fields(self, view):
+        return super().get_schema_fields(view) + [
+            coreapi.Field(
+                name=self.cursor_query_param,
+                required=False,
+                location="query",
+                schema=coreschema.String(
+                    title="Cursor",
+                    description=force_text(self.cursor_query_description),
+                ),
+            )
+        ]
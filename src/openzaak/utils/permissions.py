@@ -1,17 +1,106 @@
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
 from urllib.parse import urlparse
 
 from django.core.exceptions import ImproperlyConfigured
+from django.db import models
 from django.db.models import ObjectDoesNotExist
 from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import permissions
+from rest_framework.relations import HyperlinkedRelatedField
 from rest_framework.request import Request
+from rest_framework.reverse import reverse
 from rest_framework.serializers import ValidationError
 from vng_api_common.permissions import bypass_permissions, get_required_scopes
 from vng_api_common.utils import get_resource_for_path
 
 
+class PermissionField(NamedTuple):
+    """
+    Describe how to obtain a permission field without serializing the object.
+    """
+
+    name: str
+    source: str
+    # only set for hyperlinked relations, which are rendered as URL
+    view_name: Optional[str] = None
+    lookup_field: Optional[str] = None
+    lookup_url_kwarg: Optional[str] = None
+
+    @property
+    def lookup(self) -> str:
+        if self.view_name is None:
+            return self.source
+        return f"{self.source}__{self.lookup_field}"
+
+
+@lru_cache()
+def get_projection(serializer_class, field_names: Tuple[str]) -> Tuple[PermissionField]:
+    """
+    Derive the projection of ``field_names`` from the serializer definition.
+    """
+    serializer_fields = serializer_class().fields
+    projection = []
+    for name in field_names:
+        field = serializer_fields[name]
+        assert "." not in field.source, "Only direct model fields are supported"
+
+        if isinstance(field, HyperlinkedRelatedField):
+            projection.append(
+                PermissionField(
+                    name=name,
+                    source=field.source,
+                    view_name=field.view_name,
+                    lookup_field=field.lookup_field,
+                    lookup_url_kwarg=field.lookup_url_kwarg,
+                )
+            )
+        else:
+            projection.append(PermissionField(name=name, source=field.source))
+    return tuple(projection)
+
+
+def project(obj: models.Model, projection: Tuple[PermissionField], request) -> dict:
+    """
+    Obtain the permission fields of ``obj``, as the serializer would output them.
+
+    Values that are loaded on the instance already are used as is, the others
+    are fetched with a single ``values_list`` query.
+    """
+    values = {}
+    for field in projection:
+        model_field = obj._meta.get_field(field.source)
+        if field.view_name is None:
+            if field.source in obj.__dict__:
+                values[field.name] = getattr(obj, field.source)
+        elif model_field.is_cached(obj):
+            related = getattr(obj, field.source)
+            values[field.name] = (
+                getattr(related, field.lookup_field) if related is not None else None
+            )
+
+    missing = [field for field in projection if field.name not in values]
+    if missing:
+        row = (
+            obj.__class__._base_manager.filter(pk=obj.pk)
+            .values_list(*[field.lookup for field in missing])
+            .get()
+        )
+        values.update({field.name: value for field, value in zip(missing, row)})
+
+    data = {}
+    for field in projection:
+        value = values[field.name]
+        if field.view_name is not None and value is not None:
+            value = reverse(
+                field.view_name, kwargs={field.lookup_url_kwarg: value}, request=request
+            )
+        data[field.name] = value
+    return data
+
+
 class AuthRequired(permissions.BasePermission):
     """
     Look at the scopes required for the current action
@@ -28,10 +117,17 @@ class AuthRequired(permissions.BasePermission):
         return {field: data.get(field) for field in self.permission_fields}
 
     def format_data(self, obj, request) -> dict:
+        """
+        Obtain the ``permission_fields`` of the main object.
+
+        Only the permission fields are fetched, rather than serializing the
+        entire main object.
+        """
         main_resource = self.get_main_resource()
-        serializer_class = main_resource.serializer_class
-        serializer = serializer_class(obj, context={"request": request})
-        return serializer.data
+        projection = get_projection(
+            main_resource.serializer_class, self.permission_fields
+        )
+        return project(obj, projection, request)
 
     def get_main_resource(self):
         if not self.main_resource:
@@ -63,21 +159,15 @@ class AuthRequired(permissions.BasePermission):
             if view.__class__ is main_resource:
                 main_object_data = request.data
 
+            elif isinstance(request.data, list):
+                return self.has_bulk_create_permission(
+                    request, view, scopes_required, component
+                )
+
             else:
-                main_object_url = request.data[view.permission_main_object]
-                main_object_path = urlparse(main_object_url).path
-                try:
-                    main_object = get_resource_for_path(main_object_path)
-                except ObjectDoesNotExist:
-                    raise ValidationError(
-                        {
-                            view.permission_main_object: ValidationError(
-                                _("The object does not exist in the database"),
-                                code="object-does-not-exist",
-                            ).detail
-                        }
-                    )
-                main_object_data = self.format_data(main_object, request)
+                main_object_data = self.get_main_object_data(
+                    request, view, request.data[view.permission_main_object]
+                )
 
             fields = self.get_fields(main_object_data)
             return request.jwt_auth.has_auth(scopes_required, component, **fields)
@@ -90,6 +180,45 @@ class AuthRequired(permissions.BasePermission):
         # by default - check if the action is allowed at all
         return request.jwt_auth.has_auth(scopes_required, component)
 
+    def get_main_object_data(self, request: Request, view, url: str) -> dict:
+        main_object_path = urlparse(url).path
+        try:
+            main_object = get_resource_for_path(main_object_path)
+        except ObjectDoesNotExist:
+            raise ValidationError(
+                {
+                    view.permission_main_object: ValidationError(
+                        _("The object does not exist in the database"),
+                        code="object-does-not-exist",
+                    ).detail
+                }
+            )
+        return self.format_data(main_object, request)
+
+    def has_bulk_create_permission(
+        self, request: Request, view, scopes_required, component: str
+    ) -> bool:
+        """
+        Check the permissions for every main object the created objects belong to.
+
+        Items without a main object are rejected by the serializer.
+        """
+        main_object_urls = {
+            item.get(view.permission_main_object)
+            for item in request.data
+            if isinstance(item, dict)
+        } - {None}
+
+        if not main_object_urls:
+            return request.jwt_auth.has_auth(scopes_required, component)
+
+        for url in main_object_urls:
+            main_object_data = self.get_main_object_data(request, view, url)
+            fields = self.get_fields(main_object_data)
+            if not request.jwt_auth.has_auth(scopes_required, component, **fields):
+                return False
+        return True
+
     def has_object_permission(self, request: Request, view, obj) -> bool:
         if bypass_permissions(request):
             return True
@@ -1,3 +1,23 @@
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from django.db import models
+from django.db.models import (
+    BooleanField,
+    Case,
+    F,
+    Func,
+    IntegerField,
+    Prefetch,
+    Q,
+    Value,
+    When,
+)
+from django.db.models.constants import LOOKUP_SEP
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+
 class QueryBlocked(Exception):
     pass
 
@@ -23,3 +43,190 @@ class BlockChangeMixin:
 
     # see django.db.models.query.QuerySet.delete
     delete.queryset_only = True
+
+
+class MaxOrderJoin(Func):
+    """
+    Check the confidentiality order of a row against a relation of allowed types.
+
+    The allowed ``(type_id, max_order)`` pairs are passed as two array
+    parameters and unnested into an inline relation, so the size of the SQL
+    statement (and the planning time) doesn't grow with the number of
+    authorizations.
+    """
+
+    output_field = BooleanField()
+
+    def __init__(self, type_lookup: str, order_expression, max_orders: Dict[int, int]):
+        super().__init__(F(type_lookup), order_expression)
+        self.max_orders = max_orders
+
+    def as_sql(self, compiler, connection, **extra_context):
+        type_sql, type_params = compiler.compile(self.source_expressions[0])
+        order_sql, order_params = compiler.compile(self.source_expressions[1])
+        sql = (
+            "EXISTS (SELECT 1 FROM unnest(%s::integer[], %s::integer[]) "
+            "AS auth (type_id, max_order) "
+            f"WHERE auth.type_id = {type_sql} AND auth.max_order >= {order_sql})"
+        )
+        params = [
+            list(self.max_orders.keys()),
+            list(self.max_orders.values()),
+            *type_params,
+            *order_params,
+        ]
+        return sql, params
+
+
+def filter_max_orders(
+    queryset: models.QuerySet,
+    type_field: str,
+    max_orders: Dict[int, int],
+    prefix: str = "",
+    join: Optional[bool] = None,
+    catalogus_max_orders: Optional[Dict[int, int]] = None,
+) -> models.QuerySet:
+    """
+    Limit ``queryset`` to the allowed types, up to their maximum confidentiality.
+
+    :param type_field: name of the foreign key to the type, e.g. ``zaaktype``
+    :param max_orders: mapping of the allowed type primary keys to the order of
+      their ``max_vertrouwelijkheidaanduiding``
+    :param prefix: lookup prefix if the type is defined on a related object
+    :param join: use a CASE/WHEN per type (``False``) or join against the
+      allowed types (``True``). By default, the join is used if there are more
+      types than ``settings.AUTHORIZATIONS_JOIN_THRESHOLD``.
+    :param catalogus_max_orders: mapping of catalogus primary keys to the order
+      of the ``max_vertrouwelijkheidaanduiding`` allowed for all their types
+    """
+    catalogus_max_orders = catalogus_max_orders or {}
+    if join is None:
+        join = (
+            len(max_orders) + len(catalogus_max_orders)
+            > settings.AUTHORIZATIONS_JOIN_THRESHOLD
+        )
+
+    # annotate the queryset so we can map a string value to a logical number
+    order_case = VertrouwelijkheidsAanduiding.get_order_expression(
+        f"{prefix}vertrouwelijkheidaanduiding"
+    )
+
+    type_lookup = f"{prefix}{type_field}"
+    rules = (
+        ("type", type_lookup, max_orders),
+        ("catalogus", f"{type_lookup}__catalogus", catalogus_max_orders),
+    )
+
+    annotations = {}
+    conditions = Q(pk__in=[])
+    for name, lookup, orders in rules:
+        if not orders:
+            continue
+
+        if join:
+            annotations[f"{prefix}_va_{name}_allowed"] = MaxOrderJoin(
+                lookup, order_case, orders
+            )
+            conditions |= Q(**{f"{prefix}_va_{name}_allowed": True})
+            continue
+
+        # build the case/when to map the max_vertrouwelijkheidaanduiding based
+        # on the type or catalogus
+        vertrouwelijkheidaanduiding_whens = [
+            When(**{lookup: pk}, then=Value(order)) for pk, order in orders.items()
+        ]
+
+        # apply the order annnotation so we can filter later
+        annotations[f"{prefix}_va_order"] = order_case
+        # filtering:
+        # * only allow the white-listed types, explicitly
+        # * apply the filtering to limit objects within types to the maximal
+        #   confidentiality level
+        conditions |= Q(
+            **{
+                f"{lookup}__in": list(orders),
+                f"{prefix}_va_order__lte": Case(
+                    *vertrouwelijkheidaanduiding_whens, output_field=IntegerField()
+                ),
+            }
+        )
+
+    return queryset.annotate(**annotations).filter(conditions)
+
+
+def get_catalogus_max_orders(scope, catalogus_authorizations) -> Dict[int, int]:
+    """
+    Map the catalogi to the highest confidentiality order granted for ``scope``.
+    """
+    max_orders = {}
+    for authorization in catalogus_authorizations:
+        if not scope.is_contained_in(authorization.scopes):
+            continue
+
+        # without a confidentiality level, nothing is granted
+        if not authorization.max_vertrouwelijkheidaanduiding:
+            continue
+
+        order = VertrouwelijkheidsAanduiding.get_choice(
+            authorization.max_vertrouwelijkheidaanduiding
+        ).order
+        catalogus = authorization.catalogus_id
+        max_orders[catalogus] = max(order, max_orders.get(catalogus, order))
+    return max_orders
+
+
+def apply_query_plan(
+    queryset: models.QuerySet,
+    serializer_class,
+    omitted_sources: Iterable[str] = (),
+    expanded: Iterable[Prefetch] = (),
+) -> models.QuerySet:
+    """
+    Eager load everything ``serializer_class`` needs to output the objects.
+
+    The plan is declared on the ``Meta`` of the serializer, with the
+    ``select_related``, ``prefetch_related`` and ``annotations`` options::
+
+        class Meta:
+            model = Zaak
+            select_related = ("zaaktype",)
+            prefetch_related = ("deelzaken",)
+            annotations = {"_status_count": Count("status")}
+
+    :param omitted_sources: attributes of the objects that aren't output, the
+      lookups and annotations starting with them are left out of the plan
+    :param expanded: prefetches of the related objects that are output as
+      nested objects, which replace the lookups of the relations
+    """
+    meta = getattr(serializer_class, "Meta", None)
+    omitted_sources = set(omitted_sources) | {
+        prefetch.prefetch_through.split(LOOKUP_SEP)[0] for prefetch in expanded
+    }
+
+    def is_output(lookup) -> bool:
+        if isinstance(lookup, Prefetch):
+            lookup = lookup.prefetch_through
+        return lookup.split(LOOKUP_SEP)[0] not in omitted_sources
+
+    select_related = [
+        lookup for lookup in getattr(meta, "select_related", ()) if is_output(lookup)
+    ]
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+
+    prefetch_related = [
+        lookup for lookup in getattr(meta, "prefetch_related", ()) if is_output(lookup)
+    ]
+    prefetch_related += expanded
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+
+    annotations = {
+        name: annotation
+        for name, annotation in getattr(meta, "annotations", {}).items()
+        if is_output(name)
+    }
+    if annotations:
+        queryset = queryset.annotate(**annotations)
+
+    return queryset
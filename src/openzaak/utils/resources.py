@@ -0,0 +1,134 @@
+"""
+Resolve the URLs of local resources to database objects in bulk.
+
+:func:`vng_api_common.utils.get_resource_for_path` resolves a single URL with
+one query. Filtering on a large set of authorizations then turns into a query
+per ``Autorisatie``. The helpers here group the URLs by the model they point
+to and look them up with one ``__in`` query per model instead.
+
+Which object a path points to never changes (the lookup fields are
+immutable), so the resolved primary keys are memoized in-process. Entries are
+evicted when the object is changed or deleted, see
+:mod:`openzaak.components.catalogi.signals`, on all nodes through
+:mod:`openzaak.utils.invalidation`.
+"""
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Set
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+
+from vng_api_common.utils import get_viewset_for_path
+
+from . import invalidation
+from .cache import LRUCache
+
+# the path mapping is immutable until objects are deleted - the timeout only
+# bounds the memory held by stale entries for objects changed on other nodes
+resolved_paths = invalidation.track(
+    LRUCache(maxsize=settings.RESOLVED_PATHS_CACHE_SIZE, timeout=60 * 60 * 24)
+)
+
+
+def get_path(url: str) -> str:
+    path = urlparse(url).path
+    if settings.FORCE_SCRIPT_NAME and path.startswith(settings.FORCE_SCRIPT_NAME):
+        path = path[len(settings.FORCE_SCRIPT_NAME) :]
+    return path
+
+
+def get_resource_values(urls: Iterable[str], field: str = "pk") -> Dict[str, Any]:
+    """
+    Map the URLs of local resources to the value of ``field`` of their objects.
+
+    URLs that do not resolve to an existing object are left out of the result.
+    """
+    values = {}
+    # (model, lookup field) -> lookup value -> urls
+    lookups = defaultdict(lambda: defaultdict(list))
+    querysets = {}
+
+    for url in set(urls):
+        if not url:
+            continue
+
+        path = get_path(url)
+        resolved = resolved_paths.get((path, field))
+        if resolved is not None:
+            values[url] = resolved[2]
+            continue
+
+        try:
+            viewset = get_viewset_for_path(path)
+        except ObjectDoesNotExist:
+            continue
+
+        lookup_url_kwarg = viewset.lookup_url_kwarg or viewset.lookup_field
+        if lookup_url_kwarg not in viewset.kwargs:
+            continue
+
+        queryset = viewset.get_queryset()
+        key = (queryset.model, viewset.lookup_field)
+        querysets.setdefault(key, queryset)
+        lookups[key][str(viewset.kwargs[lookup_url_kwarg])].append(url)
+
+    for (model, lookup_field), urls_by_value in lookups.items():
+        queryset = querysets[(model, lookup_field)].filter(
+            **{f"{lookup_field}__in": list(urls_by_value)}
+        )
+        for lookup_value, pk, value in queryset.values_list(lookup_field, "pk", field):
+            for url in urls_by_value[str(lookup_value)]:
+                values[url] = value
+                resolved_paths.set(
+                    (get_path(url), field), (model._meta.label, pk, value)
+                )
+
+    return values
+
+
+def get_resource_pks(urls: Iterable[str]) -> Dict[str, int]:
+    """
+    Map the URLs of local resources to the primary keys of their objects.
+    """
+    return get_resource_values(urls)
+
+
+def get_lookup_values(urls: Iterable[str], model: models.Model) -> Set[str]:
+    """
+    Extract the lookup values (usually the UUID) from the URLs of ``model`` objects.
+
+    Unlike :func:`get_resource_values` the database is not queried, the values
+    are meant to be looked up with a single ``__in`` query by the caller. URLs
+    that don't point to ``model`` objects are left out of the result.
+    """
+    values = set()
+    for url in set(urls):
+        try:
+            viewset = get_viewset_for_path(get_path(url))
+        except ObjectDoesNotExist:
+            continue
+
+        queryset = getattr(viewset, "queryset", None)
+        if queryset is None or queryset.model is not model:
+            continue
+
+        lookup_url_kwarg = viewset.lookup_url_kwarg or viewset.lookup_field
+        if lookup_url_kwarg in viewset.kwargs:
+            values.add(str(viewset.kwargs[lookup_url_kwarg]))
+
+    return values
+
+
+@invalidation.register("resources")
+def _forget(label: str, pk: Any) -> None:
+    resolved_paths.delete_where(lambda value: value[:2] == (label, pk))
+
+
+def forget_resource(instance: models.Model) -> None:
+    """
+    Evict the memoized paths pointing to ``instance``.
+    """
+    _forget(instance._meta.label, instance.pk)
+    invalidation.publish("resources", instance._meta.label, instance.pk)
@@ -1,16 +1,263 @@
 import logging
+from collections import OrderedDict
 
 from django.conf import settings
 
-from vng_api_common.inspectors.view import AutoSchema as _AutoSchema
+from djangorestframework_camel_case.util import camelize
+from drf_yasg import openapi
+from rest_framework import exceptions, status
+from vng_api_common.exceptions import PreconditionFailed
+from vng_api_common.geo import GeoMixin
+from vng_api_common.inspectors.view import (
+    COMMON_ERRORS,
+    HTTP_STATUS_CODE_TITLES,
+    AutoSchema as _AutoSchema,
+    response_header,
+)
 from vng_api_common.permissions import get_required_scopes
+from vng_api_common.serializers import FoutSerializer, ValidatieFoutSerializer
 
+from .pagination import OptionalCursorPagination
 from .permissions import AuthRequired
+from .serializers import FlexFieldsSerializerMixin
+from .viewsets import BulkCreateMixin, ETagMixin
 
 logger = logging.getLogger(__name__)
 
+MULTIGET_ERRORS = COMMON_ERRORS + [exceptions.ParseError, exceptions.ValidationError]
+
+count_approximate_header = response_header(
+    "Geeft aan dat het `count` attribuut een schatting is. Alleen aanwezig als "
+    "de waarde `true` is.",
+    type=openapi.TYPE_BOOLEAN,
+)
+
+etag_header = response_header(
+    "De ETag van het antwoord, voor conditionele requests met `If-None-Match` "
+    "en `If-Match`.",
+    type=openapi.TYPE_STRING,
+)
+
+if_none_match_parameter = openapi.Parameter(
+    name="If-None-Match",
+    type=openapi.TYPE_STRING,
+    in_=openapi.IN_HEADER,
+    required=False,
+    description="Een of meer ETags. Als de ETag van het antwoord hiertussen zit, "
+    "volgt een `304` zonder inhoud.",
+)
+
+if_match_parameter = openapi.Parameter(
+    name="If-Match",
+    type=openapi.TYPE_STRING,
+    in_=openapi.IN_HEADER,
+    required=False,
+    description="Een of meer ETags. Als de huidige ETag van het object hier niet "
+    "tussen zit, wordt het object niet gewijzigd en volgt een `412`.",
+)
+
+field_selection_parameters = [
+    openapi.Parameter(
+        name="fields",
+        type=openapi.TYPE_STRING,
+        in_=openapi.IN_QUERY,
+        required=False,
+        description="Komma-gescheiden lijst van de attributen (in camelCase) die "
+        "in het antwoord opgenomen worden. Standaard worden alle attributen "
+        "opgenomen.",
+    ),
+    openapi.Parameter(
+        name="omit",
+        type=openapi.TYPE_STRING,
+        in_=openapi.IN_QUERY,
+        required=False,
+        description="Komma-gescheiden lijst van de attributen (in camelCase) die "
+        "niet in het antwoord opgenomen worden.",
+    ),
+]
+
+
+def get_bulk_schema(schema: openapi.Schema) -> openapi.SwaggerDict:
+    """
+    Accept a list of objects as well, see :class:`.viewsets.BulkCreateMixin`.
+    """
+    return openapi.SwaggerDict(
+        x_one_of=[schema, openapi.Schema(type=openapi.TYPE_ARRAY, items=schema)]
+    )
+
 
 class AutoSchema(_AutoSchema):
+    @property
+    def _is_bulk_create(self) -> bool:
+        return isinstance(self.view, BulkCreateMixin) and self.view.action == "create"
+
+    @property
+    def _is_multiget(self) -> bool:
+        return getattr(self.view, "action", None) == "_multiget"
+
+    @property
+    def _has_etag(self) -> bool:
+        if not isinstance(self.view, ETagMixin):
+            return False
+        # only paginated lists have an ETag
+        return self.view.action == "retrieve" or (
+            self.view.action == "list" and self.should_page()
+        )
+
+    @property
+    def _accepts_if_match(self) -> bool:
+        return isinstance(self.view, ETagMixin) and self.view.action in (
+            "update",
+            "partial_update",
+        )
+
+    def get_request_body_schema(self, serializer):
+        schema = super().get_request_body_schema(serializer)
+        if self._is_bulk_create:
+            return get_bulk_schema(schema)
+        return schema
+
+    def get_query_parameters(self):
+        parameters = super().get_query_parameters()
+
+        # the field selection only applies to the output of GET requests
+        if self.method != "GET":
+            return parameters
+
+        serializer = self.get_view_serializer()
+        if isinstance(serializer, FlexFieldsSerializerMixin):
+            parameters += field_selection_parameters
+            if serializer.expandable_fields:
+                parameters.append(self.get_expand_parameter(serializer))
+
+        return parameters
+
+    def get_expand_parameter(self, serializer) -> openapi.Parameter:
+        names = ", ".join(
+            f"`{name}`"
+            for name in camelize(dict.fromkeys(serializer.expandable_fields))
+        )
+        return openapi.Parameter(
+            name="expand",
+            type=openapi.TYPE_STRING,
+            in_=openapi.IN_QUERY,
+            required=False,
+            description="Komma-gescheiden lijst van de gerelateerde resources die "
+            "als genest object in plaats van als URL opgenomen worden. Geneste "
+            f"resources worden met een punt aangegeven. Mogelijke waarden: {names}.",
+        )
+
+    def get_default_responses(self) -> OrderedDict:
+        if self._is_multiget:
+            return self.get_multiget_responses()
+
+        responses = super().get_default_responses()
+        if self._has_etag:
+            responses[status.HTTP_304_NOT_MODIFIED] = openapi.Response(
+                description=HTTP_STATUS_CODE_TITLES[status.HTTP_304_NOT_MODIFIED]
+            )
+        elif self._accepts_if_match:
+            responses[status.HTTP_412_PRECONDITION_FAILED] = openapi.Response(
+                description=HTTP_STATUS_CODE_TITLES[
+                    status.HTTP_412_PRECONDITION_FAILED
+                ],
+                schema=self.serializer_to_schema(FoutSerializer()),
+            )
+        else:
+            return responses
+
+        return OrderedDict(sorted(responses.items(), key=lambda item: int(item[0])))
+
+    def get_multiget_responses(self) -> OrderedDict:
+        """
+        Return the responses of ``_multiget``, see :class:`.viewsets.MultiGetMixin`.
+
+        The objects are output as with ``list``, but without pagination, and
+        the errors are those of a ``create``.
+        """
+        serializer = self.get_view_serializer()
+        schema = openapi.Schema(
+            type=openapi.TYPE_ARRAY, items=self.serializer_to_schema(serializer)
+        )
+        headers = (
+            self.probe_inspectors(
+                self.field_inspectors,
+                "get_response_headers",
+                serializer,
+                {"field_inspectors": self.field_inspectors},
+                status=status.HTTP_200_OK,
+            )
+            or None
+        )
+        responses = OrderedDict(
+            [
+                (
+                    str(status.HTTP_200_OK),
+                    openapi.Response(
+                        description=HTTP_STATUS_CODE_TITLES[status.HTTP_200_OK],
+                        schema=schema,
+                        headers=headers,
+                    ),
+                )
+            ]
+        )
+
+        fout_schema = self.serializer_to_schema(FoutSerializer())
+        errors = {
+            exception_klass.status_code: fout_schema
+            for exception_klass in MULTIGET_ERRORS
+        }
+        errors[exceptions.ValidationError.status_code] = self.serializer_to_schema(
+            ValidatieFoutSerializer()
+        )
+        if isinstance(self.view, GeoMixin):
+            errors[PreconditionFailed.status_code] = fout_schema
+
+        for status_code, error_schema in sorted(errors.items()):
+            responses[status_code] = openapi.Response(
+                description=HTTP_STATUS_CODE_TITLES.get(status_code, ""),
+                schema=error_schema,
+            )
+        return responses
+
+    def add_manual_parameters(self, parameters):
+        result = super().add_manual_parameters(parameters)
+        if self._has_etag:
+            result.append(if_none_match_parameter)
+        if self._accepts_if_match:
+            result.append(if_match_parameter)
+        if not self._is_multiget:
+            return result
+
+        # the headers of the output, e.g. the CRS of the geometries
+        return result + (
+            self.probe_inspectors(
+                self.field_inspectors,
+                "get_request_header_parameters",
+                self.get_view_serializer(),
+                {"field_inspectors": self.field_inspectors},
+            )
+            or []
+        )
+
+    def get_response_schemas(self, response_serializers):
+        responses = super().get_response_schemas(response_serializers)
+
+        if self._is_bulk_create and "201" in responses:
+            responses["201"]["schema"] = get_bulk_schema(responses["201"]["schema"])
+
+        paginator = getattr(self.view, "paginator", None)
+        if self.should_page() and isinstance(paginator, OptionalCursorPagination):
+            response = responses.get("200")
+            if response is not None:
+                response["headers"]["X-Count-Approximate"] = count_approximate_header
+
+        if self._has_etag:
+            for status_code in ("200", "304"):
+                responses[status_code]["headers"]["ETag"] = etag_header
+
+        return responses
+
     def get_security(self):
         """Return a list of security requirements for this operation.
 
@@ -0,0 +1,287 @@
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Set
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Prefetch
+from django.urls import Resolver404, resolve
+from django.utils.translation import ugettext_lazy as _
+
+from djangorestframework_camel_case.util import camel_to_underscore
+from rest_flex_fields.serializers import (
+    FlexFieldsSerializerMixin as _FlexFieldsSerializerMixin,
+)
+from rest_framework import serializers
+from rest_framework.fields import Field
+from rest_framework.relations import HyperlinkedIdentityField, HyperlinkedRelatedField
+
+from .data_filtering import filter_by_authorizations
+from .query import apply_query_plan
+from .resources import get_path
+
+
+def get_sources(field: Field) -> Optional[Set[str]]:
+    """
+    Return the attributes of the object used by the field, ``None`` if unknown.
+    """
+    if field.source != "*":
+        return {field.source.split(".")[0]}
+
+    if isinstance(field, HyperlinkedIdentityField):
+        lookups = [
+            field.lookup_field,
+            *getattr(field, "parent_lookup_kwargs", {}).values(),
+        ]
+        return {lookup.split("__")[0] for lookup in lookups}
+
+    return None
+
+
+class FlexFieldsSerializerMixin(_FlexFieldsSerializerMixin):
+    """
+    Output only the fields requested with ``?fields=`` or without ``?omit=``.
+
+    The field names are given in camelCase, like they are output. The fields
+    are only left out of the output, the serializer itself is unchanged. The
+    sources of the omitted fields don't have to be loaded, see
+    :func:`openzaak.utils.query.apply_query_plan`.
+
+    The related objects in ``expandable_fields`` are output as nested objects
+    instead of URLs when requested with ``?expand=``, e.g.
+    ``?expand=status.statustype``. The settings of an expandable field can
+    contain the ``scope`` needed to read the related objects, those the
+    client isn't authorized for are left out. Without a scope, the related
+    objects are authorized through this object. The expanded objects must be
+    prefetched, see :meth:`get_expanded_prefetches`.
+    """
+
+    _field_selection = ([], [], {})
+
+    def _parse_request_list_value(self, field):
+        return [
+            ".".join(camel_to_underscore(name) for name in value.split("."))
+            for value in super()._parse_request_list_value(field)
+        ]
+
+    def _clean_fields(self, omit_fields, sparse_fields, next_level_omits):
+        self._field_selection = (omit_fields, sparse_fields, next_level_omits)
+
+    def _make_expanded_field_serializer(
+        self, name, nested_expand, nested_fields, nested_omit
+    ):
+        serializer_class, settings = self.expandable_fields[name]
+        settings = dict(settings)
+        scope = settings.pop("scope", None)
+        source = settings.pop("source", name)
+
+        for key, nested in (
+            ("expand", nested_expand),
+            ("fields", nested_fields),
+            ("omit", nested_omit),
+        ):
+            if name in nested:
+                settings[key] = nested[name]
+
+        if isinstance(serializer_class, str):
+            serializer_class = self._import_serializer_class(serializer_class)
+
+        # the authorized objects are prefetched into a separate attribute, so
+        # the relation itself is left intact
+        settings.setdefault("read_only", True)
+        serializer = serializer_class(source=f"_expanded_{name}", **settings)
+        serializer.expand_source = source
+        serializer.expand_scope = scope
+        return serializer
+
+    def is_output(self, field_name: str) -> bool:
+        return self._should_field_exist(field_name, *self._field_selection)
+
+    @property
+    def _readable_fields(self):
+        return [
+            field
+            for field in super()._readable_fields
+            if self.is_output(field.field_name)
+        ]
+
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+
+        # polymorphic serializers add the fields of the discriminated type
+        # to the output, these are selected the same way
+        for name in list(representation):
+            if name not in self.fields and not self.is_output(name):
+                del representation[name]
+        return representation
+
+    def get_omitted_sources(self) -> Set[str]:
+        """
+        Return the attributes of the objects that none of the output fields use.
+        """
+        output, omitted = [], []
+        for field in super()._readable_fields:
+            sources = output if self.is_output(field.field_name) else omitted
+            sources.append(get_sources(field))
+
+        if not omitted or None in output:
+            return set()
+        return set().union(*filter(None, omitted)) - set().union(*output)
+
+    def get_expanded_prefetches(self) -> List[Prefetch]:
+        """
+        Return the prefetches of the expanded objects.
+
+        The expanded objects are loaded for all the objects that are output at
+        once, with their own query plan.
+        """
+        request = self.context["request"]
+        prefetches = []
+        for name in self.expanded_fields:
+            field = self.fields[name]
+            serializer = getattr(field, "child", field)
+
+            queryset = apply_query_plan(
+                serializer.Meta.model._default_manager.all(),
+                type(serializer),
+                serializer.get_omitted_sources(),
+                serializer.get_expanded_prefetches(),
+            )
+            if field.expand_scope is not None:
+                queryset = filter_by_authorizations(
+                    queryset, request, field.expand_scope
+                )
+            prefetches.append(
+                Prefetch(field.expand_source, queryset=queryset, to_attr=field.source)
+            )
+        return prefetches
+
+
+@contextmanager
+def shared_lookups(serializer: serializers.Serializer, data: List[dict]) -> Iterator:
+    """
+    Look up the objects the items in ``data`` refer to by URL up front.
+
+    The objects are fetched with one query per hyperlinked field of
+    ``serializer``, instead of one per item, and shared between the items.
+    URLs that don't resolve to an object are left to the field to reject.
+    """
+    fields = [
+        field
+        for field in serializer._writable_fields
+        if isinstance(field, HyperlinkedRelatedField)
+    ]
+
+    for field in fields:
+        values = set()
+        for item in data:
+            url = item.get(field.field_name) if isinstance(item, dict) else None
+            if not isinstance(url, str):
+                continue
+
+            try:
+                match = resolve(get_path(url))
+            except Resolver404:
+                continue
+
+            if match.view_name == field.view_name:
+                values.add(match.kwargs.get(field.lookup_url_kwarg))
+
+        queryset = field.get_queryset().filter(
+            **{f"{field.lookup_field}__in": values - {None}}
+        )
+        try:
+            objects = {str(getattr(obj, field.lookup_field)): obj for obj in queryset}
+        except DjangoValidationError:
+            # malformed lookup values, rejected by the field itself
+            continue
+
+        def get_object(view_name, view_args, view_kwargs, field=field, objects=objects):
+            obj = objects.get(str(view_kwargs[field.lookup_url_kwarg]))
+            if obj is None:
+                return type(field).get_object(field, view_name, view_args, view_kwargs)
+            return obj
+
+        field.get_object = get_object
+
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.__dict__.pop("get_object", None)
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """
+    Validate the items of a bulk create, see
+    :class:`openzaak.utils.viewsets.BulkCreateMixin`.
+
+    All items are validated before any of them is created, sharing the related
+    objects (see :func:`shared_lookups`). The errors are keyed by the position
+    of the item they belong to. Validators comparing an item to the
+    other items, rather than only to the stored objects, find the items
+    validated before it in :attr:`validated_items`.
+    """
+
+    validated_items = ()
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list) or not data:
+            return super().to_internal_value(data)
+
+        self.validated_items = []
+        errors = []
+
+        with shared_lookups(self.child, data):
+            for item in data:
+                try:
+                    validated = self.child.run_validation(item)
+                except serializers.ValidationError as exc:
+                    errors.append(exc.detail)
+                else:
+                    self.validated_items.append(validated)
+                    errors.append({})
+
+        if any(errors):
+            # keyed by position, as the error handler expects a mapping
+            raise serializers.ValidationError(
+                {str(index): detail for index, detail in enumerate(errors) if detail}
+            )
+
+        return self.validated_items
+
+
+class MultiGetSerializer(serializers.Serializer):
+    """
+    The objects to retrieve with :class:`openzaak.utils.viewsets.MultiGetMixin`.
+    """
+
+    max_length = 1000
+
+    uuids = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        help_text=_("De UUIDs van de op te vragen objecten."),
+    )
+    urls = serializers.ListField(
+        child=serializers.URLField(max_length=1000),
+        required=False,
+        help_text=_("De URLs van de op te vragen objecten."),
+    )
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+
+        length = len(attrs.get("uuids", ())) + len(attrs.get("urls", ()))
+        if not length:
+            raise serializers.ValidationError(
+                _("Geef de `uuids` en/of `urls` van de op te vragen objecten op."),
+                code="required",
+            )
+        if length > self.max_length:
+            raise serializers.ValidationError(
+                _("Er kunnen maximaal {max_length} objecten opgevraagd worden.").format(
+                    max_length=self.max_length
+                ),
+                code="max-length",
+            )
+
+        return attrs
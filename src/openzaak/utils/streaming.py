@@ -0,0 +1,68 @@
+"""
+Stream large lists of objects as JSON instead of building the response in memory.
+
+A regular response holds all the serialized objects, their camelized copies and
+the rendered JSON in memory at the same time. Streaming fetches the objects with
+a server-side cursor, serializes them in chunks and renders them one by one, so
+the memory used doesn't depend on the number of objects.
+"""
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+from django.db.models import QuerySet, prefetch_related_objects
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.serializers import BaseSerializer
+
+
+def iter_chunks(objects: Iterable, chunk_size: int) -> Iterator[List]:
+    iterator = iter(objects)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_objects(queryset: QuerySet, chunk_size: int) -> Iterator[List]:
+    """
+    Fetch the objects in chunks with a server-side cursor.
+
+    The prefetches can't be done by the iterator, they're done per chunk instead.
+    """
+    lookups = queryset._prefetch_related_lookups
+    iterator = queryset.prefetch_related(None).iterator(chunk_size=chunk_size)
+    for chunk in iter_chunks(iterator, chunk_size):
+        if lookups:
+            prefetch_related_objects(chunk, *lookups)
+        yield chunk
+
+
+def iter_serialized(
+    serializer: BaseSerializer, chunks: Iterable[List]
+) -> Iterator[List[dict]]:
+    for chunk in chunks:
+        yield serializer.to_representation(chunk)
+
+
+def render_stream(
+    renderer: BaseRenderer,
+    chunks: Iterable[List[dict]],
+    accepted_media_type: str = None,
+    renderer_context: dict = None,
+) -> Iterator[bytes]:
+    """
+    Render the chunks of items as a JSON array.
+    """
+
+    def render(data) -> bytes:
+        return renderer.render(data, accepted_media_type, renderer_context)
+
+    yield b"["
+    separator = b""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        yield separator + b",".join(render(item) for item in chunk)
+        separator = b","
+    yield b"]"
@@ -1,10 +1,16 @@
+from contextlib import contextmanager
+
+from django.db import connection
 from django.db.models import Model
+from django.test.utils import CaptureQueriesContext
 
 from vng_api_common.authorizations.models import Applicatie, Autorisatie
 from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
 from vng_api_common.models import JWTSecret
 from vng_api_common.tests import generate_jwt_auth, reverse
 
+from openzaak.components.authorizations.cache import invalidate, invalidate_tokens
+
 
 class JWTAuthMixin:
     """
@@ -67,6 +73,10 @@ class JWTAuthMixin:
     def setUp(self):
         super().setUp()
 
+        # changes made by previous tests are rolled back without signals
+        invalidate([self.client_id])
+        invalidate_tokens([self.client_id])
+
         token = generate_jwt_auth(
             client_id=self.client_id,
             secret=self.secret,
@@ -74,3 +84,22 @@ class JWTAuthMixin:
             user_representation=self.user_representation,
         )
         self.client.credentials(HTTP_AUTHORIZATION=token)
+
+
+class AuthorizationQueriesMixin:
+    """
+    Count the queries on the authorizations of the client.
+    """
+
+    @contextmanager
+    def assertMaxAuthorizationQueries(self, num: int):
+        table = Autorisatie._meta.db_table
+        with CaptureQueriesContext(connection) as context:
+            yield
+
+        queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if f'"{table}"' in query["sql"]
+        ]
+        self.assertLessEqual(len(queries), num, "\n".join(queries))
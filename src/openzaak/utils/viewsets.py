@@ -0,0 +1,437 @@
+import hashlib
+import json
+from itertools import chain
+from types import SimpleNamespace
+from typing import List, Optional, Set
+from urllib.parse import urlencode
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.http import StreamingHttpResponse
+from django.utils.http import parse_etags, quote_etag
+
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.compat import get_header
+from vng_api_common.constants import CommonResourceAction
+from vng_api_common.exceptions import PreconditionFailed
+from vng_api_common.search import is_search_view
+from vng_api_common.viewsets import CheckQueryParamsMixin as _CheckQueryParamsMixin
+
+from .data_filtering import filter_by_authorizations
+from .query import apply_query_plan
+from .resources import get_lookup_values
+from .serializers import (
+    BulkListSerializer,
+    FlexFieldsSerializerMixin,
+    MultiGetSerializer,
+)
+from .streaming import iter_objects, iter_serialized, render_stream
+
+FIELD_SELECTION_PARAMS = {"fields", "omit", "expand"}
+
+
+class QueryPlanMixin:
+    """
+    Apply the query plan of the serializer to the querysets that are output.
+
+    Only the actions outputting existing objects are eager loaded: after
+    writes, the related objects have to be fetched again anyway.
+
+    See :func:`openzaak.utils.query.apply_query_plan`.
+    """
+
+    query_plan_actions = ("list", "retrieve", "_multiget")
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        action = getattr(self, "action", None)
+        if action is None:
+            return queryset
+
+        if action in self.query_plan_actions or is_search_view(self):
+            queryset = self.apply_query_plan(queryset)
+
+        return queryset
+
+    def apply_query_plan(self, queryset):
+        """
+        Apply the query plan for the fields selected with ``?fields=``,
+        ``?omit=`` and ``?expand=``.
+        """
+        serializer_class = self.get_serializer_class()
+        if not issubclass(serializer_class, FlexFieldsSerializerMixin) or not (
+            FIELD_SELECTION_PARAMS & set(self.request.query_params)
+        ):
+            return apply_query_plan(queryset, serializer_class)
+
+        serializer = self.get_serializer()
+        return apply_query_plan(
+            queryset,
+            serializer_class,
+            serializer.get_omitted_sources(),
+            serializer.get_expanded_prefetches(),
+        )
+
+
+class CheckQueryParamsMixin(_CheckQueryParamsMixin):
+    """
+    Accept the cursor of :class:`openzaak.utils.pagination.OptionalCursorPagination`
+    and the field selection and expansion of
+    :class:`openzaak.utils.serializers.FlexFieldsSerializerMixin` as known query
+    parameters too.
+    """
+
+    def get_extra_query_params(self) -> Set[str]:
+        extra = set()
+
+        cursor_query_param = getattr(self.paginator, "cursor_query_param", None)
+        if cursor_query_param:
+            extra.add(cursor_query_param)
+
+        if issubclass(self.get_serializer_class(), FlexFieldsSerializerMixin):
+            extra.update(FIELD_SELECTION_PARAMS)
+
+        return extra
+
+    def _check_query_params(self, request) -> None:
+        extra = self.get_extra_query_params() & set(request.query_params)
+        if extra:
+            query_params = request.query_params.copy()
+            for name in extra:
+                del query_params[name]
+            # only the query parameters are checked
+            request = SimpleNamespace(query_params=query_params)
+
+        super()._check_query_params(request)
+
+
+class StreamingListMixin:
+    """
+    Stream the output of the unpaginated list actions if it's large.
+
+    Up to ``stream_threshold`` objects are output as usual, beyond that the
+    objects are streamed in chunks of ``stream_chunk_size``, see
+    :mod:`openzaak.utils.streaming`.
+
+    Paginated lists are small enough to be output as usual, so the mixin is
+    only of use on viewsets without pagination.
+    """
+
+    stream_threshold = 1000
+    stream_chunk_size = 500
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.get_list_output(queryset)
+
+    def get_list_output(self, queryset):
+        chunks = iter_objects(queryset, self.stream_chunk_size)
+        first = []
+        for chunk in chunks:
+            first += chunk
+            if len(first) > self.stream_threshold:
+                return self.get_streaming_response(chain([first], chunks))
+
+        serializer = self.get_serializer(first, many=True)
+        return Response(serializer.data)
+
+    def get_streaming_response(self, chunks) -> StreamingHttpResponse:
+        renderer = self.request.accepted_renderer
+        content = render_stream(
+            renderer,
+            iter_serialized(self.get_serializer(many=True), chunks),
+            accepted_media_type=self.request.accepted_media_type,
+            renderer_context=self.get_renderer_context(),
+        )
+        return StreamingHttpResponse(content, content_type=renderer.media_type)
+
+
+class BulkCreateMixin:
+    """
+    Create several objects at once by posting a list of objects.
+
+    All items are validated before any of them is created, see
+    :class:`openzaak.utils.serializers.BulkListSerializer`, and they are
+    created in a single transaction. The audit trails are written with one
+    query. Instead of a notification per object, one notification is sent per
+    main object, with the collection of its objects as resource URL.
+
+    Posting a single object is handled as usual, by the mixins after this one.
+    """
+
+    def create(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            return super().create(request, *args, **kwargs)
+
+        serializer = self.get_bulk_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            self.perform_bulk_create(serializer)
+            data = serializer.data
+            self.create_bulk_audittrails(
+                status.HTTP_201_CREATED, serializer.instance, data
+            )
+
+        self.notify_bulk(status.HTTP_201_CREATED, data)
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def get_bulk_serializer(self, data: List[dict]) -> BulkListSerializer:
+        child = self.get_serializer()
+        return BulkListSerializer(child=child, data=data, context=child.context)
+
+    def perform_bulk_create(self, serializer: BulkListSerializer) -> None:
+        serializer.save()
+
+    def create_bulk_audittrails(
+        self, status_code: int, instances: list, data: List[dict]
+    ) -> None:
+        """
+        Create the audit trails of the created objects with a single query.
+
+        The trails are the same as those of
+        :meth:`vng_api_common.audittrails.viewsets.AuditTrailMixin.create_audittrail`.
+        """
+        applications = self.request.jwt_auth.applicaties
+        if applications:
+            app_id, app_presentation = str(applications[0].uuid), applications[0].label
+        else:
+            app_id = get_header(self.request, "X-NLX-Request-Application-Id")
+            app_presentation = app_id
+
+        user_id = self.request.jwt_auth.payload.get("user_id", "")
+        if not user_id:
+            user_id = get_header(self.request, "X-NLX-Request-User-Id") or ""
+
+        AuditTrail.objects.bulk_create(
+            AuditTrail(
+                bron=self.audit.component_name,
+                request_id=get_header(self.request, "X-NLX-Request-Id") or "",
+                applicatie_id=app_id,
+                applicatie_weergave=app_presentation,
+                actie=CommonResourceAction.create,
+                actie_weergave=CommonResourceAction.labels[CommonResourceAction.create],
+                gebruikers_id=user_id,
+                gebruikers_weergave=self.request.jwt_auth.payload.get(
+                    "user_representation", ""
+                ),
+                resultaat=status_code,
+                hoofd_object=self.get_audittrail_main_object_url(
+                    item, self.audit.main_resource
+                ),
+                resource=self.basename,
+                resource_url=item["url"],
+                toelichting=get_header(self.request, "X-Audit-Toelichting") or "",
+                resource_weergave=instance.unique_representation(),
+                oud=None,
+                nieuw=item,
+            )
+            for instance, item in zip(instances, data)
+        )
+
+    def notify_bulk(self, status_code: int, data: List[dict]) -> None:
+        """
+        Send one notification per main object the objects were created for.
+        """
+        main_resource_key = self.get_main_resource_key(self.get_kanaal())
+        main_object_urls = dict.fromkeys(item[main_resource_key] for item in data)
+        for main_object_url in main_object_urls:
+            self.notify(
+                status_code,
+                {
+                    "url": self.get_bulk_resource_url(main_object_url),
+                    main_resource_key: main_object_url,
+                },
+            )
+
+    def get_bulk_resource_url(self, main_object_url: str) -> str:
+        """
+        Return the URL of the collection of objects of the main object.
+        """
+        main_resource_key = self.get_main_resource_key(self.get_kanaal())
+        collection_url = self.request.build_absolute_uri(self.request.path)
+        return f"{collection_url}?{urlencode({main_resource_key: main_object_url})}"
+
+
+class MultiGetMixin:
+    """
+    Retrieve several objects at once by posting their UUIDs and/or URLs.
+
+    The objects are looked up with a single query, limited to the objects the
+    client is authorized for with the scope of ``_multiget`` in
+    ``required_scopes``. Objects that don't exist or may not be accessed are
+    left out of the output. The URLs are resolved without querying the
+    database, see :func:`openzaak.utils.resources.get_lookup_values`.
+    """
+
+    @swagger_auto_schema(request_body=MultiGetSerializer)
+    @action(methods=("post",), detail=False)
+    def _multiget(self, request, *args, **kwargs):
+        """
+        Vraag meerdere objecten in een keer op aan de hand van hun UUIDs en/of URLs.
+        """
+        input_serializer = MultiGetSerializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+
+        queryset = self.get_multiget_queryset(**input_serializer.validated_data)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+    def get_multiget_queryset(self, uuids=(), urls=()):
+        queryset = self.get_queryset()
+        lookup_values = {str(uuid) for uuid in uuids} | get_lookup_values(
+            urls, queryset.model
+        )
+        queryset = queryset.filter(**{f"{self.lookup_field}__in": lookup_values})
+        return filter_by_authorizations(
+            queryset, self.request, self.required_scopes[self.action]
+        )
+
+
+class NotModified(Exception):
+    """
+    Raised to answer a list request with a ``304``, see :class:`ETagMixin`.
+    """
+
+    def __init__(self, etag: str):
+        super().__init__(etag)
+        self.etag = etag
+
+
+class ETagMixin:
+    """
+    Support conditional requests with ETags computed from the row version.
+
+    The ETags are derived from the row version of the object, see
+    :class:`openzaak.utils.models.RowVersionMixin`, and of a page of a list
+    from the pagination (count and links) and the primary keys and row
+    versions of the objects on the page. They are computed before anything is
+    serialized, without further queries, and ``If-None-Match`` is answered
+    with a ``304`` without serializing at all. Unpaginated lists have no ETag.
+
+    The host, media type and query parameters of the request are part of the
+    ETag, as they change the representation. No ETag is given with
+    ``?expand=``, as the expanded objects have their own versions.
+
+    ``If-Match`` is checked on updates against the current row version, with
+    the row locked until the update is saved. Only the row version is
+    compared, so an ETag obtained with other query parameters still matches.
+    Weak ETags never match, as ``If-Match`` uses the strong comparison.
+    """
+
+    def etags_enabled(self) -> bool:
+        return "expand" not in self.request.query_params
+
+    def get_etag(self, version) -> Optional[str]:
+        if not self.etags_enabled():
+            return None
+
+        representation = "|".join(
+            [
+                self.request.get_host(),
+                self.request.accepted_media_type or "",
+                urlencode(sorted(self.request.query_params.lists()), doseq=True),
+            ]
+        )
+        digest = hashlib.md5(representation.encode("utf-8")).hexdigest()[:12]
+        return quote_etag(f"{version}-{digest}")
+
+    def get_page_etag(self, page: list) -> Optional[str]:
+        if not self.etags_enabled():
+            return None
+
+        # the envelope holds the count and the links to the other pages
+        envelope = self.get_paginated_response([]).data
+        versions = [(obj.pk, obj.row_version) for obj in page]
+        content = json.dumps([envelope, versions], cls=DjangoJSONEncoder)
+        digest = hashlib.md5(content.encode("utf-8")).hexdigest()[:12]
+        return self.get_etag(f"{len(page)}.{digest}")
+
+    def is_not_modified(self, etag: Optional[str]) -> bool:
+        header = self.request.META.get("HTTP_IF_NONE_MATCH")
+        if etag is None or not header:
+            return False
+        # If-None-Match uses the weak comparison
+        etags = {
+            tag[2:] if tag.startswith("W/") else tag for tag in parse_etags(header)
+        }
+        return "*" in etags or etag in etags
+
+    def get_conditional_response(self, etag: Optional[str], get_response) -> Response:
+        if self.is_not_modified(etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        response = get_response()
+        if etag is not None and response.status_code == status.HTTP_200_OK:
+            response["ETag"] = etag
+        return response
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if page is None or getattr(self, "action", None) != "list":
+            return page
+
+        self._page_etag = self.get_page_etag(page)
+        if self.is_not_modified(self._page_etag):
+            raise NotModified(self._page_etag)
+        return page
+
+    def list(self, request, *args, **kwargs):
+        self._page_etag = None
+        try:
+            response = super().list(request, *args, **kwargs)
+        except NotModified as exc:
+            return Response(
+                status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": exc.etag}
+            )
+
+        if self._page_etag is not None and response.status_code == status.HTTP_200_OK:
+            response["ETag"] = self._page_etag
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+
+        def get_response():
+            serializer = self.get_serializer(instance)
+            return Response(serializer.data)
+
+        return self.get_conditional_response(
+            self.get_etag(instance.row_version), get_response
+        )
+
+    def perform_update(self, serializer):
+        header = self.request.META.get("HTTP_IF_MATCH")
+        if not header:
+            return super().perform_update(serializer)
+
+        with transaction.atomic():
+            etags = parse_etags(header)
+            if "*" not in etags:
+                version = str(self.get_current_row_version(serializer.instance))
+                versions = {
+                    etag.strip('"').split("-")[0]
+                    for etag in etags
+                    if not etag.startswith("W/")
+                }
+                if version not in versions:
+                    raise PreconditionFailed(
+                        detail="Het object is gewijzigd sinds de opgegeven ETag"
+                    )
+            super().perform_update(serializer)
+
+    def get_current_row_version(self, instance: models.Model) -> int:
+        """
+        Lock the row of ``instance`` and return its current row version.
+        """
+        return (
+            type(instance)
+            ._default_manager.select_for_update()
+            .values_list("row_version", flat=True)
+            .get(pk=instance.pk)
+        )